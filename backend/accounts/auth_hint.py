@@ -0,0 +1,49 @@
+import hashlib
+from django.conf import settings
+from django.core import signing
+
+COOKIE_NAME = "auth_hint"
+SALT = "accounts.auth_hint"
+
+
+def _session_digest(request):
+    session_key = request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    if not session_key:
+        return None
+    return hashlib.sha256(session_key.encode()).hexdigest()[:16]
+
+
+def read_auth_hint(request):
+    """
+    The username from a valid auth hint cookie, or None. The hint is signed,
+    younger than AUTH_HINT_SECONDS and bound to the current session cookie,
+    so logging out (which replaces the session) voids it at once. It only
+    answers check-auth; every other endpoint still authenticates the session.
+    """
+    digest = _session_digest(request)
+    if digest is None:
+        return None
+    hint = request.COOKIES.get(COOKIE_NAME)
+    if not hint:
+        return None
+    try:
+        user_id, username, session = signing.loads(
+            hint, salt=SALT, max_age=settings.AUTH_HINT_SECONDS
+        )
+    except (signing.BadSignature, ValueError):
+        return None
+    return username if session == digest else None
+
+
+def set_auth_hint(response, request, user):
+    digest = _session_digest(request)
+    if digest is None:
+        return
+    response.set_cookie(
+        COOKIE_NAME,
+        signing.dumps([user.pk, user.username, digest], salt=SALT),
+        max_age=settings.AUTH_HINT_SECONDS,
+        httponly=True,
+        samesite="Lax",
+        secure=settings.HTTPS_ENFORCED,
+    )
@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+
+def user_cache_key(user_id) -> str:
+    return f"auth:user:{user_id}"
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    ModelBackend whose per-request user lookup (the session's user id) is
+    served from the shared cache for USER_CACHE_SECONDS. Saving or deleting
+    the user drops the entry (see accounts.signals), so deactivation and
+    password changes made that way apply on the next request; queryset
+    ``update()`` calls send no signal and take up to USER_CACHE_SECONDS.
+    Without a shared cache (CACHE_URL unset) a drop would only reach one
+    worker, so users are then always read from the database.
+    """
+
+    def get_user(self, user_id):
+        if not settings.SHARED_CACHE:
+            return super().get_user(user_id)
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is None:
+                return None
+            cache.set(key, user, settings.USER_CACHE_SECONDS)
+        return user if self.user_can_authenticate(user) else None
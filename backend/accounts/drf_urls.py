@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from .views import (
     RegisterView,
@@ -5,7 +6,8 @@ from .views import (
     LogoutView,
     ProfileView,
     verify_email,
-    check_auth,
+    CheckAuthView,
+    check_auth_async,
 )
 
 urlpatterns = [
@@ -14,5 +16,9 @@ urlpatterns = [
     path("logout/", LogoutView.as_view(), name="logout"),
     path("profile/", ProfileView.as_view(), name="profile"),
     path("verify/<uidb64>/<token>/", verify_email, name="verify-email"),
-    path("check-auth/", check_auth, name="check-auth"),
+    path(
+        "check-auth/",
+        check_auth_async if settings.ASGI else CheckAuthView.as_view(),
+        name="check-auth",
+    ),
 ]
@@ -3,11 +3,13 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from django.contrib.auth import authenticate, login, logout, get_user_model
 from .serializers import RegisterSerializer, LoginSerializer, ProfileSerializer
+from .auth_hint import read_auth_hint, set_auth_hint
 from django.utils.http import urlsafe_base64_decode
 from django.utils.encoding import force_str
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from django.shortcuts import render
-from rest_framework.decorators import api_view, permission_classes
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
 from rest_framework.permissions import AllowAny
 
 
@@ -15,15 +17,46 @@ User = get_user_model()
 token_generator = PasswordResetTokenGenerator()
 
 
-@api_view(["GET"])
-@permission_classes([AllowAny])  # anyone can hit this endpoint
-def check_auth(request):
+class CheckAuthView(APIView):
     """
-    Return whether the current user is authenticated.
+    Return whether the current user is authenticated. A valid auth hint
+    cookie answers without touching the session or user tables; otherwise
+    the user is authenticated as usual and a fresh hint is set.
     """
-    if request.user.is_authenticated:
-        return Response({"is_authenticated": True, "username": request.user.username})
-    return Response({"is_authenticated": False})
+
+    permission_classes = [AllowAny]  # anyone can hit this endpoint
+
+    def perform_authentication(self, request):
+        # Lazy: request.user authenticates on first access, after the hint
+        pass
+
+    def get(self, request):
+        username = read_auth_hint(request)
+        if username is not None:
+            return Response({"is_authenticated": True, "username": username})
+        user = request.user
+        if user.is_authenticated:
+            response = Response({"is_authenticated": True, "username": user.username})
+            set_auth_hint(response, request, user)
+            return response
+        return Response({"is_authenticated": False})
+
+
+@require_GET
+async def check_auth_async(request):
+    """
+    ``CheckAuthView`` for ASGI: resolves the session user with the async ORM
+    instead of parking a thread on it. Session auth only.
+    """
+    username = read_auth_hint(request)
+    if username is not None:
+        return JsonResponse({"is_authenticated": True, "username": username})
+    user = await request.auser()
+    if user.is_authenticated:
+        response = JsonResponse({"is_authenticated": True, "username": user.username})
+        set_auth_hint(response, request, user)
+        return response
+    return JsonResponse({"is_authenticated": False})
 
 
 def verify_email(request, uidb64, token):
@@ -0,0 +1,14 @@
+from django.contrib import admin
+from .models import AlertSubscription, AlertEvent
+
+
+@admin.register(AlertSubscription)
+class AlertSubscriptionAdmin(admin.ModelAdmin):
+    list_display = ("pk", "user", "name", "channel", "active", "created_at")
+    list_filter = ("channel", "active")
+    list_select_related = ("user",)
+
+
+@admin.register(AlertEvent)
+class AlertEventAdmin(admin.ModelAdmin):
+    list_display = ("pk", "report", "sent", "failed", "created_at", "finished_at")
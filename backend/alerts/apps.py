@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class AlertsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "alerts"
+
+    def ready(self):
+        # Import signals so the receivers register
+        from . import signals
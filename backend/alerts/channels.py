@@ -0,0 +1,93 @@
+import json
+import logging
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.template.loader import render_to_string
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+Alert = Dict[str, Any]
+
+
+class AlertChannel:
+    """
+    Delivery backend for alerts. ``send`` gets one batch of recipients (email
+    addresses, URLs, ... as stored in AlertSubscription.target) for a single
+    alert and returns how many were delivered.
+    """
+
+    def send(self, recipients: List[str], alert: Alert) -> int:
+        raise NotImplementedError
+
+
+class EmailChannel(AlertChannel):
+    """One BCC message per chunk of recipients over a single SMTP connection."""
+
+    recipients_per_message = 100
+
+    def send(self, recipients, alert):
+        body = render_to_string(
+            "email/hazard_alert.html",
+            context={**alert, "domain": settings.DOMAIN},
+        )
+        subject = f"[NeerNetra] {alert['hazard']} reported near you"
+        step = self.recipients_per_message
+        messages = [
+            EmailMessage(
+                subject,
+                body,
+                settings.EMAIL_HOST_USER,
+                to=[],
+                bcc=recipients[i : i + step],
+            )
+            for i in range(0, len(recipients), step)
+        ]
+        with get_connection() as connection:
+            sent = connection.send_messages(messages) or 0
+        return min(sent * step, len(recipients))
+
+
+class WebhookChannel(AlertChannel):
+    """POST the alert as JSON to every URL, a few requests at a time."""
+
+    timeout = 5
+    workers = 16
+
+    def _post(self, url, body):
+        request = urllib.request.Request(
+            url,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return 200 <= response.status < 300
+        except Exception:
+            logger.warning("Alert webhook to %s failed", url, exc_info=True)
+            return False
+
+    def send(self, recipients, alert):
+        body = json.dumps(alert).encode()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return sum(pool.map(lambda url: self._post(url, body), recipients))
+
+
+class LocMemChannel(AlertChannel):
+    """Keeps alerts in ``outbox`` instead of sending them; for dev and tests."""
+
+    outbox: List[Alert] = []
+
+    def send(self, recipients, alert):
+        self.outbox.extend({**alert, "recipient": r} for r in recipients)
+        return len(recipients)
+
+
+@lru_cache(maxsize=None)
+def get_channel(name: str) -> AlertChannel:
+    return import_string(settings.ALERT_CHANNELS[name])()
@@ -0,0 +1,15 @@
+from django.urls import path
+from .views import AlertSubscriptionListView, AlertSubscriptionDetailView
+
+urlpatterns = [
+    path(
+        "alert-subscriptions/",
+        AlertSubscriptionListView.as_view(),
+        name="alert-subscriptions",
+    ),
+    path(
+        "alert-subscriptions/<int:pk>/",
+        AlertSubscriptionDetailView.as_view(),
+        name="alert-subscription-detail",
+    ),
+]
@@ -0,0 +1,135 @@
+from collections import defaultdict
+from datetime import timedelta
+import logging
+from django.conf import settings
+from django.db.models import F, Q
+from django.db.models.functions import Coalesce, NullIf
+from django.urls import reverse
+from django.utils import timezone
+from common.db import iterate
+from common.models import hazardSet
+from .channels import get_channel
+from .models import AlertEvent, AlertSubscription
+
+logger = logging.getLogger(__name__)
+
+
+def build_alert(event: AlertEvent) -> dict:
+    report = event.report
+    location = report.geovideo.location
+    return {
+        "report": report.pk,
+        "hazard": hazardSet(report.type or report.user_submit_type).label,
+        "severity": report.severity,
+        "created_at": report.created_at.isoformat(),
+        "lat": location.y,
+        "lon": location.x,
+        "map_path": reverse("map"),
+    }
+
+
+def matching_subscriptions(location, after: int = 0):
+    """
+    Active subscriptions whose area covers ``location``: a single join on the
+    partial GiST index, streamed in pk order so progress can be checkpointed.
+    """
+    return (
+        AlertSubscription.objects.filter(
+            active=True, area__intersects=location, pk__gt=after
+        )
+        .annotate(
+            recipient=Coalesce(NullIf(F("target"), ""), F("user__email")),
+        )
+        .order_by("pk")
+        .values_list("pk", "channel", "recipient")
+    )
+
+
+def claim(event: AlertEvent) -> bool:
+    """
+    Lease ``event`` for ALERT_LEASE_SECONDS unless it is finished or another
+    worker holds it, and reload its progress. Lets the background fan-out and
+    the send_alerts sweep race for an event without alerting twice.
+    """
+    now = timezone.now()
+    claimed = AlertEvent.objects.filter(
+        Q(leased_until__isnull=True) | Q(leased_until__lt=now),
+        pk=event.pk,
+        finished_at__isnull=True,
+    ).update(leased_until=now + timedelta(seconds=settings.ALERT_LEASE_SECONDS))
+    if claimed:
+        event.refresh_from_db(
+            fields=["cursor", "sent", "failed", "finished_at", "leased_until"]
+        )
+    return bool(claimed)
+
+
+def _checkpoint(event: AlertEvent, **fields) -> bool:
+    """Save progress and renew the lease; False when the lease was lost."""
+    now = timezone.now()
+    lease = now + timedelta(seconds=settings.ALERT_LEASE_SECONDS)
+    kept = AlertEvent.objects.filter(
+        pk=event.pk, leased_until=event.leased_until
+    ).update(
+        cursor=event.cursor,
+        sent=event.sent,
+        failed=event.failed,
+        leased_until=lease,
+        updated_at=now,
+        **fields,
+    )
+    event.leased_until = lease
+    return bool(kept)
+
+
+def _flush(event, alert, batch) -> bool:
+    # dict keys: a user with overlapping areas gets one alert per batch
+    by_channel = defaultdict(dict)
+    for _, channel, recipient in batch:
+        by_channel[channel][recipient] = None
+    for channel, recipients in by_channel.items():
+        recipients = list(recipients)
+        try:
+            delivered = get_channel(channel).send(recipients, alert)
+        except Exception:
+            logger.exception("Alert channel %s failed", channel)
+            delivered = 0
+        event.sent += delivered
+        event.failed += len(recipients) - delivered
+    event.cursor = batch[-1][0]
+    return _checkpoint(event)
+
+
+def fan_out(event: AlertEvent) -> AlertEvent:
+    """
+    Notify every matching subscription of ``event.report`` in batches of
+    ALERT_BATCH_SIZE, grouped by channel. Resumes after ``event.cursor``;
+    does nothing when the event is finished or claimed by another worker.
+    """
+    if event.finished_at is not None or not claim(event):
+        return event
+    alert = build_alert(event)
+    batch_size = settings.ALERT_BATCH_SIZE
+    subscriptions = matching_subscriptions(
+        event.report.geovideo.location, after=event.cursor
+    )
+    batch = []
+    for row in iterate(subscriptions, batch_size):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            if not _flush(event, alert, batch):
+                return _lost(event)
+            batch = []
+    if batch and not _flush(event, alert, batch):
+        return _lost(event)
+    finished_at = timezone.now()
+    if not _checkpoint(event, finished_at=finished_at):
+        return _lost(event)
+    event.finished_at = finished_at
+    return event
+
+
+def _lost(event: AlertEvent) -> AlertEvent:
+    # A batch outlasted ALERT_LEASE_SECONDS and another worker took over
+    logger.warning("Lost the lease on alert event %s, stopping", event.pk)
+    return event
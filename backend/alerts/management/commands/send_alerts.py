@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+from common.models import verificationStatusSet
+from hazards.models import UserReport
+from alerts.fanout import fan_out
+from alerts.models import AlertEvent
+
+
+class Command(BaseCommand):
+    help = (
+        "Resume interrupted alert fan-outs and alert for reports verified "
+        "without a save() (e.g. queryset updates)."
+    )
+
+    def handle(self, *args, **options):
+        missing = UserReport.objects.filter(
+            verification=verificationStatusSet.VERIFIED, alert_event__isnull=True
+        ).values_list("pk", flat=True)
+        sent = 0
+        for pk in missing:
+            event, created = AlertEvent.objects.get_or_create(report_id=pk)
+            if created:
+                sent += fan_out(event).sent
+        # Fan-outs holding a lease are still running elsewhere; fan_out claims
+        # the rest, so a worker starting one meanwhile is not doubled
+        now = timezone.now()
+        events = AlertEvent.objects.filter(
+            Q(leased_until__isnull=True) | Q(leased_until__lt=now),
+            finished_at__isnull=True,
+        ).select_related("report__geovideo")
+        for event in events:
+            sent += fan_out(event).sent
+        self.stdout.write(self.style.SUCCESS(f"Sent {sent} alert(s)"))
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:33
+
+from django.db import migrations, models
+
+# Reports verified before alerts existed were never announced and must not be
+# now: mark them as already fanned out, or the first send_alerts sweep would
+# alert every subscriber about every past verified report
+BACKFILL_SQL = """
+INSERT INTO alerts_alertevent (created_at, updated_at, cursor, sent, failed, finished_at, report_id)
+SELECT now(), now(), 0, 0, 0, now(), report.geovideo_id
+FROM hazards_userreport AS report
+WHERE report.verification = 4
+  AND NOT EXISTS (SELECT 1 FROM alerts_alertevent AS event WHERE event.report_id = report.geovideo_id)
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alerts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='alertevent',
+            name='leased_until',
+            field=models.DateTimeField(default=None, null=True),
+        ),
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,55 @@
+from django.db import models
+from django.contrib.gis.db import models as gis_models
+from django.contrib.postgres.indexes import GistIndex
+from django.contrib.auth import get_user_model
+from common.models import TimeStampedModel
+from hazards.models import UserReport
+
+
+class AlertSubscription(TimeStampedModel):
+    """An area a user wants to be warned about, see alerts.fanout."""
+
+    user = models.ForeignKey(
+        get_user_model(), on_delete=models.CASCADE, related_name="alert_subscriptions"
+    )
+    name = models.CharField(max_length=100, blank=True)
+    # Point + radius subscriptions are stored as their circle polygon
+    area = gis_models.PolygonField(geography=True)
+    channel = models.CharField(max_length=32, default="email")  # ALERT_CHANNELS key
+    # Email address or webhook URL; blank means the user's own email
+    target = models.CharField(max_length=500, blank=True)
+    active = models.BooleanField(default=True)
+
+    class Meta(TimeStampedModel.Meta):
+        indexes = [
+            GistIndex(
+                fields=["area"],
+                condition=models.Q(active=True),
+                name="alertsub_active_area_gix",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.name or self.pk}"
+
+
+class AlertEvent(TimeStampedModel):
+    """
+    One fan-out per verified report. The unique report guards against
+    alerting twice; ``cursor`` (last subscription pk handled) lets an
+    interrupted fan-out resume where it stopped, and ``leased_until`` keeps
+    two workers from running it at once.
+    """
+
+    report = models.OneToOneField(
+        UserReport, on_delete=models.CASCADE, related_name="alert_event"
+    )
+    cursor = models.BigIntegerField(default=0)
+    sent = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    finished_at = models.DateTimeField(null=True, default=None)
+    # Held by the worker fanning it out, see alerts.fanout.claim
+    leased_until = models.DateTimeField(null=True, default=None)
+
+    def __str__(self):
+        return f"report {self.report_id}: {self.sent} sent"
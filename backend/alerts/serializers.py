@@ -0,0 +1,88 @@
+import json
+from django.conf import settings
+from django.contrib.gis.geos import GEOSGeometry, GEOSException, Polygon
+from django.core.validators import EmailValidator, URLValidator
+from django.core.exceptions import ValidationError as DjangoValidationError
+from pyproj import Geod
+from rest_framework import serializers
+from hazards.serializers import PointField
+
+GEOD = Geod(ellps="WGS84")
+CIRCLE_VERTICES = 64
+
+
+def circle(center, radius_m: float) -> Polygon:
+    """Geodesic circle around a WGS84 point as a polygon, so it can be indexed."""
+    azimuths = [360.0 * i / CIRCLE_VERTICES for i in range(CIRCLE_VERTICES)]
+    lons, lats, _ = GEOD.fwd(
+        [center.x] * CIRCLE_VERTICES,
+        [center.y] * CIRCLE_VERTICES,
+        azimuths,
+        [radius_m] * CIRCLE_VERTICES,
+    )
+    ring = list(zip(lons, lats))
+    return Polygon(ring + ring[:1], srid=4326)
+
+
+class PolygonField(serializers.Field):
+    """GeoJSON or WKT polygon in WGS84."""
+
+    default_error_messages = {"invalid": "A GeoJSON or WKT polygon is required."}
+
+    def to_internal_value(self, data):
+        if isinstance(data, dict):
+            data = json.dumps(data)
+        try:
+            polygon = GEOSGeometry(data, srid=4326) if isinstance(data, str) else None
+        except (ValueError, GEOSException):
+            polygon = None
+        if polygon is None or polygon.geom_type != "Polygon" or not polygon.valid:
+            self.fail("invalid")
+        return polygon
+
+    def to_representation(self, value):
+        return {"type": "Polygon", "coordinates": value.coords}
+
+
+class AlertSubscriptionSerializer(serializers.Serializer):
+    """An alert area as ``area``, or as ``center`` + ``radius_m``."""
+
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(max_length=100, required=False, default="")
+    channel = serializers.ChoiceField(choices=list(settings.ALERT_CHANNELS))
+    target = serializers.CharField(
+        max_length=500, required=False, allow_blank=True, default=""
+    )
+    active = serializers.BooleanField(required=False, default=True)
+    area = PolygonField(required=False)
+    center = PointField(required=False, write_only=True)
+    radius_m = serializers.FloatField(
+        min_value=100, max_value=200_000, required=False, write_only=True
+    )
+
+    def validate(self, attrs):
+        center, radius = attrs.pop("center", None), attrs.pop("radius_m", None)
+        if "area" in attrs:
+            if center is not None or radius is not None:
+                raise serializers.ValidationError(
+                    "Give either area or center + radius_m, not both."
+                )
+        elif center is not None and radius is not None:
+            attrs["area"] = circle(center, radius)
+        else:
+            raise serializers.ValidationError("area or center + radius_m is required.")
+
+        target = attrs["target"]
+        try:
+            if attrs["channel"] == "webhook":
+                # Requests go out from our servers, so only staff integrations
+                if not self.context["request"].user.is_staff:
+                    raise serializers.ValidationError(
+                        {"channel": "Webhooks are limited to staff accounts."}
+                    )
+                URLValidator(schemes=["https"])(target)
+            elif attrs["channel"] == "email" and target:
+                EmailValidator()(target)
+        except DjangoValidationError as error:
+            raise serializers.ValidationError({"target": error.messages})
+        return attrs
@@ -0,0 +1,19 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.db import transaction
+from common.background import run_in_background
+from common.models import verificationStatusSet
+from hazards.models import UserReport
+from .fanout import fan_out
+from .models import AlertEvent
+
+
+@receiver(post_save, sender=UserReport)
+def on_userreport_verified(sender, instance: UserReport, **kwargs):
+    if instance.verification != verificationStatusSet.VERIFIED:
+        return
+    event, created = AlertEvent.objects.get_or_create(report=instance)
+    if created:
+        # Off the request: a fan-out can take minutes. Dropped or interrupted
+        # ones are resumed by send_alerts (see entrypoint.sh)
+        transaction.on_commit(lambda: run_in_background(fan_out, event), robust=True)
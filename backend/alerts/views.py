@@ -0,0 +1,67 @@
+from rest_framework import views, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from .models import AlertSubscription
+from .serializers import AlertSubscriptionSerializer
+
+
+class AlertSubscriptionListView(views.APIView):
+    """The caller's alert areas."""
+
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="List your alert subscriptions",
+        responses={200: AlertSubscriptionSerializer(many=True)},
+    )
+    def get(self, request, *args, **kwargs):
+        subscriptions = AlertSubscription.objects.filter(user=request.user).order_by(
+            "pk"
+        )
+        return Response(AlertSubscriptionSerializer(subscriptions, many=True).data)
+
+    @swagger_auto_schema(
+        operation_description="Be alerted when a hazard inside an area is "
+        "verified. Give a GeoJSON/WKT polygon as area, or center (WKT point) "
+        "and radius_m. Channel target defaults to your email.",
+        request_body=AlertSubscriptionSerializer,
+        responses={
+            201: AlertSubscriptionSerializer,
+            400: openapi.Response("Invalid subscription"),
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        serializer = AlertSubscriptionSerializer(
+            data=request.data, context={"request": request}
+        )
+        if not serializer.is_valid():
+            return Response(
+                {"error": "Invalid subscription", "errors": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        subscription = AlertSubscription.objects.create(
+            user=request.user, **serializer.validated_data
+        )
+        return Response(
+            AlertSubscriptionSerializer(subscription).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class AlertSubscriptionDetailView(views.APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Delete one of your alert subscriptions",
+        responses={
+            204: openapi.Response("Deleted"),
+            404: openapi.Response("Not found"),
+        },
+    )
+    def delete(self, request, pk, *args, **kwargs):
+        deleted, _ = AlertSubscription.objects.filter(pk=pk, user=request.user).delete()
+        if not deleted:
+            return Response({"error": "Not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(status=status.HTTP_204_NO_CONTENT)
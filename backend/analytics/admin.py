@@ -0,0 +1,18 @@
+from django.contrib import admin
+from .models import ReportRollup
+
+
+@admin.register(ReportRollup)
+class ReportRollupAdmin(admin.ModelAdmin):
+    list_display = (
+        "bucket",
+        "state_code",
+        "district_code",
+        "hazard",
+        "verification",
+        "report_count",
+        "severity_max",
+    )
+    list_filter = ("hazard", "verification")
+    ordering = ("-bucket",)
+    show_full_result_count = False
@@ -0,0 +1,10 @@
+from django.urls import path
+from .views import ReportSeriesView
+
+urlpatterns = [
+    path(
+        "analytics/reports/",
+        ReportSeriesView.as_view(),
+        name="analytics-reports",
+    ),
+]
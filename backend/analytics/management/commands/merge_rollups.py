@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from analytics.rollups import merge_deltas
+
+
+class Command(BaseCommand):
+    help = (
+        "Fold the rollup deltas appended by the report trigger into the "
+        "rollup cells. Run periodically (the entrypoint sweep does); the "
+        "analytics endpoints add unmerged deltas in, so this only keeps the "
+        "delta table small."
+    )
+
+    def handle(self, *args, **options):
+        cells = merge_deltas()
+        self.stdout.write(
+            self.style.SUCCESS(f"Merged deltas into {cells} rollup cells")
+        )
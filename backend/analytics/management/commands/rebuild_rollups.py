@@ -0,0 +1,26 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from analytics.rollups import rebuild
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the analytics rollup cells from the report table. Needed "
+        "after region boundaries change (tag_regions --all) or to repair drift; "
+        "day to day a database trigger appends deltas and merge_rollups folds "
+        "them in. Report writes are not blocked while it runs."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=None,
+            help="Only rebuild the last N days (default: everything).",
+        )
+
+    def handle(self, *args, days, **options):
+        since = timezone.now() - timedelta(days=days) if days else None
+        cells = rebuild(since)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {cells} rollup cells"))
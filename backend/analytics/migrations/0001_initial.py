@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.DateTimeField()),
+                ('state_code', models.CharField(blank=True, max_length=16)),
+                ('district_code', models.CharField(blank=True, max_length=16)),
+                ('hazard', models.IntegerField(choices=[(0, 'Unknown'), (1, 'Tide'), (2, 'Coastal Damage'), (3, 'Flooding'), (4, 'Waves'), (5, 'Swell'), (6, 'Surge'), (7, 'Storm'), (8, 'Tsunami'), (9, 'Other')])),
+                ('verification', models.SmallIntegerField(choices=[(-1, 'Dismissed'), (0, 'Unverified'), (1, 'Verified')])),
+                ('report_count', models.IntegerField(default=0)),
+                ('severity_sum', models.BigIntegerField(default=0)),
+                ('severity_count', models.IntegerField(default=0)),
+                ('severity_max', models.PositiveSmallIntegerField(null=True)),
+                ('confidence_sum', models.BigIntegerField(default=0)),
+                ('confidence_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['state_code', 'district_code', 'bucket'], name='rollup_region_bucket_idx')],
+                'constraints': [models.UniqueConstraint(fields=('bucket', 'state_code', 'district_code', 'hazard', 'verification'), name='rollup_cell_uniq')],
+            },
+        ),
+    ]
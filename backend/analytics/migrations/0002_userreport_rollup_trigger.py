@@ -0,0 +1,122 @@
+from django.db import migrations
+
+# Rolls every insert, delete and classification change on hazards_userreport
+# into analytics_reportrollup as a -1/+1 delta on the affected cells. A
+# trigger rather than post_save so bulk_create (batch ingest) and queryset
+# update() (duplicate propagation, admin actions) are counted as well.
+CREATE_SQL = """
+CREATE FUNCTION analytics_rollup_add(r hazards_userreport, sign integer)
+RETURNS void AS $$
+DECLARE
+    state text;
+    district text;
+BEGIN
+    SELECT state_code, district_code INTO state, district
+    FROM common_geovideo WHERE id = r.geovideo_id;
+    INSERT INTO analytics_reportrollup AS cell (
+        bucket, state_code, district_code, hazard, verification,
+        report_count, severity_sum, severity_count, severity_max,
+        confidence_sum, confidence_count
+    ) VALUES (
+        date_trunc('hour', r.created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+        coalesce(state, ''),
+        coalesce(district, ''),
+        coalesce(r.type, r.user_submit_type),
+        CASE WHEN r.verification < 0 THEN -1
+             WHEN r.verification = 4 THEN 1
+             ELSE 0 END,
+        sign,
+        sign * coalesce(r.severity, 0),
+        sign * (r.severity IS NOT NULL)::integer,
+        CASE WHEN sign > 0 THEN r.severity END,
+        sign * coalesce(r.confidence, 0),
+        sign * (r.confidence IS NOT NULL)::integer
+    )
+    ON CONFLICT (bucket, state_code, district_code, hazard, verification)
+    DO UPDATE SET
+        report_count = cell.report_count + EXCLUDED.report_count,
+        severity_sum = cell.severity_sum + EXCLUDED.severity_sum,
+        severity_count = cell.severity_count + EXCLUDED.severity_count,
+        severity_max = greatest(cell.severity_max, EXCLUDED.severity_max),
+        confidence_sum = cell.confidence_sum + EXCLUDED.confidence_sum,
+        confidence_count = cell.confidence_count + EXCLUDED.confidence_count;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION analytics_userreport_rollup() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM analytics_rollup_add(OLD, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM analytics_rollup_add(NEW, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER analytics_userreport_rollup_insdel
+AFTER INSERT OR DELETE ON hazards_userreport
+FOR EACH ROW EXECUTE FUNCTION analytics_userreport_rollup();
+
+-- Django's save() writes every column, so compare values rather than
+-- relying on UPDATE OF: claims, priority and incident updates are skipped
+CREATE TRIGGER analytics_userreport_rollup_upd
+AFTER UPDATE ON hazards_userreport
+FOR EACH ROW
+WHEN ((OLD.type, OLD.user_submit_type, OLD.severity, OLD.confidence,
+       OLD.verification, OLD.created_at, OLD.geovideo_id)
+      IS DISTINCT FROM
+      (NEW.type, NEW.user_submit_type, NEW.severity, NEW.confidence,
+       NEW.verification, NEW.created_at, NEW.geovideo_id))
+EXECUTE FUNCTION analytics_userreport_rollup();
+"""
+
+# Existing reports, counted once before the trigger takes over
+FILL_SQL = """
+INSERT INTO analytics_reportrollup (
+    bucket, state_code, district_code, hazard, verification,
+    report_count, severity_sum, severity_count, severity_max,
+    confidence_sum, confidence_count
+)
+SELECT
+    date_trunc('hour', r.created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+    coalesce(g.state_code, ''),
+    coalesce(g.district_code, ''),
+    coalesce(r.type, r.user_submit_type),
+    CASE WHEN r.verification < 0 THEN -1
+         WHEN r.verification = 4 THEN 1
+         ELSE 0 END,
+    count(*),
+    coalesce(sum(r.severity), 0),
+    count(r.severity),
+    max(r.severity),
+    coalesce(sum(r.confidence), 0),
+    count(r.confidence)
+FROM hazards_userreport r
+JOIN common_geovideo g ON g.id = r.geovideo_id
+GROUP BY 1, 2, 3, 4, 5
+"""
+
+DROP_SQL = """
+DROP TRIGGER IF EXISTS analytics_userreport_rollup_upd ON hazards_userreport;
+DROP TRIGGER IF EXISTS analytics_userreport_rollup_insdel ON hazards_userreport;
+DROP FUNCTION IF EXISTS analytics_userreport_rollup();
+DROP FUNCTION IF EXISTS analytics_rollup_add(hazards_userreport, integer);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0001_initial"),
+        ("hazards", "0013_userreport_workflow_indexes"),
+        ("common", "0011_geovideo_coast_distance"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "LOCK TABLE hazards_userreport IN SHARE MODE;" + FILL_SQL + CREATE_SQL,
+            DROP_SQL + "DELETE FROM analytics_reportrollup;",
+        ),
+    ]
@@ -0,0 +1,129 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:13
+
+from django.db import migrations, models
+
+# The trigger now appends a delta row instead of upserting the rollup cell:
+# concurrent reports of one busy cell no longer queue on its row lock inside
+# the ingest transaction. analytics.rollups.merge_deltas folds them in.
+DELTA_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION analytics_rollup_add(r hazards_userreport, sign integer)
+RETURNS void AS $$
+DECLARE
+    state text;
+    district text;
+BEGIN
+    SELECT state_code, district_code INTO state, district
+    FROM common_geovideo WHERE id = r.geovideo_id;
+    INSERT INTO analytics_reportrollupdelta (
+        bucket, state_code, district_code, hazard, verification,
+        report_count, severity_sum, severity_count, severity_max,
+        confidence_sum, confidence_count
+    ) VALUES (
+        date_trunc('hour', r.created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+        coalesce(state, ''),
+        coalesce(district, ''),
+        coalesce(r.type, r.user_submit_type),
+        CASE WHEN r.verification < 0 THEN -1
+             WHEN r.verification = 4 THEN 1
+             ELSE 0 END,
+        sign,
+        sign * coalesce(r.severity, 0),
+        sign * (r.severity IS NOT NULL)::integer,
+        CASE WHEN sign > 0 THEN r.severity END,
+        sign * coalesce(r.confidence, 0),
+        sign * (r.confidence IS NOT NULL)::integer
+    );
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# Back to 0002's upsert, after folding in what is pending
+UPSERT_FUNCTION_SQL = """
+INSERT INTO analytics_reportrollup AS cell (
+    bucket, state_code, district_code, hazard, verification,
+    report_count, severity_sum, severity_count, severity_max,
+    confidence_sum, confidence_count
+)
+SELECT bucket, state_code, district_code, hazard, verification,
+       sum(report_count), sum(severity_sum), sum(severity_count),
+       max(severity_max), sum(confidence_sum), sum(confidence_count)
+FROM analytics_reportrollupdelta
+GROUP BY 1, 2, 3, 4, 5
+ON CONFLICT (bucket, state_code, district_code, hazard, verification)
+DO UPDATE SET
+    report_count = cell.report_count + EXCLUDED.report_count,
+    severity_sum = cell.severity_sum + EXCLUDED.severity_sum,
+    severity_count = cell.severity_count + EXCLUDED.severity_count,
+    severity_max = greatest(cell.severity_max, EXCLUDED.severity_max),
+    confidence_sum = cell.confidence_sum + EXCLUDED.confidence_sum,
+    confidence_count = cell.confidence_count + EXCLUDED.confidence_count;
+
+CREATE OR REPLACE FUNCTION analytics_rollup_add(r hazards_userreport, sign integer)
+RETURNS void AS $$
+DECLARE
+    state text;
+    district text;
+BEGIN
+    SELECT state_code, district_code INTO state, district
+    FROM common_geovideo WHERE id = r.geovideo_id;
+    INSERT INTO analytics_reportrollup AS cell (
+        bucket, state_code, district_code, hazard, verification,
+        report_count, severity_sum, severity_count, severity_max,
+        confidence_sum, confidence_count
+    ) VALUES (
+        date_trunc('hour', r.created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+        coalesce(state, ''),
+        coalesce(district, ''),
+        coalesce(r.type, r.user_submit_type),
+        CASE WHEN r.verification < 0 THEN -1
+             WHEN r.verification = 4 THEN 1
+             ELSE 0 END,
+        sign,
+        sign * coalesce(r.severity, 0),
+        sign * (r.severity IS NOT NULL)::integer,
+        CASE WHEN sign > 0 THEN r.severity END,
+        sign * coalesce(r.confidence, 0),
+        sign * (r.confidence IS NOT NULL)::integer
+    )
+    ON CONFLICT (bucket, state_code, district_code, hazard, verification)
+    DO UPDATE SET
+        report_count = cell.report_count + EXCLUDED.report_count,
+        severity_sum = cell.severity_sum + EXCLUDED.severity_sum,
+        severity_count = cell.severity_count + EXCLUDED.severity_count,
+        severity_max = greatest(cell.severity_max, EXCLUDED.severity_max),
+        confidence_sum = cell.confidence_sum + EXCLUDED.confidence_sum,
+        confidence_count = cell.confidence_count + EXCLUDED.confidence_count;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_userreport_rollup_trigger'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportRollupDelta',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.DateTimeField()),
+                ('state_code', models.CharField(blank=True, max_length=16)),
+                ('district_code', models.CharField(blank=True, max_length=16)),
+                ('hazard', models.IntegerField(choices=[(0, 'Unknown'), (1, 'Tide'), (2, 'Coastal Damage'), (3, 'Flooding'), (4, 'Waves'), (5, 'Swell'), (6, 'Surge'), (7, 'Storm'), (8, 'Tsunami'), (9, 'Other')])),
+                ('verification', models.SmallIntegerField(choices=[(-1, 'Dismissed'), (0, 'Unverified'), (1, 'Verified')])),
+                ('report_count', models.IntegerField(default=0)),
+                ('severity_sum', models.BigIntegerField(default=0)),
+                ('severity_count', models.IntegerField(default=0)),
+                ('severity_max', models.PositiveSmallIntegerField(null=True)),
+                ('confidence_sum', models.BigIntegerField(default=0)),
+                ('confidence_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.RunSQL(DELTA_FUNCTION_SQL, UPSERT_FUNCTION_SQL),
+    ]
@@ -0,0 +1,68 @@
+from django.db import models
+from common.models import hazardSet
+
+
+class verificationBucketSet(models.IntegerChoices):
+    DISMISSED = -1  # DISCARDED, NOT_SEVERE
+    UNVERIFIED = 0
+    VERIFIED = 1
+
+
+class RollupCell(models.Model):
+    """Report counts and severity/confidence sums of one cell."""
+
+    bucket = models.DateTimeField()  # start of the UTC hour of created_at
+    state_code = models.CharField(max_length=16, blank=True)  # "" = unknown
+    district_code = models.CharField(max_length=16, blank=True)
+    hazard = models.IntegerField(choices=hazardSet)  # type, else user_submit_type
+    verification = models.SmallIntegerField(choices=verificationBucketSet)
+    report_count = models.IntegerField(default=0)
+    severity_sum = models.BigIntegerField(default=0)
+    severity_count = models.IntegerField(default=0)
+    # Highest severity ever counted here; not lowered when a report leaves
+    severity_max = models.PositiveSmallIntegerField(null=True)
+    confidence_sum = models.BigIntegerField(default=0)
+    confidence_count = models.IntegerField(default=0)
+
+    class Meta:
+        abstract = True
+
+
+class ReportRollup(RollupCell):
+    """
+    Report counts and severity/confidence sums per hour x region x hazard x
+    verification bucket. Fed from ReportRollupDelta by merge_deltas().
+    """
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    "bucket",
+                    "state_code",
+                    "district_code",
+                    "hazard",
+                    "verification",
+                ],
+                name="rollup_cell_uniq",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["state_code", "district_code", "bucket"],
+                name="rollup_region_bucket_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.bucket:%Y-%m-%d %H}h {self.get_hazard_display()}"
+
+
+class ReportRollupDelta(RollupCell):
+    """
+    One -1/+1 change of a rollup cell, appended by a trigger on
+    hazards_userreport (see migrations 0002 and 0003) so bulk_create and
+    queryset updates are counted too. Append-only, so concurrent reports of
+    the same cell never wait on each other; merge_deltas() folds them into
+    ReportRollup.
+    """
@@ -0,0 +1,181 @@
+import time
+import zlib
+from datetime import datetime, timezone as dt_timezone
+from itertools import chain
+from typing import Optional
+from django.db import connection, transaction
+from django.db.models import Max, Sum
+from django.db.models.functions import Trunc
+from .models import ReportRollup, ReportRollupDelta
+
+GRANULARITIES = ("hour", "day", "week", "month")
+GROUP_FIELDS = ("hazard", "verification", "state_code", "district_code")
+SUM_FIELDS = (
+    "report_count",
+    "severity_sum",
+    "severity_count",
+    "confidence_sum",
+    "confidence_count",
+)
+# Advisory lock key: one merge or rebuild at a time
+ROLLUP_LOCK = zlib.crc32(b"analytics.rollups")
+# Seconds rebuild() waits for a running merge
+REBUILD_ATTEMPTS = 30
+
+# Delta rows are taken with DELETE ... RETURNING, so a row is merged once
+# even if two merges overlap
+MERGE_SQL = """
+WITH moved AS (
+    DELETE FROM analytics_reportrollupdelta
+    RETURNING bucket, state_code, district_code, hazard, verification,
+              report_count, severity_sum, severity_count, severity_max,
+              confidence_sum, confidence_count
+)
+INSERT INTO analytics_reportrollup AS cell (
+    bucket, state_code, district_code, hazard, verification,
+    report_count, severity_sum, severity_count, severity_max,
+    confidence_sum, confidence_count
+)
+SELECT bucket, state_code, district_code, hazard, verification,
+       sum(report_count), sum(severity_sum), sum(severity_count),
+       max(severity_max), sum(confidence_sum), sum(confidence_count)
+FROM moved
+GROUP BY 1, 2, 3, 4, 5
+ON CONFLICT (bucket, state_code, district_code, hazard, verification)
+DO UPDATE SET
+    report_count = cell.report_count + EXCLUDED.report_count,
+    severity_sum = cell.severity_sum + EXCLUDED.severity_sum,
+    severity_count = cell.severity_count + EXCLUDED.severity_count,
+    severity_max = greatest(cell.severity_max, EXCLUDED.severity_max),
+    confidence_sum = cell.confidence_sum + EXCLUDED.confidence_sum,
+    confidence_count = cell.confidence_count + EXCLUDED.confidence_count
+"""
+
+# Same cell expressions as the trigger in migrations 0002 and 0003
+REBUILD_SQL = """
+INSERT INTO analytics_reportrollup (
+    bucket, state_code, district_code, hazard, verification,
+    report_count, severity_sum, severity_count, severity_max,
+    confidence_sum, confidence_count
+)
+SELECT
+    date_trunc('hour', r.created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+    coalesce(g.state_code, ''),
+    coalesce(g.district_code, ''),
+    coalesce(r.type, r.user_submit_type),
+    CASE WHEN r.verification < 0 THEN -1
+         WHEN r.verification = 4 THEN 1
+         ELSE 0 END,
+    count(*),
+    coalesce(sum(r.severity), 0),
+    count(r.severity),
+    max(r.severity),
+    coalesce(sum(r.confidence), 0),
+    count(r.confidence)
+FROM hazards_userreport r
+JOIN common_geovideo g ON g.id = r.geovideo_id
+WHERE r.created_at >= %s
+GROUP BY 1, 2, 3, 4, 5
+"""
+
+
+def hour_floor(value: datetime) -> datetime:
+    value = value.astimezone(dt_timezone.utc)
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+@transaction.atomic
+def merge_deltas() -> int:
+    """
+    Fold the pending trigger deltas into ReportRollup; returns the number of
+    cells written, 0 when a merge or rebuild is already running.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_try_advisory_xact_lock(%s)", [ROLLUP_LOCK])
+        if not cursor.fetchone()[0]:
+            return 0
+        cursor.execute(MERGE_SQL)
+        return cursor.rowcount
+
+
+def rebuild(since: Optional[datetime] = None) -> int:
+    """
+    Recompute the rollup cells from ``since`` (everything when None) from
+    the report table without blocking report writes. One REPEATABLE READ
+    snapshot drops the deltas it can see and recounts the reports it can
+    see; deltas of reports committed later stay for the next merge. Needs
+    its own transaction, so it cannot run inside ``atomic``.
+    """
+    if connection.in_atomic_block:
+        raise RuntimeError("rebuild() must not run inside a transaction")
+    since = hour_floor(since) if since else datetime.min.replace(tzinfo=dt_timezone.utc)
+    for _ in range(REBUILD_ATTEMPTS):
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+            # Transaction-scoped, so it is released with the transaction even
+            # behind a transaction-mode PgBouncer (DB_PGBOUNCER). The snapshot
+            # is taken by this statement: a merge that commits in between
+            # makes the deletes below fail with a serialization error
+            # instead of being counted twice.
+            cursor.execute("SELECT pg_try_advisory_xact_lock(%s)", [ROLLUP_LOCK])
+            if cursor.fetchone()[0]:
+                ReportRollupDelta.objects.filter(bucket__gte=since).delete()
+                ReportRollup.objects.filter(bucket__gte=since).delete()
+                cursor.execute(REBUILD_SQL, [since])
+                return cursor.rowcount
+        time.sleep(1)  # a merge is running; they take moments
+    raise RuntimeError("The rollups stayed locked by merge_rollups, try again")
+
+
+def _totals(model, since, until, granularity, group_by, filters):
+    cells = model.objects.filter(bucket__gte=hour_floor(since), **filters)
+    if until is not None:
+        cells = cells.filter(bucket__lt=until)
+    return (
+        cells.annotate(period=Trunc("bucket", granularity, tzinfo=dt_timezone.utc))
+        .values("period", *group_by)
+        .annotate(
+            **{field: Sum(field) for field in SUM_FIELDS},
+            severity_max=Max("severity_max"),
+        )
+    )
+
+
+def series(since, until=None, granularity="day", group_by=(), **filters):
+    """
+    Aggregated rollup rows per ``granularity`` bucket and ``group_by`` fields,
+    with report count, mean/max severity and mean confidence. ``filters`` are
+    applied as-is (state_code, district_code, hazard, verification). Deltas
+    not merged yet are added in, so the figures are always current.
+    """
+    totals = {}
+    for row in chain(
+        *(
+            _totals(model, since, until, granularity, group_by, filters)
+            for model in (ReportRollup, ReportRollupDelta)
+        )
+    ):
+        key = (row["period"], *(row[field] for field in group_by))
+        total = totals.get(key)
+        if total is None:
+            totals[key] = row
+            continue
+        for field in SUM_FIELDS:
+            total[field] += row[field]
+        if row["severity_max"] is not None:
+            total["severity_max"] = max(total["severity_max"] or 0, row["severity_max"])
+    for key in sorted(totals):
+        row = totals[key]
+        count = row.pop("report_count")
+        if count <= 0:
+            continue
+        severity_count = row.pop("severity_count")
+        confidence_count = row.pop("confidence_count")
+        severity_sum = row.pop("severity_sum")
+        confidence_sum = row.pop("confidence_sum")
+        row["count"] = count
+        row["severity_avg"] = severity_sum / severity_count if severity_count else None
+        row["confidence_avg"] = (
+            confidence_sum / confidence_count if confidence_count else None
+        )
+        yield row
@@ -0,0 +1,31 @@
+from rest_framework import serializers
+from common.models import hazardSet
+from .models import verificationBucketSet
+from .rollups import GRANULARITIES, GROUP_FIELDS
+
+
+class RollupQuerySerializer(serializers.Serializer):
+    since = serializers.DateTimeField()
+    until = serializers.DateTimeField(required=False)
+    granularity = serializers.ChoiceField(choices=GRANULARITIES, default="day")
+    group_by = serializers.CharField(required=False, default="")
+    state_code = serializers.CharField(max_length=16, required=False)
+    district_code = serializers.CharField(max_length=16, required=False)
+    hazard = serializers.ChoiceField(choices=hazardSet.choices, required=False)
+    verification = serializers.ChoiceField(
+        choices=verificationBucketSet.choices, required=False
+    )
+
+    def validate_group_by(self, value):
+        fields = [field for field in value.split(",") if field]
+        unknown = set(fields) - set(GROUP_FIELDS)
+        if unknown:
+            raise serializers.ValidationError(
+                f"Unknown fields {sorted(unknown)}, use {', '.join(GROUP_FIELDS)}"
+            )
+        return fields
+
+    def validate(self, data):
+        if "until" in data and data["until"] <= data["since"]:
+            raise serializers.ValidationError("until must be after since")
+        return data
@@ -0,0 +1,43 @@
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status, views
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from common.routers import read_replica
+from .rollups import series
+from .serializers import RollupQuerySerializer
+
+
+class ReportSeriesView(views.APIView):
+    """Report counts and severity over time, read from the hourly rollups."""
+
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_description="Report count, mean/max severity and mean "
+        "confidence per time bucket (hour, day, week, month), optionally split "
+        "by hazard, verification, state_code and district_code (comma "
+        "separated group_by) and filtered on the same fields.",
+        query_serializer=RollupQuerySerializer,
+        responses={
+            200: openapi.Response("Time series rows"),
+            400: openapi.Response("Invalid filters"),
+        },
+    )
+    @read_replica()
+    def get(self, request, *args, **kwargs):
+        serializer = RollupQuerySerializer(data=request.query_params.dict())
+        if not serializer.is_valid():
+            return Response(
+                {"error": "Invalid query", "errors": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        params = dict(serializer.validated_data)
+        rows = series(
+            params.pop("since"),
+            params.pop("until", None),
+            params.pop("granularity"),
+            params.pop("group_by"),
+            **params,
+        )
+        return Response({"results": list(rows)})
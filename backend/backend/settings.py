@@ -36,6 +36,37 @@ SECRET_KEY = env("SECRET_KEY")
 DOMAIN = env("DOMAIN")
 HTTPS_ENFORCED = env.bool("HTTPS_ENFORCED", default=False)
 OPENROUTER_API_KEY = env("OPENROUTER_API_KEY")
+# Reports scoring below this are classified later by process_pending_reports
+REPORT_PLAUSIBILITY_THRESHOLD = env.int("REPORT_PLAUSIBILITY_THRESHOLD", default=30)
+# Reports of a compatible hazard this close in space and time join one incident
+INCIDENT_RADIUS_M = env.int("INCIDENT_RADIUS_M", default=2000)
+INCIDENT_WINDOW_HOURS = env.int("INCIDENT_WINDOW_HOURS", default=6)
+# Near-identical texts (pg_trgm similarity) this close reuse one classification
+DUPLICATE_TEXT_SIMILARITY = env.float("DUPLICATE_TEXT_SIMILARITY", default=0.6)
+DUPLICATE_RADIUS_M = env.int("DUPLICATE_RADIUS_M", default=25000)
+DUPLICATE_WINDOW_HOURS = env.int("DUPLICATE_WINDOW_HOURS", default=24)
+# How long a stored Idempotency-Key response is replayed; older ones are
+# ignored and deleted by expire_idempotency_keys
+IDEMPOTENCY_KEY_HOURS = env.int("IDEMPOTENCY_KEY_HOURS", default=24)
+# Default age limit of the map feed; 0 shows every report ever made. A limit
+# (e.g. 90) keeps the feed on the newest end of userreport_created_idx
+MAP_FEED_DAYS = env.int("MAP_FEED_DAYS", default=0)
+# Recordings older than this move to cold storage (archive_recordings command)
+ARCHIVE_AFTER_DAYS = env.int("ARCHIVE_AFTER_DAYS", default=180)
+ARCHIVE_VIDEO_PREFIX = env("ARCHIVE_VIDEO_PREFIX", default="cold/")
+# Delivery backends for alert subscriptions, by AlertSubscription.channel
+ALERT_CHANNELS = {
+    "email": "alerts.channels.EmailChannel",
+    "webhook": "alerts.channels.WebhookChannel",
+}
+ALERT_BATCH_SIZE = env.int("ALERT_BATCH_SIZE", default=1000)
+# A fan-out holds its event this long, renewed after every batch; must exceed
+# one batch (1000 webhooks, 16 at a time with a 5 s timeout: ~5 min at worst)
+ALERT_LEASE_SECONDS = env.int("ALERT_LEASE_SECONDS", default=900)
+# state/district/pincode/coastal_zone .geojson files, see common.regions
+REGION_BOUNDARIES_DIR = env(
+    "REGION_BOUNDARIES_DIR", default=str(BASE_DIR / "data" / "regions")
+)
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
@@ -63,6 +94,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "drf_yasg",
     "accounts",
@@ -70,15 +102,25 @@ INSTALLED_APPS = [
     "common",
     "leaflet",
     "maps",
+    "alerts",
+    "analytics",
 ]
 
 AUTH_USER_MODEL = "accounts.User"
+# Session users are loaded through the shared cache when there is one
+# (accounts.backends)
+AUTHENTICATION_BACKENDS = ["accounts.backends.CachedModelBackend"]
+USER_CACHE_SECONDS = env.int("USER_CACHE_SECONDS", default=60)
+# Lifetime of the signed cookie that lets check-auth skip the database
+AUTH_HINT_SECONDS = env.int("AUTH_HINT_SECONDS", default=300)
 
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
+    "common.routers.ReplicaStickinessMiddleware",
+    "common.db.ConnectionTimingMiddleware",
     "django.middleware.common.CommonMiddleware",
     # "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -90,6 +132,8 @@ if DEV:
     INSTALLED_APPS += ["django_extensions", "corsheaders"]
     MIDDLEWARE = ["corsheaders.middleware.CorsMiddleware"] + MIDDLEWARE
     CORS_ALLOW_ALL_ORIGINS = True
+    # Keep alerts in memory instead of mailing real people from a dev box
+    ALERT_CHANNELS = {name: "alerts.channels.LocMemChannel" for name in ALERT_CHANNELS}
 
 ROOT_URLCONF = "backend.urls"
 
@@ -109,6 +153,16 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "backend.wsgi.application"
+# "asgi" when served by uvicorn workers (see entrypoint.sh): routes the
+# async variants of the map feed and auth check
+SERVER_MODE = env("SERVER_MODE", default="wsgi")
+ASGI = SERVER_MODE == "asgi"
+# Threads per process for work handed off after the response (LLM
+# classification of new reports); 0 runs it inline in the request
+BACKGROUND_WORKERS = env.int("BACKGROUND_WORKERS", default=2)
+# Tasks a process may hold queued or running; beyond that new ones are
+# dropped and left to the periodic sweeps in entrypoint.sh
+BACKGROUND_QUEUE_SIZE = env.int("BACKGROUND_QUEUE_SIZE", default=500)
 
 
 # Database
@@ -123,6 +177,53 @@ WSGI_APPLICATION = "backend.wsgi.application"
 DATABASES = {
     "default": env.db(),  # reads DATABASE_URL
 }
+# Streaming replicas of default (comma separated URLs) for the read-heavy
+# endpoints, see common.routers; stay on default when none are configured
+for i, url in enumerate(env.list("DATABASE_REPLICA_URLS", default=[])):
+    DATABASES[f"replica{i}"] = {**env.db_url_config(url), "TEST": {"MIRROR": "default"}}
+DATABASE_ROUTERS = ["common.routers.ReplicaRouter"]
+REPLICA_MAX_LAG_SECONDS = env.float("REPLICA_MAX_LAG_SECONDS", default=5)
+REPLICA_LAG_CHECK_SECONDS = env.float("REPLICA_LAG_CHECK_SECONDS", default=2)
+# Keep connections open across requests (checked before reuse) instead of
+# paying connect + TLS + auth every time. DB_POOL switches to psycopg 3's
+# pool (the "pool" extra; Django prefers psycopg 3 over psycopg2 once it is
+# installed); DB_PGBOUNCER is for a transaction-mode PgBouncer, which cannot
+# keep server-side cursors.
+DB_CONN_MAX_AGE = env.int("DB_CONN_MAX_AGE", default=60)
+DB_POOL = env.bool("DB_POOL", default=False)
+DB_PGBOUNCER = env.bool("DB_PGBOUNCER", default=False)
+for database in DATABASES.values():
+    database["CONN_HEALTH_CHECKS"] = True
+    database["CONN_MAX_AGE"] = DB_CONN_MAX_AGE
+    if DB_POOL:
+        database["CONN_MAX_AGE"] = 0  # the pool owns the connections
+        database.setdefault("OPTIONS", {})["pool"] = {
+            "min_size": env.int("DB_POOL_MIN_SIZE", default=2),
+            "max_size": env.int("DB_POOL_MAX_SIZE", default=10),
+            "timeout": env.float("DB_POOL_TIMEOUT", default=10),
+        }
+    if DB_PGBOUNCER:
+        database["DISABLE_SERVER_SIDE_CURSORS"] = True
+
+# Shared cache: redis://host:6379/0 in production (needs the "cache" extra),
+# per-process memory when unset (dev, tests). Per-process memory cannot see
+# deletes made by another worker, so sessions (logout), cached users and
+# cross-worker invalidation only go through the cache when a shared one is
+# configured.
+SHARED_CACHE = bool(env("CACHE_URL", default=""))
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+SESSION_ENGINE = (
+    "django.contrib.sessions.backends.cached_db"
+    if SHARED_CACHE
+    else "django.contrib.sessions.backends.db"
+)
+# In-process tier of common.cache.TieredCache; also how long other workers
+# may serve a value after it was invalidated
+CACHE_LOCAL_SIZE = env.int("CACHE_LOCAL_SIZE", default=1024)
+CACHE_LOCAL_SECONDS = env.float("CACHE_LOCAL_SECONDS", default=2)
+MAP_CACHE_SECONDS = env.int("MAP_CACHE_SECONDS", default=15)
+MAP_INVALIDATE_SECONDS = env.int("MAP_INVALIDATE_SECONDS", default=5)
+SCHEMA_CACHE_SECONDS = 0 if DEBUG else 3600
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -15,6 +15,7 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include, re_path
 from rest_framework import permissions
@@ -40,16 +41,24 @@ urlpatterns = [
     path("api/", include("hazards.drf_urls")),
     path("", include("hazards.urls")),
     path("api/", include("maps.drf_urls")),
-    path("", include("maps.urls")),  # API Docs
+    path("", include("maps.urls")),
+    path("api/", include("alerts.drf_urls")),
+    path("api/", include("analytics.drf_urls")),
+    path("api/", include("common.drf_urls")),
+    # API Docs
     re_path(
         r"^swagger(?P<format>\.json|\.yaml)$",
-        schema_view.without_ui(cache_timeout=0),
+        schema_view.without_ui(cache_timeout=settings.SCHEMA_CACHE_SECONDS),
         name="schema-json",
     ),
     path(
         "swagger/",
-        schema_view.with_ui("swagger", cache_timeout=0),
+        schema_view.with_ui("swagger", cache_timeout=settings.SCHEMA_CACHE_SECONDS),
         name="schema-swagger-ui",
     ),
-    path("redoc/", schema_view.with_ui("redoc", cache_timeout=0), name="schema-redoc"),
+    path(
+        "redoc/",
+        schema_view.with_ui("redoc", cache_timeout=settings.SCHEMA_CACHE_SECONDS),
+        name="schema-redoc",
+    ),
 ]
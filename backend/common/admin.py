@@ -1,8 +1,15 @@
 from django.contrib import admin
 from leaflet.admin import LeafletGeoAdmin
-from .models import GeoVideo
+from .models import GeoVideo, GeoVideoArchive
 
 
 @admin.register(GeoVideo)
 class GeoVideoAdmin(LeafletGeoAdmin):
     list_display = ("id", "timestamp_utc", "location", "altitude")
+
+
+@admin.register(GeoVideoArchive)
+class GeoVideoArchiveAdmin(admin.ModelAdmin):
+    list_display = ("geovideo", "archived_at")
+    readonly_fields = ("geovideo", "archived_at")
+    exclude = ("sensors",)
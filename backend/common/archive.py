@@ -0,0 +1,100 @@
+import logging
+from datetime import datetime
+from typing import Iterator
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from .fields import pack_streams
+from .models import GeoVideo, GeoVideoArchive, SENSOR_STREAMS
+
+logger = logging.getLogger(__name__)
+
+
+def sensors_to_archive(cutoff: datetime):
+    """Recordings created before ``cutoff`` whose streams are still hot."""
+    return GeoVideo.objects.filter(
+        created_at__lt=cutoff, sensors_archived_at__isnull=True
+    )
+
+
+def archive_sensors(cutoff: datetime, batch_size: int = 500) -> Iterator[int]:
+    """
+    Move the sensor streams of recordings older than ``cutoff`` into
+    GeoVideoArchive, one transaction per batch, yielding the batch sizes.
+    The packed bytes are bundled as loaded, without decoding; the hot
+    columns are set to NULL so their TOAST space is reclaimed by vacuum.
+    """
+    after = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                sensors_to_archive(cutoff)
+                .filter(pk__gt=after)
+                .order_by("pk")
+                .select_for_update(skip_locked=True)
+                .values_list("pk", *SENSOR_STREAMS)[:batch_size]
+            )
+            if not rows:
+                return
+            GeoVideoArchive.objects.bulk_create(
+                [
+                    GeoVideoArchive(geovideo_id=pk, sensors=pack_streams(blobs))
+                    for pk, *blobs in rows
+                ],
+                ignore_conflicts=True,
+            )
+            GeoVideo.objects.filter(pk__in=[row[0] for row in rows]).update(
+                sensors_archived_at=timezone.now(),
+                **dict.fromkeys(SENSOR_STREAMS, None),
+            )
+        after = rows[-1][0]
+        yield len(rows)
+
+
+def videos_to_archive(cutoff: datetime, prefix: str):
+    return (
+        GeoVideo.objects.filter(created_at__lt=cutoff)
+        .exclude(video_file="")
+        .exclude(video_file__startswith=prefix)
+    )
+
+
+def archive_videos(cutoff: datetime, batch_size: int = 500) -> Iterator[int]:
+    """
+    Move the video files of recordings older than ``cutoff`` under
+    ARCHIVE_VIDEO_PREFIX in the same storage (a bucket prefix with a colder
+    storage class, or another mount). Each file is copied, the row pointed
+    at the copy, then the original deleted, so a crash leaves at worst an
+    orphaned copy and ``video_file`` stays readable throughout. A row that
+    changed in between keeps its file and the copy is removed.
+    """
+    prefix = settings.ARCHIVE_VIDEO_PREFIX
+    after = 0
+    while True:
+        rows = list(
+            videos_to_archive(cutoff, prefix)
+            .filter(pk__gt=after)
+            .order_by("pk")
+            .values_list("pk", "video_file")[:batch_size]
+        )
+        if not rows:
+            return
+        storage = GeoVideo._meta.get_field("video_file").storage
+        moved = 0
+        for pk, name in rows:
+            try:
+                with storage.open(name) as source:
+                    cold_name = storage.save(prefix + name, source)
+            except FileNotFoundError:
+                logger.warning("Video %s of GeoVideo %s is missing", name, pk)
+                continue
+            if GeoVideo.objects.filter(pk=pk, video_file=name).update(
+                video_file=cold_name
+            ):
+                storage.delete(name)
+                moved += 1
+            else:
+                # Deleted or repointed meanwhile: the original is not ours to drop
+                storage.delete(cold_name)
+        after = rows[-1][0]
+        yield moved
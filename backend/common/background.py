@@ -0,0 +1,55 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=settings.BACKGROUND_WORKERS, thread_name_prefix="background"
+    )
+
+
+@lru_cache(maxsize=None)
+def _slots() -> threading.BoundedSemaphore:
+    return threading.BoundedSemaphore(settings.BACKGROUND_QUEUE_SIZE)
+
+
+def _run(fn, args):
+    try:
+        fn(*args)
+    except Exception:
+        logger.exception("Background task %s failed", fn.__name__)
+    finally:
+        _slots().release()
+        # Worker threads never see request_finished; release like a request
+        close_old_connections()
+
+
+def run_in_background(fn, *args) -> bool:
+    """
+    Run ``fn(*args)`` on this process's worker threads so the request that
+    scheduled it can answer right away. Inline when BACKGROUND_WORKERS is 0.
+    At most BACKGROUND_QUEUE_SIZE tasks wait per process; further ones are
+    dropped (False is returned). Nothing is persisted either, so dropped
+    work and work lost to a restart must be recoverable another way: pending
+    reports are picked up by process_pending_reports and alert fan-outs by
+    send_alerts, which entrypoint.sh runs every SWEEP_INTERVAL seconds.
+    """
+    if settings.BACKGROUND_WORKERS <= 0:
+        fn(*args)
+        return True
+    if not _slots().acquire(blocking=False):
+        logger.warning("Background queue full, dropped %s", fn.__name__)
+        return False
+    try:
+        _executor().submit(_run, fn, args)
+    except RuntimeError:  # interpreter shutting down
+        _slots().release()
+        raise
+    return True
@@ -0,0 +1,167 @@
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from django.conf import settings
+from django.core.cache import caches
+
+MISSING = object()
+# How long a recompute may hold the cross-process lock before others give up
+# waiting and compute themselves
+LOCK_TIMEOUT = 10
+WAIT_INTERVAL = 0.05
+# Per-process single flight: threads missing the same key take one stripe
+_stripes = [threading.Lock() for _ in range(64)]
+
+# namespace -> local_hits, shared_hits, misses, waits
+_stats = defaultdict(Counter)
+
+
+class LocalLRU:
+    """Small thread-safe LRU with per-entry expiry, private to the process."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return MISSING
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout: float):
+        with self._lock:
+            self._data[key] = (time.monotonic() + timeout, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+
+_local = LocalLRU(settings.CACHE_LOCAL_SIZE)
+
+
+class TieredCache:
+    """
+    An in-process LRU (CACHE_LOCAL_SECONDS) in front of the shared cache
+    (``timeout``), for values every worker asks for at once, such as the map
+    feed. On a miss only one caller per key computes: threads of a process
+    queue on a lock and processes on a ``cache.add`` lock, the rest wait for
+    its result. ``invalidate`` bumps the namespace generation, so every key
+    of the namespace is dropped at once; other processes notice within
+    CACHE_LOCAL_SECONDS.
+    """
+
+    def __init__(self, namespace: str, timeout: float, alias: str = "default"):
+        self.namespace = namespace
+        self.timeout = timeout
+        self.alias = alias
+
+    @property
+    def shared(self):
+        return caches[self.alias]
+
+    def _generation_key(self):
+        return f"gen:{self.namespace}"
+
+    def _generation(self):
+        key = self._generation_key()
+        generation = _local.get(key)
+        if generation is MISSING:
+            # A clock-based start keeps a generation lost to eviction from
+            # coming back with a previous number
+            self.shared.add(key, time.time_ns(), timeout=None)
+            generation = self.shared.get(key)
+            _local.set(key, generation, settings.CACHE_LOCAL_SECONDS)
+        return generation
+
+    def invalidate(self):
+        key = self._generation_key()
+        try:
+            self.shared.incr(key)
+        except ValueError:
+            self.shared.add(key, time.time_ns(), timeout=None)
+        _local.delete(key)
+
+    def get_or_set(self, key: str, compute):
+        full_key = f"{self.namespace}:{self._generation()}:{key}"
+        stats = _stats[self.namespace]
+        value = _local.get(full_key)
+        if value is not MISSING:
+            stats["local_hits"] += 1
+            return value
+        with _stripes[hash(full_key) % len(_stripes)]:
+            value = _local.get(full_key)
+            if value is not MISSING:
+                stats["local_hits"] += 1
+                return value
+            value = self.shared.get(full_key, MISSING)
+            if value is not MISSING:
+                stats["shared_hits"] += 1
+            elif self.shared.add(f"lock:{full_key}", 1, LOCK_TIMEOUT):
+                try:
+                    value = self._compute(full_key, compute, stats)
+                finally:
+                    self.shared.delete(f"lock:{full_key}")
+            else:
+                value = self._wait(full_key)
+                if value is MISSING:
+                    value = self._compute(full_key, compute, stats)
+                else:
+                    stats["waits"] += 1
+            _local.set(full_key, value, settings.CACHE_LOCAL_SECONDS)
+        return value
+
+    def _compute(self, full_key, compute, stats):
+        stats["misses"] += 1
+        value = compute()
+        self.shared.set(full_key, value, self.timeout)
+        return value
+
+    def _wait(self, full_key):
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(WAIT_INTERVAL)
+            value = self.shared.get(full_key, MISSING)
+            if value is not MISSING:
+                return value
+        return MISSING
+
+
+def cache_stats():
+    """Hit/miss counters of this process per namespace."""
+    result = {}
+    for namespace, counts in _stats.items():
+        lookups = sum(counts.values())
+        result[namespace] = {
+            **counts,
+            "hit_ratio": (
+                (counts["local_hits"] + counts["shared_hits"] + counts["waits"])
+                / lookups
+                if lookups
+                else None
+            ),
+        }
+    return result
+
+
+def invalidate_namespace(namespace: str, alias: str = "default", debounce: float = 0):
+    """
+    Drop every key of ``namespace`` without needing its TieredCache. With
+    ``debounce``, at most once per that many seconds across processes; later
+    calls in the window are skipped (False) and left to the cache timeout.
+    """
+    if debounce and not caches[alias].add(f"debounce:{namespace}", 1, debounce):
+        return False
+    TieredCache(namespace, timeout=0, alias=alias).invalidate()
+    return True
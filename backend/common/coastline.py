@@ -0,0 +1,125 @@
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+import shapely
+from pyproj import Geod
+from shapely.geometry import shape
+from django.conf import settings
+from .models import coastClassSet
+
+logger = logging.getLogger(__name__)
+
+COASTLINE_FILE = "coastline.geojson"  # in REGION_BOUNDARIES_DIR
+# Long coastline rings are cut into pieces of this many vertices so the
+# STRtree bounding boxes stay tight
+SEGMENT_VERTICES = 8
+# Nearest-segment search radius in degrees (~110 km); farther is just inland
+MAX_SEARCH_DEG = 1.0
+# Upper distance bounds of each class in metres
+COAST_CLASSES = (
+    (200.0, coastClassSet.SHORE),
+    (2_000.0, coastClassSet.COASTAL),
+    (10_000.0, coastClassSet.NEAR_COAST),
+)
+COAST_FIELDS = ("coast_distance_m", "coast_class")
+
+GEOD = Geod(ellps="WGS84")
+
+
+def _segments(geometry) -> Iterable:
+    if geometry.geom_type in ("Polygon", "MultiPolygon"):
+        geometry = geometry.boundary
+    for line in shapely.get_parts(geometry):
+        coords = shapely.get_coordinates(line)
+        for start in range(0, len(coords) - 1, SEGMENT_VERTICES - 1):
+            yield shapely.LineString(coords[start : start + SEGMENT_VERTICES])
+
+
+class CoastlineIndex:
+    """Subdivided coastline (lines or land polygons) behind an STRtree."""
+
+    def __init__(self, geometries: List):
+        self.segments = np.array(
+            [segment for geometry in geometries for segment in _segments(geometry)],
+            dtype=object,
+        )
+        self.tree = shapely.STRtree(self.segments)
+
+    @classmethod
+    def from_geojson(cls, path: Path) -> "CoastlineIndex":
+        with open(path) as f:
+            features = json.load(f)["features"]
+        return cls([shape(feature["geometry"]) for feature in features])
+
+    def distance(self, lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+        """
+        Geodesic distance in metres from each point to the nearest coastline
+        segment, NaN beyond MAX_SEARCH_DEG. The segment is picked in degrees by
+        one vectorised nearest query, then measured on the ellipsoid.
+        """
+        result = np.full(len(lon), np.nan)
+        if len(self.segments) == 0 or len(lon) == 0:
+            return result
+        points = shapely.points(lon, lat)
+        point_idx, segment_idx = self.tree.query_nearest(
+            points, max_distance=MAX_SEARCH_DEG, all_matches=False
+        )
+        if len(point_idx) == 0:
+            return result
+        nearest = shapely.get_coordinates(
+            shapely.shortest_line(points[point_idx], self.segments[segment_idx])
+        ).reshape(-1, 2, 2)
+        _, _, metres = GEOD.inv(
+            nearest[:, 0, 0], nearest[:, 0, 1], nearest[:, 1, 0], nearest[:, 1, 1]
+        )
+        result[point_idx] = metres
+        return result
+
+
+@lru_cache(maxsize=None)
+def coastline_index() -> Optional[CoastlineIndex]:
+    """Loaded once per process; None when no coastline file is deployed."""
+    path = Path(settings.REGION_BOUNDARIES_DIR) / COASTLINE_FILE
+    if not path.exists():
+        logger.warning("Coastline %s not found, coast distance disabled", path)
+        return None
+    return CoastlineIndex.from_geojson(path)
+
+
+def coast_class(distance_m: float) -> int:
+    if np.isnan(distance_m):
+        return coastClassSet.INLAND
+    for limit, klass in COAST_CLASSES:
+        if distance_m <= limit:
+            return klass
+    return coastClassSet.INLAND
+
+
+def lookup_coast(lon: Iterable[float], lat: Iterable[float]) -> Dict[str, list]:
+    """coast_distance_m (None when far inland) and coast_class per point."""
+    index = coastline_index()
+    if index is None:
+        return {}
+    distances = index.distance(
+        np.asarray(lon, dtype=np.float64), np.asarray(lat, dtype=np.float64)
+    )
+    return {
+        "coast_distance_m": [None if np.isnan(d) else float(d) for d in distances],
+        "coast_class": [int(coast_class(d)) for d in distances],
+    }
+
+
+def tag_coast(geovideos: List) -> None:
+    """Set coast distance and class on (unsaved) GeoVideos from their location."""
+    if not geovideos:
+        return
+    values = lookup_coast(
+        [geovideo.location.x for geovideo in geovideos],
+        [geovideo.location.y for geovideo in geovideos],
+    )
+    for field, column in values.items():
+        for geovideo, value in zip(geovideos, column):
+            setattr(geovideo, field, value)
@@ -0,0 +1,125 @@
+import os
+import threading
+import time
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+# Per process: gunicorn workers each report their own numbers
+_lock = threading.Lock()
+_stats = {}
+# Set by ConnectionTimingMiddleware: when the request started and how long
+# until its default connection was ready. Copied into sync_to_async threads,
+# not into background workers, so their connects are not attributed.
+_request_mark = ContextVar("db_request_mark", default=None)
+
+
+def _alias_stats(alias):
+    return _stats.setdefault(
+        alias, {"opened": 0, "acquired": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0}
+    )
+
+
+def _count_opened(sender, connection, **kwargs):
+    with _lock:
+        _alias_stats(connection.alias)["opened"] += 1
+    mark = _request_mark.get()
+    if mark is not None and connection.alias == "default" and mark["wait"] is None:
+        mark["wait"] = (time.perf_counter() - mark["started"]) * 1000
+
+
+connection_created.connect(_count_opened, dispatch_uid="common.db.count_opened")
+
+
+def record_wait(alias, wait_ms):
+    with _lock:
+        stats = _alias_stats(alias)
+        stats["acquired"] += 1
+        stats["wait_ms_total"] += wait_ms
+        stats["wait_ms_max"] = max(stats["wait_ms_max"], wait_ms)
+
+
+def connection_stats():
+    """
+    Connection figures of this process per alias: connections opened (with
+    DB_POOL, checkouts), how long requests that had to open one waited for
+    it and, with DB_POOL, psycopg_pool's own counters.
+    """
+    result = {}
+    for alias, settings_dict in settings.DATABASES.items():
+        with _lock:
+            stats = dict(_alias_stats(alias))
+        acquired = stats["acquired"]
+        stats["wait_ms_avg"] = stats["wait_ms_total"] / acquired if acquired else None
+        stats["conn_max_age"] = settings_dict.get("CONN_MAX_AGE")
+        if settings_dict.get("OPTIONS", {}).get("pool"):
+            pool = connections[alias].pool
+            stats["pool"] = pool.get_stats() if pool is not None else None
+        result[alias] = stats
+    return {"pid": os.getpid(), "databases": result}
+
+
+class ConnectionTimingMiddleware:
+    """
+    Time how long a request waited for a new default connection (a full
+    connect, TLS and auth, or a pool checkout) and report it in a
+    Server-Timing header and in ``connection_stats``. The wait runs from the
+    start of the request to ``connection_created``, so it also holds the
+    little work done before the first query. Requests served on a reused
+    persistent connection, or without any query, connect nothing and are not
+    counted.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        mark = {"started": time.perf_counter(), "wait": None}
+        token = _request_mark.set(mark)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_mark.reset(token)
+        return self._report(response, mark)
+
+    async def __acall__(self, request):
+        mark = {"started": time.perf_counter(), "wait": None}
+        token = _request_mark.set(mark)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_mark.reset(token)
+        return self._report(response, mark)
+
+    def _report(self, response, mark):
+        if mark["wait"] is not None:
+            record_wait("default", mark["wait"])
+            response["Server-Timing"] = f"db-conn;dur={mark['wait']:.2f}"
+        return response
+
+
+def iterate(queryset, chunk_size=2000):
+    """
+    ``queryset.iterator(chunk_size)``, or keyset pages on pk when server-side
+    cursors are disabled (PgBouncer in transaction mode), where ``iterator``
+    would fetch the whole result into memory at once. Rows must be model
+    instances or tuples starting with the pk; the result is ordered by pk.
+    """
+    queryset = queryset.order_by("pk")
+    if not connections[queryset.db].settings_dict.get("DISABLE_SERVER_SIDE_CURSORS"):
+        yield from queryset.iterator(chunk_size=chunk_size)
+        return
+    page = queryset
+    while rows := list(page[:chunk_size]):
+        yield from rows
+        last = rows[-1]
+        page = queryset.filter(pk__gt=last[0] if isinstance(last, tuple) else last.pk)
@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import CacheStatsView, ConnectionStatsView
+
+urlpatterns = [
+    path("metrics/db/", ConnectionStatsView.as_view(), name="metrics-db"),
+    path("metrics/cache/", CacheStatsView.as_view(), name="metrics-cache"),
+]
@@ -0,0 +1,149 @@
+from base64 import b64encode
+import struct
+import zlib
+import numpy as np
+from django.db import models
+from django.db.models.query_utils import DeferredAttribute
+
+# magic, format version, flags, columns, rows
+HEADER = struct.Struct("<4sBBHI")
+MAGIC = b"GVSA"
+VERSION = 1
+FLAG_ZLIB = 0x01
+DTYPE = np.dtype("<f4")
+
+BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+# Length prefix of each stream in an archive bundle; NULL_LENGTH marks None
+BUNDLE_LENGTH = struct.Struct("<I")
+NULL_LENGTH = 0xFFFFFFFF
+
+
+def encode_sensor_array(values, columns: int, compress: bool = False) -> bytes:
+    """
+    Pack readings (rows of ``columns`` floats) as float32 in column-major
+    order behind a 12 byte header, optionally zlib compressed. Column-major
+    keeps each axis, e.g. every ``t``, contiguous for vectorised reads.
+    """
+    array = np.asarray(values, dtype=DTYPE)
+    if array.size == 0:
+        array = array.reshape(0, columns)
+    if array.ndim != 2 or array.shape[1] != columns:
+        raise ValueError(
+            f"Expected readings of {columns} values, got shape {array.shape}"
+        )
+    payload = array.tobytes(order="F")
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload)
+        flags |= FLAG_ZLIB
+    return HEADER.pack(MAGIC, VERSION, flags, columns, array.shape[0]) + payload
+
+
+def decode_sensor_array(buffer) -> np.ndarray:
+    """
+    Return a read-only (rows, columns) float32 array over ``buffer``. For
+    uncompressed payloads this is a zero-copy ``np.frombuffer`` view.
+    """
+    view = memoryview(buffer)
+    magic, version, flags, columns, rows = HEADER.unpack_from(view)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a packed sensor array")
+    data = view[HEADER.size :]
+    if flags & FLAG_ZLIB:
+        data = zlib.decompress(data)
+    array = np.frombuffer(data, dtype=DTYPE, count=rows * columns)
+    return array.reshape((rows, columns), order="F")
+
+
+def pack_streams(blobs) -> bytes:
+    """
+    Bundle packed sensor arrays (or None) into one zlib-compressed blob for
+    the archive table. Order is kept; unpack with the same stream names.
+    """
+    parts = []
+    for blob in blobs:
+        if blob is None:
+            parts.append(BUNDLE_LENGTH.pack(NULL_LENGTH))
+        else:
+            parts += [BUNDLE_LENGTH.pack(len(blob)), bytes(blob)]
+    return zlib.compress(b"".join(parts), 9)
+
+
+def unpack_streams(buffer, names) -> dict:
+    """Inverse of ``pack_streams``: stream name -> packed bytes or None."""
+    data = memoryview(zlib.decompress(buffer))
+    streams, offset = {}, 0
+    for name in names:
+        (length,) = BUNDLE_LENGTH.unpack_from(data, offset)
+        offset += BUNDLE_LENGTH.size
+        if length == NULL_LENGTH:
+            streams[name] = None
+            continue
+        streams[name] = data[offset : offset + length]
+        offset += length
+    return streams
+
+
+class SensorArrayDescriptor(DeferredAttribute):
+    """
+    Keeps the raw bytes loaded from the database and decodes them into a NumPy
+    view on first access, so rows that never touch a stream never decode it.
+    A NULL stream is looked up through the model's ``archived_stream(name)``,
+    when it has one, so streams moved to cold storage read back transparently.
+    Archived streams are decoded on every access and never become the field
+    value, and ``SensorArrayField.pre_save`` saves what was loaded, so a full
+    ``save()`` leaves the column NULL.
+    """
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if value is None and hasattr(instance, "archived_stream"):
+            archived = instance.archived_stream(self.field.attname)
+            return None if archived is None else decode_sensor_array(archived)
+        if isinstance(value, BUFFER_TYPES):
+            value = decode_sensor_array(value)
+            instance.__dict__[self.field.attname] = value
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.field.attname] = value
+
+
+class SensorArrayField(models.BinaryField):
+    """
+    Fixed-width sensor readings stored as packed float32 ``bytea``. Accepts
+    arrays or nested lists on assignment and reads back as a NumPy array.
+    """
+
+    descriptor_class = SensorArrayDescriptor
+
+    def __init__(self, *args, columns: int, compress: bool = False, **kwargs):
+        self.columns = columns
+        self.compress = compress
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["columns"] = self.columns
+        if self.compress:
+            kwargs["compress"] = True
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance, add):
+        # The loaded or assigned value, not the descriptor's archive fallback
+        if self.attname not in model_instance.__dict__:
+            model_instance.refresh_from_db(fields=[self.attname])
+        return model_instance.__dict__[self.attname]
+
+    def get_prep_value(self, value):
+        value = super().get_prep_value(value)
+        if value is None or isinstance(value, BUFFER_TYPES):
+            return value
+        return encode_sensor_array(value, self.columns, self.compress)
+
+    def value_to_string(self, obj):
+        value = self.get_prep_value(self.value_from_object(obj))
+        return None if value is None else b64encode(value).decode("ascii")
@@ -0,0 +1,72 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+from common.models import GeoVideo
+from common.archive import (
+    archive_sensors,
+    archive_videos,
+    sensors_to_archive,
+    videos_to_archive,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Move the sensor streams of recordings older than --days into the "
+        "compressed archive table and their videos under ARCHIVE_VIDEO_PREFIX. "
+        "Summary stats stay on GeoVideo and archived streams are read back "
+        "transparently. --vacuum then vacuums common_geovideo so the freed "
+        "TOAST space is reused by new recordings. This is what detaching an "
+        "old partition would do in a partitioned schema; new time ranges need "
+        "no setup, the BRIN index on created_at summarizes them as they fill."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.ARCHIVE_AFTER_DAYS,
+            help="Archive recordings older than this (default ARCHIVE_AFTER_DAYS).",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--no-videos", action="store_true", help="Only archive sensor streams."
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Only count what would move."
+        )
+        parser.add_argument(
+            "--vacuum",
+            action="store_true",
+            help="VACUUM (ANALYZE) common_geovideo after archiving.",
+        )
+
+    def handle(self, *args, days, batch_size, no_videos, dry_run, vacuum, **options):
+        cutoff = timezone.now() - timedelta(days=days)
+        if dry_run:
+            self.stdout.write(
+                f"{sensors_to_archive(cutoff).count()} sensor sets and "
+                f"{videos_to_archive(cutoff, settings.ARCHIVE_VIDEO_PREFIX).count()} "
+                f"videos are older than {days} days"
+            )
+            return
+
+        archived = 0
+        for count in archive_sensors(cutoff, batch_size):
+            archived += count
+            self.stdout.write(f"Archived sensors of {archived} recordings")
+        moved = 0
+        if not no_videos:
+            for count in archive_videos(cutoff, batch_size):
+                moved += count
+        if vacuum and archived:
+            # Outside a transaction: management commands run in autocommit
+            with connection.cursor() as cursor:
+                cursor.execute(f"VACUUM (ANALYZE) {GeoVideo._meta.db_table}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived sensors of {archived} recordings, moved {moved} videos"
+            )
+        )
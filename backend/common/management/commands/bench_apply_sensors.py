@@ -0,0 +1,40 @@
+import time
+import numpy as np
+from django.core.management.base import BaseCommand
+from common.models import GeoVideo
+from common.sensors import STREAMS, apply_sensors
+
+
+def per_call_us(function, runs):
+    started = time.perf_counter()
+    for _ in range(runs):
+        function()
+    return (time.perf_counter() - started) * 1e6 / runs
+
+
+class Command(BaseCommand):
+    help = (
+        "Time apply_sensors (parsing, summary stats and wave features) on one "
+        "recording of --rows readings per stream, as nested lists (JSON "
+        "payload), as arrays (GeoVideoPayloadSerializer output) and as lists "
+        "with one malformed reading per stream (the slow, filtering path)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100)  # 10 Hz x 10 s
+        parser.add_argument("--runs", type=int, default=3000)
+
+    def handle(self, *args, rows, runs, **options):
+        rng = np.random.default_rng(0)
+        arrays = {name: rng.normal(size=(rows, width)) for name, _, width, _ in STREAMS}
+        lists = {name: readings.tolist() for name, readings in arrays.items()}
+        malformed = {name: [*readings, [0.0]] for name, readings in lists.items()}
+
+        self.stdout.write(f"apply_sensors, {rows} readings per stream, per call:")
+        for label, streams in (
+            ("lists", lists),
+            ("arrays", arrays),
+            ("lists, one malformed", malformed),
+        ):
+            elapsed = per_call_us(lambda: apply_sensors(GeoVideo(), streams, 10), runs)
+            self.stdout.write(f"  {label:<22}{elapsed:.1f} us")
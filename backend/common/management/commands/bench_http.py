@@ -0,0 +1,67 @@
+import re
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+
+SERVER_TIMING = re.compile(r"db-conn;dur=([\d.]+)")
+
+
+class Command(BaseCommand):
+    help = (
+        "Load a running server with concurrent GETs and print latency "
+        "percentiles, plus the connection wait that responses which opened "
+        "a connection report in their Server-Timing header. Compare runs with DB_CONN_MAX_AGE=0, the "
+        "default persistent connections and DB_POOL, or SERVER_MODE=wsgi "
+        "against asgi at a high --concurrency, e.g. "
+        "bench_http http://localhost:8000 /api/check-auth/ /api/geovideos/"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("base_url")
+        parser.add_argument("paths", nargs="+")
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument(
+            "--cookie", default="", help="Cookie header, e.g. sessionid=..."
+        )
+
+    def handle(self, *args, base_url, paths, requests, concurrency, cookie, **options):
+        for path in paths:
+            url = base_url.rstrip("/") + path
+            self._get(url, cookie)  # warm up
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                started = time.perf_counter()
+                results = list(
+                    pool.map(lambda _: self._get(url, cookie), range(requests))
+                )
+                elapsed = time.perf_counter() - started
+            latency = np.array([r[0] for r in results])
+            waits = np.array([r[1] for r in results if r[1] is not None])
+            self.stdout.write(
+                f"{path}: {requests / elapsed:.0f} req/s, latency ms "
+                f"p50 {np.percentile(latency, 50):.1f} "
+                f"p95 {np.percentile(latency, 95):.1f} "
+                f"p99 {np.percentile(latency, 99):.1f}"
+            )
+            if len(waits):
+                self.stdout.write(
+                    f"    connection wait ms p50 {np.percentile(waits, 50):.2f} "
+                    f"p95 {np.percentile(waits, 95):.2f} max {waits.max():.2f}"
+                )
+
+    def _get(self, url, cookie):
+        request = urllib.request.Request(
+            url, headers={"Cookie": cookie} if cookie else {}
+        )
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                response.read()
+                timing = response.headers.get("Server-Timing", "")
+        except OSError as e:
+            raise CommandError(f"GET {url} failed: {e}")
+        latency = (time.perf_counter() - started) * 1000
+        match = SERVER_TIMING.search(timing)
+        return latency, float(match.group(1)) if match else None
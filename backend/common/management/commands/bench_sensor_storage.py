@@ -0,0 +1,96 @@
+import time
+import numpy as np
+from django.core.management.base import BaseCommand
+from psycopg2.extensions import FLOATARRAY
+from django.db import connection
+from common.fields import decode_sensor_array, encode_sensor_array
+
+# float8[] on disk: varlena length, ndim, data offset, element type, then a
+# dimension and lower bound per dimension (no NULLs, so no bitmap)
+ARRAY_HEADER = 4 + 4 + 4 + 4
+
+
+def array_text(readings):
+    """The float8[][] text form PostgreSQL sends for ``readings``."""
+    rows = (",".join(repr(float(v)) for v in row) for row in readings)
+    return "{" + ",".join("{" + row + "}" for row in rows) + "}"
+
+
+def per_call_us(function, runs):
+    started = time.perf_counter()
+    for _ in range(runs):
+        function()
+    return (time.perf_counter() - started) * 1e6 / runs
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the packed float32 sensor encoding (SensorArrayField) with "
+        "the float8[][] ArrayField it replaced, for one stream of --rows "
+        "readings of --width values: stored size and the client-side cost of "
+        "turning a fetched value into readings. --database also measures "
+        "pg_column_size and fetching --fetch rows of each from the server."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100)  # 10 Hz x 10 s
+        parser.add_argument("--width", type=int, default=4)
+        parser.add_argument("--runs", type=int, default=3000)
+        parser.add_argument("--database", action="store_true")
+        parser.add_argument("--fetch", type=int, default=1000)
+
+    def handle(self, *args, rows, width, runs, database, fetch, **options):
+        readings = np.round(np.random.default_rng(0).normal(size=(rows, width)), 6)
+        packed = encode_sensor_array(readings, width)
+        compressed = encode_sensor_array(readings, width, compress=True)
+        text = array_text(readings)
+        array_size = ARRAY_HEADER + 2 * 8 + 8 * readings.size
+
+        self.stdout.write(f"{rows} x {width} readings, stored size:")
+        self.stdout.write(f"  float8[][]       {array_size} B")
+        self.stdout.write(f"  packed float32   {len(packed)} B")
+        self.stdout.write(f"  packed + zlib    {len(compressed)} B")
+
+        self.stdout.write("Fetched value to readings, per value:")
+        self.stdout.write(
+            f"  float8[][] text -> lists (psycopg2)   "
+            f"{per_call_us(lambda: FLOATARRAY(text, None), runs):.1f} us"
+        )
+        self.stdout.write(
+            f"  float8[][] text -> ndarray            "
+            f"{per_call_us(lambda: np.asarray(FLOATARRAY(text, None)), runs):.1f} us"
+        )
+        self.stdout.write(
+            f"  packed -> ndarray (zero-copy view)    "
+            f"{per_call_us(lambda: decode_sensor_array(packed), runs):.1f} us"
+        )
+        self.stdout.write(
+            f"  packed + zlib -> ndarray              "
+            f"{per_call_us(lambda: decode_sensor_array(compressed), runs):.1f} us"
+        )
+        if database:
+            self._database(readings, packed, fetch)
+
+    def _database(self, readings, packed, fetch):
+        values = readings.tolist()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_column_size(%s::float8[][]), pg_column_size(%s::bytea)",
+                [values, packed],
+            )
+            array_size, packed_size = cursor.fetchone()
+            self.stdout.write(
+                f"pg_column_size: float8[][] {array_size} B, packed {packed_size} B"
+            )
+            for label, sql, param, convert in (
+                ("float8[][]", "%s::float8[][]", values, np.asarray),
+                ("packed", "%s::bytea", packed, decode_sensor_array),
+            ):
+                started = time.perf_counter()
+                cursor.execute(
+                    f"SELECT {sql} FROM generate_series(1, %s)", [param, fetch]
+                )
+                for (value,) in cursor.fetchall():
+                    convert(value)
+                elapsed = (time.perf_counter() - started) * 1000
+                self.stdout.write(f"Fetch and decode {fetch} {label}: {elapsed:.1f} ms")
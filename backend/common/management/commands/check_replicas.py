@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from common.routers import replica_aliases, replica_lag
+
+
+class Command(BaseCommand):
+    help = (
+        "Print the replication lag of every configured read replica and fail "
+        "if one is unreachable or lags more than REPLICA_MAX_LAG_SECONDS."
+    )
+
+    def handle(self, *args, **options):
+        aliases = replica_aliases()
+        if not aliases:
+            self.stdout.write("No replicas configured (DATABASE_REPLICA_URLS)")
+            return
+        failing = []
+        for alias in aliases:
+            lag = replica_lag(alias, refresh=True)
+            if lag is None:
+                self.stdout.write(f"{alias}: unreachable")
+                failing.append(alias)
+                continue
+            ok = lag <= settings.REPLICA_MAX_LAG_SECONDS
+            self.stdout.write(
+                f"{alias}: {lag:.1f}s behind" + ("" if ok else " (too far)")
+            )
+            if not ok:
+                failing.append(alias)
+        if failing:
+            raise CommandError(
+                "Reads fall back to the primary from: %s" % ", ".join(failing)
+            )
+        self.stdout.write(self.style.SUCCESS("All replicas usable"))
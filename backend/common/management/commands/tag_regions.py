@@ -0,0 +1,87 @@
+import time
+import numpy as np
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from common.models import GeoVideo
+from common.coastline import COAST_FIELDS, lookup_coast
+from common.regions import REGION_LAYERS, lookup_regions
+
+# Rows per UPDATE ... FROM (VALUES ...): keeps the statement's parameters well
+# under PostgreSQL's limit of 65535
+UPDATE_PAGE_SIZE = 2000
+
+
+class Command(BaseCommand):
+    help = (
+        "Backfill GeoVideo region codes (state, district, pincode, coastal "
+        "zone) and distance to coast from the boundary and coastline files in "
+        "REGION_BOUNDARIES_DIR. Points are read by primary key range and looked "
+        "up a whole batch at a time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50_000)
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            dest="retag_all",
+            help=(
+                "Retag every video, not only untagged ones (after boundary or "
+                "coastline files were added or changed)."
+            ),
+        )
+
+    def handle(self, *args, batch_size, retag_all, **options):
+        table = GeoVideo._meta.db_table
+        fields = [*REGION_LAYERS, *COAST_FIELDS]
+        where = "" if retag_all else "AND regions_tagged_at IS NULL"
+        assignments = ", ".join(
+            [f"{field} = v.{field}" for field in fields] + ["regions_tagged_at = now()"]
+        )
+        # Explicit casts: a VALUES column of only NULLs would otherwise be text
+        template = "(%s, {})".format(
+            ", ".join(
+                f"%s::{GeoVideo._meta.get_field(field).db_type(connection)}"
+                for field in fields
+            )
+        )
+        started = time.perf_counter()
+        last_pk = tagged = 0
+        while True:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT id, ST_X(location::geometry), ST_Y(location::geometry) "
+                    f"FROM {table} WHERE id > %s {where} ORDER BY id LIMIT %s",
+                    [last_pk, batch_size],
+                )
+                rows = cursor.fetchall()
+            if not rows:
+                break
+            pk, lon, lat = (np.asarray(column) for column in zip(*rows))
+            codes = {**lookup_regions(lon, lat), **lookup_coast(lon, lat)}
+            values = list(
+                zip(
+                    pk.tolist(),
+                    *[codes.get(field, [None] * len(pk)) for field in fields],
+                )
+            )
+            # Through Django's cursor, so it works with psycopg2 and psycopg 3
+            with transaction.atomic(), connection.cursor() as cursor:
+                for start in range(0, len(values), UPDATE_PAGE_SIZE):
+                    page = values[start : start + UPDATE_PAGE_SIZE]
+                    cursor.execute(
+                        f"UPDATE {table} AS g SET {assignments} "
+                        f"FROM (VALUES {', '.join([template] * len(page))}) "
+                        f"AS v(id, {', '.join(fields)}) WHERE g.id = v.id",
+                        [value for row in page for value in row],
+                    )
+            last_pk = int(pk[-1])
+            tagged += len(rows)
+            self.stdout.write(f"{tagged} tagged (up to id {last_pk})")
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Tagged {tagged} video(s) in {elapsed:.1f}s "
+                f"({tagged / elapsed:,.0f}/s)"
+            )
+        )
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:30
+
+import common.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0004_alter_geovideo_accelerometer_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='geovideo',
+            name='accelerometer_packed',
+            field=common.fields.SensorArrayField(blank=True, columns=4, null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='barometer_packed',
+            field=common.fields.SensorArrayField(blank=True, columns=2, null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='gyroscope_packed',
+            field=common.fields.SensorArrayField(blank=True, columns=4, null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='magnetometer_packed',
+            field=common.fields.SensorArrayField(blank=True, columns=4, null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='orientation_series_packed',
+            field=common.fields.SensorArrayField(blank=True, columns=4, null=True),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:30
+
+import logging
+from django.db import migrations
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Values per reading; the ArrayField size was never enforced
+STREAMS = {
+    'accelerometer': 4,
+    'gyroscope': 4,
+    'magnetometer': 4,
+    'barometer': 2,
+    'orientation_series': 4,
+}
+BATCH_SIZE = 500
+
+
+def _copy(apps, source, target, convert):
+    GeoVideo = apps.get_model('common', 'GeoVideo')
+    fields = [f'{name}{target}' for name in STREAMS]
+    batch = []
+    queryset = GeoVideo.objects.only('pk', *[f'{name}{source}' for name in STREAMS])
+    for geovideo in queryset.iterator(chunk_size=BATCH_SIZE):
+        for name in STREAMS:
+            value = getattr(geovideo, f'{name}{source}')
+            if value is not None:
+                value = convert(geovideo.pk, name, value)
+            setattr(geovideo, f'{name}{target}', value)
+        batch.append(geovideo)
+        if len(batch) >= BATCH_SIZE:
+            GeoVideo.objects.bulk_update(batch, fields)
+            batch = []
+    if batch:
+        GeoVideo.objects.bulk_update(batch, fields)
+
+
+def _readings(pk, name, value):
+    # Readings of another width or with NULLs cannot be packed; drop and log
+    # them rather than fail the whole migration on one bad historical row
+    width = STREAMS[name]
+    rows = [row for row in value if row is not None and len(row) == width and None not in row]
+    if len(rows) != len(value):
+        logger.warning(
+            'GeoVideo %s: dropped %d of %d %s readings that are not %d numbers',
+            pk, len(value) - len(rows), len(value), name, width,
+        )
+    return np.asarray(rows, dtype=np.float32).reshape(-1, width)
+
+
+def pack(apps, schema_editor):
+    _copy(apps, '', '_packed', _readings)
+
+
+def unpack(apps, schema_editor):
+    _copy(apps, '_packed', '', lambda pk, name, value: np.asarray(value, dtype=float).tolist())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0005_geovideo_packed_sensor_arrays'),
+    ]
+
+    operations = [
+        migrations.RunPython(pack, unpack),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0006_pack_geovideo_sensor_arrays'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='geovideo',
+            name='accelerometer',
+        ),
+        migrations.RemoveField(
+            model_name='geovideo',
+            name='barometer',
+        ),
+        migrations.RemoveField(
+            model_name='geovideo',
+            name='gyroscope',
+        ),
+        migrations.RemoveField(
+            model_name='geovideo',
+            name='magnetometer',
+        ),
+        migrations.RemoveField(
+            model_name='geovideo',
+            name='orientation_series',
+        ),
+        migrations.RenameField(
+            model_name='geovideo',
+            old_name='accelerometer_packed',
+            new_name='accelerometer',
+        ),
+        migrations.RenameField(
+            model_name='geovideo',
+            old_name='barometer_packed',
+            new_name='barometer',
+        ),
+        migrations.RenameField(
+            model_name='geovideo',
+            old_name='gyroscope_packed',
+            new_name='gyroscope',
+        ),
+        migrations.RenameField(
+            model_name='geovideo',
+            old_name='magnetometer_packed',
+            new_name='magnetometer',
+        ),
+        migrations.RenameField(
+            model_name='geovideo',
+            old_name='orientation_series_packed',
+            new_name='orientation_series',
+        ),
+    ]
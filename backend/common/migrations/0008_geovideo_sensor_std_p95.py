@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0007_replace_geovideo_sensor_arrays'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='geovideo',
+            name='accel_p95',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='accel_std',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='baro_p95',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='baro_std',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='gyro_p95',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='gyro_std',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='mag_p95',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='mag_std',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0008_geovideo_sensor_std_p95'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='geovideo',
+            name='baro_trend_hpa_h',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='wave_displacement_m',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='wave_period_sec',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='geovideo',
+            index=models.Index(fields=['wave_period_sec'], name='geovideo_wave_period_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='geovideo',
+            index=models.Index(fields=['wave_displacement_m'], name='geovideo_wave_disp_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='geovideo',
+            index=models.Index(fields=['baro_trend_hpa_h'], name='geovideo_baro_trend_idx'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0009_geovideo_wave_features'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='geovideo',
+            name='coastal_zone',
+            field=models.CharField(blank=True, max_length=16, null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='district_code',
+            field=models.CharField(blank=True, max_length=16, null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='pincode',
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='state_code',
+            field=models.CharField(blank=True, max_length=16, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='geovideo',
+            index=models.Index(fields=['state_code'], name='geovideo_state_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='geovideo',
+            index=models.Index(fields=['district_code'], name='geovideo_district_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='geovideo',
+            index=models.Index(fields=['pincode'], name='geovideo_pincode_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='geovideo',
+            index=models.Index(fields=['coastal_zone'], name='geovideo_coastal_zone_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0010_geovideo_region_codes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='geovideo',
+            name='coast_class',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(0, 'Shore'), (1, 'Coastal'), (2, 'Near Coast'), (3, 'Inland')], null=True),
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='coast_distance_m',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='geovideo',
+            index=models.Index(fields=['coast_distance_m'], name='geovideo_coast_dist_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='geovideo',
+            index=models.Index(fields=['coast_class'], name='geovideo_coast_class_idx'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:42
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+# Vacuum the big sensor rows (and their TOAST table) in small, frequent
+# passes instead of one pass over 20% of a table with millions of rows
+AUTOVACUUM_SQL = """
+ALTER TABLE common_geovideo SET (
+    autovacuum_vacuum_scale_factor = 0.01,
+    autovacuum_analyze_scale_factor = 0.005,
+    toast.autovacuum_vacuum_scale_factor = 0.01
+);
+"""
+RESET_SQL = """
+ALTER TABLE common_geovideo RESET (
+    autovacuum_vacuum_scale_factor,
+    autovacuum_analyze_scale_factor,
+    toast.autovacuum_vacuum_scale_factor
+);
+"""
+
+
+class Migration(migrations.Migration):
+
+    # BRIN builds concurrently too; GeoVideo is the largest table
+    atomic = False
+
+    dependencies = [
+        ('common', '0011_geovideo_coast_distance'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='geovideo',
+            index=django.contrib.postgres.indexes.BrinIndex(autosummarize=True, fields=['created_at'], name='geovideo_created_brin'),
+        ),
+        migrations.RunSQL(AUTOVACUUM_SQL, RESET_SQL),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0012_geovideo_created_brin'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GeoVideoArchive',
+            fields=[
+                ('geovideo', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='sensor_archive', serialize=False, to='common.geovideo')),
+                ('sensors', models.BinaryField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='geovideo',
+            name='sensors_archived_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        # The bundle is zlib-compressed already; skip TOAST's pglz attempt
+        migrations.RunSQL(
+            "ALTER TABLE common_geovideoarchive ALTER COLUMN sensors SET STORAGE EXTERNAL",
+            migrations.RunSQL.noop,
+        ),
+    ]
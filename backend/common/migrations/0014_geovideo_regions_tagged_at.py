@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:37
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+# Rows the old NULL-code filter already considered done; the rest are
+# looked up once more by the next tag_regions run
+BACKFILL_SQL = """
+UPDATE common_geovideo SET regions_tagged_at = recorded_at
+WHERE state_code IS NOT NULL AND coast_class IS NOT NULL;
+"""
+
+
+class Migration(migrations.Migration):
+
+    # Build the index without blocking inserts into the largest table
+    atomic = False
+
+    dependencies = [
+        ('common', '0013_geovideo_archive'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='geovideo',
+            name='regions_tagged_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+        AddIndexConcurrently(
+            model_name='geovideo',
+            index=models.Index(condition=models.Q(('regions_tagged_at__isnull', True)), fields=['id'], name='geovideo_untagged_idx'),
+        ),
+    ]
@@ -1,7 +1,7 @@
 from django.db import models
 from django.contrib.gis.db import models as gis_models
-from django.contrib.postgres.indexes import GistIndex
-from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import BrinIndex, GistIndex
+from .fields import SensorArrayField, unpack_streams
 
 
 class TimeStampedModel(models.Model):
@@ -27,6 +27,24 @@ class hazardSet(models.IntegerChoices):
     OTHER = 9
 
 
+class hazardGroupSet(models.IntegerChoices):
+    """Hazard types that can describe the same event, used to form incidents."""
+
+    OTHER = 0
+    WATER_LEVEL = 1
+    WAVES = 2
+    DAMAGE = 3
+
+
+class coastClassSet(models.IntegerChoices):
+    """Distance band to the nearest coastline, see common.coastline."""
+
+    SHORE = 0
+    COASTAL = 1
+    NEAR_COAST = 2
+    INLAND = 3
+
+
 class actionStatusSet(models.IntegerChoices):
     TO_BE_STARTED = 0
     IN_PROGRESS = 1
@@ -44,6 +62,31 @@ class verificationStatusSet(models.IntegerChoices):
     VERIFIED = 4
 
 
+SENSOR_STREAMS = (
+    "accelerometer",
+    "gyroscope",
+    "magnetometer",
+    "barometer",
+    "orientation_series",
+)
+
+
+class GeoVideoQuerySet(models.QuerySet):
+    def without_sensors(self):
+        return self.defer(*SENSOR_STREAMS)
+
+    def with_sensors(self):
+        """Undo the default deferral when the raw streams are actually needed."""
+        return self.defer(None)
+
+
+class GeoVideoManager(models.Manager.from_queryset(GeoVideoQuerySet)):
+    """Sensor streams are large and rarely needed, so they load on access."""
+
+    def get_queryset(self):
+        return super().get_queryset().without_sensors()
+
+
 class GeoVideo(TimeStampedModel):
     device_model = models.CharField(max_length=255, blank=True)  # e.g., "iPhone 14 Pro"
     software_info = models.CharField(
@@ -75,52 +118,135 @@ class GeoVideo(TimeStampedModel):
     lens = models.CharField(max_length=100, blank=True, null=True)
 
     # ---- Batch sensor data (Downsampled & Synchronized to ≤10Hz) ----
+    # Packed float32 arrays (see common.fields), read back as NumPy arrays.
     # Each reading is [x, y, z, t] with t = seconds since video start
-    accelerometer = ArrayField(
-        ArrayField(models.FloatField(), size=4), default=list, blank=True, null=True
-    )
-    gyroscope = ArrayField(
-        ArrayField(models.FloatField(), size=4), default=list, blank=True, null=True
-    )
-    magnetometer = ArrayField(
-        ArrayField(models.FloatField(), size=4), default=list, blank=True, null=True
-    )
+    accelerometer = SensorArrayField(columns=4, blank=True, null=True)
+    gyroscope = SensorArrayField(columns=4, blank=True, null=True)
+    magnetometer = SensorArrayField(columns=4, blank=True, null=True)
     # [pressure_hPa, t]
-    barometer = ArrayField(
-        ArrayField(models.FloatField(), size=2), default=list, blank=True, null=True
-    )
+    barometer = SensorArrayField(columns=2, blank=True, null=True)
     # [roll, pitch, yaw, t]
-    orientation_series = ArrayField(
-        ArrayField(models.FloatField(), size=4), default=list, blank=True, null=True
-    )
+    orientation_series = SensorArrayField(columns=4, blank=True, null=True)
 
     # Summary stats for fast filtering (computed from downsampled arrays)
     accel_min = models.FloatField(null=True, blank=True)
     accel_max = models.FloatField(null=True, blank=True)
     accel_mean = models.FloatField(null=True, blank=True)
+    accel_std = models.FloatField(null=True, blank=True)
+    accel_p95 = models.FloatField(null=True, blank=True)
 
     gyro_min = models.FloatField(null=True, blank=True)
     gyro_max = models.FloatField(null=True, blank=True)
     gyro_mean = models.FloatField(null=True, blank=True)
+    gyro_std = models.FloatField(null=True, blank=True)
+    gyro_p95 = models.FloatField(null=True, blank=True)
 
     mag_min = models.FloatField(null=True, blank=True)
     mag_max = models.FloatField(null=True, blank=True)
     mag_mean = models.FloatField(null=True, blank=True)
+    mag_std = models.FloatField(null=True, blank=True)
+    mag_p95 = models.FloatField(null=True, blank=True)
 
     baro_min = models.FloatField(null=True, blank=True)
     baro_max = models.FloatField(null=True, blank=True)
     baro_mean = models.FloatField(null=True, blank=True)
+    baro_std = models.FloatField(null=True, blank=True)
+    baro_p95 = models.FloatField(null=True, blank=True)
+
+    # Wave-motion features (see common.waves) for corroborating sea-state reports
+    wave_period_sec = models.FloatField(null=True, blank=True)  # dominant period
+    wave_displacement_m = models.FloatField(
+        null=True, blank=True
+    )  # significant vertical displacement
+    baro_trend_hpa_h = models.FloatField(null=True, blank=True)  # pressure trend
+
+    # Region codes from local boundary files (see common.regions)
+    state_code = models.CharField(max_length=16, null=True, blank=True)
+    district_code = models.CharField(max_length=16, null=True, blank=True)
+    pincode = models.CharField(max_length=10, null=True, blank=True)
+    coastal_zone = models.CharField(max_length=16, null=True, blank=True)
+    # Geodesic distance to the coastline (see common.coastline); null far inland
+    coast_distance_m = models.FloatField(null=True, blank=True)
+    coast_class = models.PositiveSmallIntegerField(
+        choices=coastClassSet, null=True, blank=True
+    )
+    # When the codes above were last looked up; codes stay NULL for points
+    # outside every region or when a layer is not deployed, so tag_regions
+    # selects on this instead
+    regions_tagged_at = models.DateTimeField(null=True, blank=True)
+
+    # Set once the sensor streams were moved to GeoVideoArchive (see
+    # common.archive); they are NULL here from then on but still readable
+    sensors_archived_at = models.DateTimeField(null=True, blank=True)
 
     duration_sec = models.FloatField(null=True, blank=True)  # video duration in seconds
     video_file = models.FileField(upload_to="report_videos/")
     recorded_at = models.DateTimeField(auto_now_add=True)
 
+    objects = GeoVideoManager()
+
     class Meta(TimeStampedModel.Meta):
         indexes = [
             models.Index(fields=["timestamp_utc"], name="geovideo_ts_idx"),
             models.Index(fields=["recorded_at"], name="geovideo_recorded_idx"),
             GistIndex(fields=["location"], name="geovideo_location_gix"),
+            models.Index(fields=["wave_period_sec"], name="geovideo_wave_period_idx"),
+            models.Index(fields=["wave_displacement_m"], name="geovideo_wave_disp_idx"),
+            models.Index(fields=["baro_trend_hpa_h"], name="geovideo_baro_trend_idx"),
+            models.Index(fields=["state_code"], name="geovideo_state_idx"),
+            models.Index(fields=["district_code"], name="geovideo_district_idx"),
+            models.Index(fields=["pincode"], name="geovideo_pincode_idx"),
+            models.Index(fields=["coastal_zone"], name="geovideo_coastal_zone_idx"),
+            models.Index(fields=["coast_distance_m"], name="geovideo_coast_dist_idx"),
+            models.Index(fields=["coast_class"], name="geovideo_coast_class_idx"),
+            models.Index(
+                fields=["id"],
+                condition=models.Q(regions_tagged_at__isnull=True),
+                name="geovideo_untagged_idx",
+            ),
+            # Rows are appended in time order, so a block-range index answers
+            # time windows at a fraction of a btree's size and write cost
+            BrinIndex(
+                fields=["created_at"],
+                autosummarize=True,
+                name="geovideo_created_brin",
+            ),
         ]
 
     def __str__(self):
         return f"GPS data @ {self.timestamp_utc.isoformat()}"
+
+    def archived_stream(self, name):
+        """Packed bytes of an archived sensor stream, None when not archived."""
+        if self.sensors_archived_at is None:
+            return None
+        if "_archived_streams" not in self.__dict__:
+            bundle = (
+                GeoVideoArchive.objects.filter(geovideo_id=self.pk)
+                .values_list("sensors", flat=True)
+                .first()
+            )
+            self._archived_streams = (
+                {} if bundle is None else unpack_streams(bundle, SENSOR_STREAMS)
+            )
+        return self._archived_streams.get(name)
+
+
+class GeoVideoArchive(models.Model):
+    """
+    Cold copy of a GeoVideo's sensor streams: every stream packed into one
+    compressed bundle (see common.fields.pack_streams). Summary stats and
+    wave features stay on the GeoVideo, so filtering never touches this table.
+    """
+
+    geovideo = models.OneToOneField(
+        GeoVideo,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="sensor_archive",
+    )
+    sensors = models.BinaryField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Sensor archive of {self.geovideo_id}"
@@ -0,0 +1,91 @@
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List
+import numpy as np
+import shapely
+from shapely.geometry import shape
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# GeoVideo field -> boundary file (GeoJSON FeatureCollection, WGS84) in
+# REGION_BOUNDARIES_DIR. Each feature carries its code in properties["code"].
+REGION_LAYERS = {
+    "state_code": "state.geojson",
+    "district_code": "district.geojson",
+    "pincode": "pincode.geojson",
+    "coastal_zone": "coastal_zone.geojson",
+}
+
+
+class RegionLayer:
+    """Polygons of one boundary file behind an STRtree."""
+
+    def __init__(self, geometries: List, codes: List[str]):
+        self.tree = shapely.STRtree(geometries)
+        self.codes = np.asarray(codes, dtype=object)
+
+    @classmethod
+    def from_geojson(cls, path: Path) -> "RegionLayer":
+        with open(path) as f:
+            features = json.load(f)["features"]
+        return cls(
+            [shape(feature["geometry"]) for feature in features],
+            [str(feature["properties"]["code"]) for feature in features],
+        )
+
+    def lookup(self, lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+        """
+        Code of the region containing each point, None outside every region.
+        One vectorised tree query for the whole batch; where regions overlap
+        the first one in the file wins.
+        """
+        result = np.full(len(lon), None, dtype=object)
+        if len(self.codes) == 0 or len(lon) == 0:
+            return result
+        points, regions = self.tree.query(
+            shapely.points(lon, lat), predicate="intersects"
+        )
+        # Pairs come in tree order; keep each point's lowest region index
+        order = np.lexsort((regions, points))
+        points, regions = points[order], regions[order]
+        first = np.ones(len(points), dtype=bool)
+        first[1:] = points[1:] != points[:-1]
+        result[points[first]] = self.codes[regions[first]]
+        return result
+
+
+@lru_cache(maxsize=None)
+def region_index() -> Dict[str, RegionLayer]:
+    """Layers found in REGION_BOUNDARIES_DIR, loaded once per process."""
+    directory = Path(settings.REGION_BOUNDARIES_DIR)
+    layers = {}
+    for field, filename in REGION_LAYERS.items():
+        path = directory / filename
+        if not path.exists():
+            logger.warning("Region boundaries %s not found, skipping %s", path, field)
+            continue
+        layers[field] = RegionLayer.from_geojson(path)
+    return layers
+
+
+def lookup_regions(lon: Iterable[float], lat: Iterable[float]) -> Dict[str, np.ndarray]:
+    """Region codes per REGION_LAYERS field for arrays of WGS84 coordinates."""
+    lon = np.asarray(lon, dtype=np.float64)
+    lat = np.asarray(lat, dtype=np.float64)
+    return {field: layer.lookup(lon, lat) for field, layer in region_index().items()}
+
+
+def tag_regions(geovideos: List) -> None:
+    """Set region code fields on (unsaved) GeoVideos from their location."""
+    if not geovideos:
+        return
+    codes = lookup_regions(
+        [geovideo.location.x for geovideo in geovideos],
+        [geovideo.location.y for geovideo in geovideos],
+    )
+    for field, values in codes.items():
+        for geovideo, value in zip(geovideos, values):
+            setattr(geovideo, field, value)
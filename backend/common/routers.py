@@ -0,0 +1,154 @@
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+# Set by ``read_replica`` around read-only views; everything else reads from
+# the primary so ingest never acts on stale data
+_use_replica = ContextVar("use_replica", default=False)
+# Set by ReplicaStickinessMiddleware for a client that wrote recently
+_pinned = ContextVar("pinned_to_primary", default=False)
+
+# alias -> (checked at, lag in seconds or None when unreachable)
+_lag_cache = {}
+
+LAG_SQL = """
+SELECT CASE
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp())
+END
+"""
+
+
+def replica_aliases():
+    return [alias for alias in settings.DATABASES if alias.startswith("replica")]
+
+
+def replica_lag(alias, refresh=False):
+    """
+    Replication lag of ``alias`` in seconds, None when it cannot be asked.
+    Cached for REPLICA_LAG_CHECK_SECONDS so requests do not pay for it.
+    """
+    now = time.monotonic()
+    checked_at, lag = _lag_cache.get(alias, (None, None))
+    if not refresh and checked_at is not None:
+        if now - checked_at < settings.REPLICA_LAG_CHECK_SECONDS:
+            return lag
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(LAG_SQL)
+            (lag,) = cursor.fetchone()
+        lag = 0.0 if lag is None else float(lag)
+    except DatabaseError:
+        logger.warning("Replica %s is unreachable", alias, exc_info=True)
+        lag = None
+    _lag_cache[alias] = (now, lag)
+    return lag
+
+
+def pinned_to_primary() -> bool:
+    """Whether this request's client wrote recently and must read the primary."""
+    return _pinned.get()
+
+
+def healthy_replicas():
+    return [
+        alias
+        for alias in replica_aliases()
+        if (lag := replica_lag(alias)) is not None
+        and lag <= settings.REPLICA_MAX_LAG_SECONDS
+    ]
+
+
+@contextmanager
+def read_replica():
+    """
+    Let reads inside the block (or decorated view) go to a replica. Used on
+    the read-heavy endpoints: map feeds, search and analytics. Each call, and
+    each call of a decorated view, gets its own context token.
+    """
+    token = _use_replica.set(True)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+class ReplicaRouter:
+    """
+    Writes, migrations and ordinary reads use ``default``. Reads inside
+    ``read_replica`` go to a random replica whose lag is at most
+    REPLICA_MAX_LAG_SECONDS, unless the client is pinned to the primary after
+    a write; with no healthy replica they fall back to ``default``.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _use_replica.get() or _pinned.get():
+            return "default"
+        replicas = healthy_replicas()
+        return random.choice(replicas) if replicas else "default"
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True  # replicas hold the same data
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == "default"
+
+
+class ReplicaStickinessMiddleware:
+    """
+    Read-your-writes: after a successful write the client gets a short-lived
+    cookie that keeps its reads on the primary until every replica usable by
+    the router has caught up (max lag plus one lag check interval).
+    """
+
+    cookie_name = "pin_primary"
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = _pinned.set(self.cookie_name in request.COOKIES)
+        try:
+            response = self.get_response(request)
+        finally:
+            _pinned.reset(token)
+        return self._pin_after_write(request, response)
+
+    async def __acall__(self, request):
+        token = _pinned.set(self.cookie_name in request.COOKIES)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _pinned.reset(token)
+        return self._pin_after_write(request, response)
+
+    def _pin_after_write(self, request, response):
+        if request.method not in ("GET", "HEAD", "OPTIONS") and (
+            response.status_code < 400
+        ):
+            response.set_cookie(
+                self.cookie_name,
+                "1",
+                max_age=settings.REPLICA_MAX_LAG_SECONDS
+                + settings.REPLICA_LAG_CHECK_SECONDS,
+                httponly=True,
+                samesite="Lax",
+                secure=settings.HTTPS_ENFORCED,
+            )
+        return response
@@ -1,71 +1,106 @@
 import numpy as np
-from typing import List, Dict, Optional, Tuple
+from typing import Any, List, Dict, Optional, Tuple, Union
 from .models import GeoVideo
+from .waves import wave_features
 
 Reading = List[float]  # [x,y,z,t] or [v,t]
-Series = List[Reading]
-RawStreams = Dict[str, Series]
+Series = Union[List[Reading], np.ndarray]
+RawStreams = Dict[str, Any]
 
+# (stream, stats prefix or None, reading width, reduce to vector magnitude)
+STREAMS: Tuple[Tuple[str, Optional[str], int, bool], ...] = (
+    ("accelerometer", "accel", 4, True),
+    ("gyroscope", "gyro", 4, True),
+    ("magnetometer", "mag", 4, True),
+    ("barometer", "baro", 2, False),
+    ("orientation_series", None, 4, False),
+)
+STATS = ("min", "max", "mean", "std", "p95")
 
-def _vector_magnitude(series_xyz: Series) -> List[float]:
-    """Compute vector magnitudes from [x,y,z,t] arrays."""
-    arr = np.array([r[:3] for r in series_xyz if len(r) >= 3], dtype=float)
-    if arr.size == 0:
-        return []
-    return np.linalg.norm(arr, axis=1).tolist()
 
+def parse_stream(series: Optional[Series], width: int) -> np.ndarray:
+    """
+    Parse readings once into an (n, width) float64 array, dropping readings
+    that do not have ``width`` values. Arrays coming from the payload
+    serializer are already in this form and are not copied.
+    """
+    if series is None:
+        return np.empty((0, width))
+    try:
+        arr = np.asarray(series, dtype=np.float64)
+    except ValueError:  # ragged: readings of different widths
+        arr = None
+    if arr is None or arr.ndim != 2 or arr.shape[1] != width:
+        kept = [reading for reading in series if len(reading) == width]
+        arr = np.asarray(kept, dtype=np.float64).reshape(-1, width)
+    return arr
 
-def _scalar_values(series_scalar: Series) -> List[float]:
-    """Extract scalar values [v,t] -> v."""
-    return [float(r[0]) for r in series_scalar if len(r) >= 1]
 
+def _vector_magnitude(readings: np.ndarray) -> np.ndarray:
+    """Compute vector magnitudes from [x,y,z,t] rows."""
+    xyz = readings[:, :3]
+    return np.sqrt(np.einsum("ij,ij->i", xyz, xyz))
 
-def _stats(
-    values: List[float],
-) -> Tuple[Optional[float], Optional[float], Optional[float]]:
-    """Return (min, max, mean) for a list of values."""
-    if not values:
-        return None, None, None
-    arr = np.array(values, dtype=float)
-    return float(np.min(arr)), float(np.max(arr)), float(np.mean(arr))
 
+def _stats(values: np.ndarray) -> Dict[str, Optional[float]]:
+    """
+    Return min, max, mean, std and 95th percentile of ``values``. A single
+    partition yields the order statistics (np.percentile is far slower for
+    arrays this small); p95 uses the same linear interpolation.
+    """
+    n = values.size
+    if n == 0:
+        return dict.fromkeys(STATS)
+    rank = 0.95 * (n - 1)
+    lo = int(rank)
+    hi = min(lo + 1, n - 1)
+    ordered = np.partition(values, (0, lo, hi, n - 1))
+    mean = values.sum() / n
+    centered = values - mean
+    return {
+        "min": float(ordered[0]),
+        "max": float(ordered[n - 1]),
+        "mean": float(mean),
+        "std": float(np.sqrt(centered @ centered / n)),
+        "p95": float(ordered[lo] + (rank - lo) * (ordered[hi] - ordered[lo])),
+    }
 
-def process_and_store_sensors(
+
+def apply_sensors(
     geovideo: GeoVideo,
     raw_streams: RawStreams,
     duration_sec: Optional[float],
 ) -> None:
     """
-    Store downsampled sensor streams (already ≤10Hz from frontend),
-    compute summary stats, and save into GeoVideo.
+    Store downsampled sensor streams (already ≤10Hz from frontend) and
+    compute summary stats on GeoVideo without saving it.
     """
     geovideo.duration_sec = duration_sec
 
-    # Save arrays (frontend already downsampled)
-    geovideo.accelerometer = [
-        list(map(float, r)) for r in raw_streams.get("accelerometer", [])
-    ]
-    geovideo.gyroscope = [list(map(float, r)) for r in raw_streams.get("gyroscope", [])]
-    geovideo.magnetometer = [
-        list(map(float, r)) for r in raw_streams.get("magnetometer", [])
-    ]
-    geovideo.barometer = [list(map(float, r)) for r in raw_streams.get("barometer", [])]
-    geovideo.orientation_series = [
-        list(map(float, r)) for r in raw_streams.get("orientation_series", [])
-    ]
+    parsed = {}
+    for name, prefix, width, vector in STREAMS:
+        readings = parsed[name] = parse_stream(raw_streams.get(name), width)
+        if prefix is not None:
+            values = _vector_magnitude(readings) if vector else readings[:, 0]
+            for stat, value in _stats(values).items():
+                setattr(geovideo, f"{prefix}_{stat}", value)
+        # Convert to the float32 storage format only once everything is computed
+        setattr(geovideo, name, readings.astype(np.float32))
+
+    for feature, value in wave_features(
+        parsed["accelerometer"], parsed["barometer"]
+    ).items():
+        setattr(geovideo, feature, value)
 
-    # Compute stats
-    geovideo.accel_min, geovideo.accel_max, geovideo.accel_mean = _stats(
-        _vector_magnitude(geovideo.accelerometer)
-    )
-    geovideo.gyro_min, geovideo.gyro_max, geovideo.gyro_mean = _stats(
-        _vector_magnitude(geovideo.gyroscope)
-    )
-    geovideo.mag_min, geovideo.mag_max, geovideo.mag_mean = _stats(
-        _vector_magnitude(geovideo.magnetometer)
-    )
-    geovideo.baro_min, geovideo.baro_max, geovideo.baro_mean = _stats(
-        _scalar_values(geovideo.barometer)
-    )
 
+def process_and_store_sensors(
+    geovideo: GeoVideo,
+    raw_streams: RawStreams,
+    duration_sec: Optional[float],
+) -> None:
+    """
+    Store downsampled sensor streams (already ≤10Hz from frontend),
+    compute summary stats, and save into GeoVideo.
+    """
+    apply_sensors(geovideo, raw_streams, duration_sec)
     geovideo.save()
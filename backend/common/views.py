@@ -0,0 +1,38 @@
+import os
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import views
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from .cache import cache_stats
+from .db import connection_stats
+
+
+class ConnectionStatsView(views.APIView):
+    """Database connection and pool figures of the worker serving the request."""
+
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_description="Connections opened, connection wait time "
+        "(avg/max ms) and psycopg pool stats per database alias, for the "
+        "worker process that answers. Poll a few times to cover all workers.",
+        responses={200: openapi.Response("Connection stats")},
+    )
+    def get(self, request, *args, **kwargs):
+        return Response(connection_stats())
+
+
+class CacheStatsView(views.APIView):
+    """Cache hit/miss counters of the worker serving the request."""
+
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_description="Local hits, shared hits, stampede waits, misses "
+        "and hit ratio per TieredCache namespace, for the worker process that "
+        "answers.",
+        responses={200: openapi.Response("Cache stats")},
+    )
+    def get(self, request, *args, **kwargs):
+        return Response({"pid": os.getpid(), "namespaces": cache_stats()})
@@ -0,0 +1,106 @@
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+RESAMPLE_HZ = 10.0  # frontend already downsamples to ≤10Hz
+MIN_SAMPLES = 16
+SEGMENT_SEC = 30.0
+# Wave band in Hz: long swell (~20 s) up to short wind chop / boat roll (~0.5 s)
+WAVE_BAND: Tuple[float, float] = (0.05, 2.0)
+
+FEATURES = ("wave_period_sec", "wave_displacement_m", "baro_trend_hpa_h")
+
+
+def resample(readings: np.ndarray, hz: float = RESAMPLE_HZ) -> np.ndarray:
+    """
+    Interpolate rows of [..values, t] onto a uniform ``hz`` grid using the t
+    column. Returns an (m, width - 1) array; empty if the series is too short.
+    """
+    t = readings[:, -1]
+    if t.size and np.any(np.diff(t) <= 0):
+        t, first = np.unique(t, return_index=True)  # sorts, drops repeated stamps
+        readings = readings[first]
+    if t.size < 2:
+        return np.empty((0, readings.shape[1] - 1))
+    grid = np.arange(t[0], t[-1], 1.0 / hz)
+    return np.column_stack(
+        [np.interp(grid, t, readings[:, col]) for col in range(readings.shape[1] - 1)]
+    )
+
+
+def welch(signal: np.ndarray, fs: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    One-sided power spectral density by Welch's method: Hann windowed,
+    mean-detrended segments with 50% overlap, zero-padded 4x so the peak of a
+    short clip is not snapped to a coarse bin. Records up to SEGMENT_SEC are
+    a single segment; a 10 s clip cannot afford to lose resolution.
+    """
+    n = signal.size
+    nperseg = min(n, int(SEGMENT_SEC * fs))
+    step = max(nperseg // 2, 1)
+    segments = np.lib.stride_tricks.sliding_window_view(signal, nperseg)[::step]
+    segments = segments - segments.mean(axis=1, keepdims=True)
+    window = np.hanning(nperseg)
+    nfft = 4 * nperseg
+    spectra = np.abs(np.fft.rfft(segments * window, n=nfft, axis=1)) ** 2
+    psd = spectra.mean(axis=0) * 2.0 / (fs * (window @ window))
+    psd[0] /= 2.0
+    psd[-1] /= 2.0
+    return np.fft.rfftfreq(nfft, d=1.0 / fs), psd
+
+
+def vertical_acceleration(xyz: np.ndarray) -> np.ndarray:
+    """
+    Dynamic acceleration along gravity from accelerationIncludingGravity
+    samples: gravity is the mean vector, so this is independent of how the
+    phone is held as long as it is not rotating much.
+    """
+    gravity = xyz.mean(axis=0)
+    g = np.linalg.norm(gravity)
+    if g == 0:
+        return np.zeros(len(xyz))
+    return xyz @ (gravity / g) - g
+
+
+def wave_motion(accelerometer: np.ndarray) -> Dict[str, Optional[float]]:
+    """Dominant period and significant vertical displacement (Hs = 4·√m0)."""
+    samples = resample(accelerometer)
+    if len(samples) < MIN_SAMPLES:
+        return {"wave_period_sec": None, "wave_displacement_m": None}
+    freqs, psd = welch(vertical_acceleration(samples[:, :3]), RESAMPLE_HZ)
+    duration = len(samples) / RESAMPLE_HZ
+    # Below ~1.5 cycles per segment the estimate is window leakage, which the
+    # (2πf)^4 division below would amplify into phantom displacement
+    segment = min(duration, SEGMENT_SEC)
+    band = (freqs >= max(WAVE_BAND[0], 1.5 / segment)) & (freqs <= WAVE_BAND[1])
+    if not band.any() or not psd[band].any():
+        return {"wave_period_sec": None, "wave_displacement_m": None}
+    freqs, psd = freqs[band], psd[band]
+    # Acceleration spectrum -> displacement spectrum: divide by (2πf)^4
+    displacement_psd = psd / (2 * np.pi * freqs) ** 4
+    m0 = np.trapezoid(displacement_psd, freqs) if freqs.size > 1 else 0.0
+    return {
+        "wave_period_sec": float(1.0 / freqs[np.argmax(psd)]),
+        "wave_displacement_m": float(4.0 * np.sqrt(m0)),
+    }
+
+
+def pressure_trend(barometer: np.ndarray) -> Optional[float]:
+    """Least-squares slope of [pressure_hPa, t] readings in hPa per hour."""
+    if len(barometer) < 2:
+        return None
+    t = barometer[:, 1]
+    span = t - t.mean()
+    denom = span @ span
+    if denom == 0:
+        return None
+    return float((span @ barometer[:, 0]) / denom * 3600.0)
+
+
+def wave_features(
+    accelerometer: np.ndarray, barometer: np.ndarray
+) -> Dict[str, Optional[float]]:
+    """Features for GeoVideo from parsed (n, 4) accelerometer and (n, 2) barometer."""
+    return {
+        **wave_motion(accelerometer),
+        "baro_trend_hpa_h": pressure_trend(barometer),
+    }
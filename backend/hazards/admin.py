@@ -1,5 +1,18 @@
 from django.contrib import admin
-from .models import UserReport
+from .models import UserReport, Incident
+
+
+class AwaitingVerificationFilter(admin.SimpleListFilter):
+    title = "workflow"
+    parameter_name = "workflow"
+
+    def lookups(self, request, model_admin):
+        return [("unverified", "Awaiting verification")]
+
+    def queryset(self, request, queryset):
+        if self.value() == "unverified":
+            return queryset.awaiting_verification()
+        return queryset
 
 
 @admin.register(UserReport)
@@ -15,3 +28,27 @@ class UserReportAdmin(admin.ModelAdmin):
         "user",
         "updated_at",
     )
+    # Every filter below is served by a created_at ordered index, partial or
+    # leading with the column
+    list_filter = (
+        AwaitingVerificationFilter,
+        "verification",
+        "action_status",
+        "type",
+    )
+    ordering = ("-created_at",)
+    list_select_related = ("user",)
+    # Skip the unfiltered COUNT(*) over the whole table on every page
+    show_full_result_count = False
+
+
+@admin.register(Incident)
+class IncidentAdmin(admin.ModelAdmin):
+    list_display = (
+        "pk",
+        "hazard_group",
+        "report_count",
+        "max_severity",
+        "first_seen",
+        "last_seen",
+    )
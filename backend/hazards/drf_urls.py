@@ -1,7 +1,31 @@
 # common/urls.py
 from django.urls import path
-from .views import UserReportCreateView
+from .views import (
+    UserReportCreateView,
+    UserReportBatchCreateView,
+    UserReportSearchView,
+    TriageQueueView,
+    TriageClaimView,
+    TriageReleaseView,
+)
 
 urlpatterns = [
     path("user-reports/", UserReportCreateView.as_view(), name="user-report-create"),
+    path(
+        "user-reports/batch/",
+        UserReportBatchCreateView.as_view(),
+        name="user-report-batch-create",
+    ),
+    path(
+        "user-reports/search/",
+        UserReportSearchView.as_view(),
+        name="user-report-search",
+    ),
+    path("triage/", TriageQueueView.as_view(), name="triage-queue"),
+    path("triage/claim/", TriageClaimView.as_view(), name="triage-claim"),
+    path(
+        "triage/<int:pk>/release/",
+        TriageReleaseView.as_view(),
+        name="triage-release",
+    ),
 ]
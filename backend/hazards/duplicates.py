@@ -0,0 +1,41 @@
+from datetime import timedelta
+from typing import Optional
+from django.conf import settings
+from django.contrib.gis.geos import Point
+from django.contrib.gis.measure import D
+from django.contrib.postgres.search import TrigramSimilarity
+from django.utils import timezone
+from .models import UserReport
+
+# Below this, texts like "flood here" are too generic to call copies
+MIN_TEXT_LENGTH = 20
+
+
+def find_original(text: str, location: Point) -> Optional[int]:
+    """
+    Most similar recent report near ``location`` whose text is a near copy of
+    ``text`` (pg_trgm similarity >= DUPLICATE_TEXT_SIMILARITY). The ``%``
+    operator is served by the trigram GIN index on user_text, so the lookup
+    does not scan old reports. Returns the pk of the original report, never
+    of another duplicate.
+    """
+    text = text.strip()
+    if len(text) < MIN_TEXT_LENGTH:
+        return None
+    since = timezone.now() - timedelta(hours=settings.DUPLICATE_WINDOW_HOURS)
+    match = (
+        UserReport.objects.filter(
+            created_at__gte=since,
+            user_text__trigram_similar=text,
+            geovideo__location__dwithin=(location, D(m=settings.DUPLICATE_RADIUS_M)),
+        )
+        .annotate(similarity=TrigramSimilarity("user_text", text))
+        .filter(similarity__gte=settings.DUPLICATE_TEXT_SIMILARITY)
+        .order_by("-similarity", "created_at")
+        .values_list("pk", "duplicate_of")
+        .first()
+    )
+    if match is None:
+        return None
+    pk, original = match
+    return original or pk
@@ -0,0 +1,176 @@
+from datetime import timedelta
+from typing import Iterable, Optional
+import logging
+import math
+import zlib
+from django.conf import settings
+from django.contrib.gis.db.models.functions import Distance
+from django.contrib.gis.geos import Point
+from django.contrib.gis.measure import D
+from django.db import DatabaseError, connection, transaction
+from common.models import hazardSet, hazardGroupSet
+from .models import Incident, UserReport
+from .triage import incident_term, triage_priority
+
+logger = logging.getLogger(__name__)
+
+METERS_PER_DEGREE = 111_320
+
+HAZARD_GROUPS = {
+    hazardSet.TIDE: hazardGroupSet.WATER_LEVEL,
+    hazardSet.FLOODING: hazardGroupSet.WATER_LEVEL,
+    hazardSet.SURGE: hazardGroupSet.WATER_LEVEL,
+    hazardSet.TSUNAMI: hazardGroupSet.WATER_LEVEL,
+    hazardSet.WAVES: hazardGroupSet.WAVES,
+    hazardSet.SWELL: hazardGroupSet.WAVES,
+    hazardSet.STORM: hazardGroupSet.WAVES,
+    hazardSet.COASTAL_DAMAGE: hazardGroupSet.DAMAGE,
+}
+
+GROWN_FIELDS = (
+    "centroid",
+    "report_count",
+    "priority_boost",
+    "min_lon",
+    "min_lat",
+    "max_lon",
+    "max_lat",
+    "first_seen",
+    "last_seen",
+)
+
+
+def hazard_group(report: UserReport) -> int:
+    """System type once classified, otherwise what the user picked."""
+    hazard = report.type if report.type is not None else report.user_submit_type
+    return HAZARD_GROUPS.get(hazard, hazardGroupSet.OTHER)
+
+
+def _cell_keys(group: int, location: Point) -> list[int]:
+    """
+    Advisory lock keys of the grid cells (INCIDENT_RADIUS_M on a side) within
+    INCIDENT_RADIUS_M of ``location``: any two reports close enough to share
+    an incident have a key in common. Cells are degrees, so they narrow
+    toward the poles and more of them are needed across longitude.
+    """
+    size = settings.INCIDENT_RADIUS_M / METERS_PER_DEGREE
+    lat = min(abs(location.y), 85.0)
+    span = math.ceil(1 / math.cos(math.radians(lat)))
+    row, column = math.floor(location.y / size), math.floor(location.x / size)
+    return sorted(
+        {
+            zlib.crc32(f"hazards.incident:{group}:{row + i}:{column + j}".encode())
+            for i in (-1, 0, 1)
+            for j in range(-span, span + 1)
+        }
+    )
+
+
+def _lock_area(group: int, location: Point) -> None:
+    """
+    Serialise incident lookup/creation around ``location`` until commit, so
+    two simultaneous first reports of an event cannot open two incidents,
+    while reports elsewhere go on in parallel. Keys are taken in sorted order
+    so overlapping neighbourhoods cannot deadlock.
+    """
+    with connection.cursor() as cursor:
+        for key in _cell_keys(group, location):
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", [key])
+
+
+def nearest_incident(group: int, location: Point, recorded_at) -> Optional[Incident]:
+    """
+    Closest incident of ``group`` within INCIDENT_RADIUS_M whose time span is
+    within INCIDENT_WINDOW_HOURS of ``recorded_at``. Uses the centroid GiST
+    index through ST_DWithin, so cost does not grow with the table.
+    """
+    window = timedelta(hours=settings.INCIDENT_WINDOW_HOURS)
+    return (
+        Incident.objects.filter(
+            hazard_group=group,
+            first_seen__lte=recorded_at + window,
+            last_seen__gte=recorded_at - window,
+            centroid__dwithin=(location, D(m=settings.INCIDENT_RADIUS_M)),
+        )
+        .annotate(distance=Distance("centroid", location))
+        .order_by("distance")
+        .first()
+    )
+
+
+def _grow(incident: Incident, report: UserReport) -> None:
+    location = report.geovideo.location
+    recorded_at = report.geovideo.timestamp_utc
+    n = incident.report_count + 1
+    centroid = incident.centroid
+    incident.centroid = Point(
+        centroid.x + (location.x - centroid.x) / n,
+        centroid.y + (location.y - centroid.y) / n,
+        srid=4326,
+    )
+    incident.report_count = n
+    # Makes every queued member more urgent without touching their rows
+    incident.priority_boost = incident_term(n)
+    incident.min_lon = min(incident.min_lon, location.x)
+    incident.min_lat = min(incident.min_lat, location.y)
+    incident.max_lon = max(incident.max_lon, location.x)
+    incident.max_lat = max(incident.max_lat, location.y)
+    incident.first_seen = min(incident.first_seen, recorded_at)
+    incident.last_seen = max(incident.last_seen, recorded_at)
+    # max_severity is left to raise_severity, classification may race this
+    incident.save(update_fields=[*GROWN_FIELDS, "updated_at"])
+    if report.severity is not None:
+        Incident.objects.filter(pk=incident.pk).raise_severity(report.severity)
+
+
+@transaction.atomic
+def attach_to_incident(report: UserReport) -> Incident:
+    """
+    Join ``report`` to the nearest compatible incident, or open a new one, and
+    update the incident aggregates. One indexed lookup per report; existing
+    incidents are never re-clustered. Call it once the report is committed:
+    its locks are meant to be held for this short transaction only.
+    """
+    group = hazard_group(report)
+    location = report.geovideo.location
+    _lock_area(group, location)
+    recorded_at = report.geovideo.timestamp_utc
+    incident = nearest_incident(group, location, recorded_at)
+    if incident is None:
+        incident = Incident.objects.create(
+            hazard_group=group,
+            centroid=Point(location.x, location.y, srid=4326),
+            report_count=1,
+            priority_boost=incident_term(1),
+            max_severity=report.severity,
+            min_lon=location.x,
+            min_lat=location.y,
+            max_lon=location.x,
+            max_lat=location.y,
+            first_seen=recorded_at,
+            last_seen=recorded_at,
+        )
+    else:
+        # Reports far enough apart to hold no lock in common may still both
+        # grow this incident
+        incident = Incident.objects.select_for_update().get(pk=incident.pk)
+        _grow(incident, report)
+    report.incident = incident
+    report.priority = triage_priority(report)
+    UserReport.objects.filter(pk=report.pk).update(
+        incident=incident, priority=report.priority
+    )
+    return incident
+
+
+def attach_all(reports: Iterable[UserReport]) -> None:
+    """
+    attach_to_incident for just committed reports, in recording order, one
+    transaction each. A failure leaves the report without an incident for
+    cluster_incidents rather than failing the upload that stored it.
+    """
+    for report in sorted(reports, key=lambda r: r.geovideo.timestamp_utc):
+        try:
+            attach_to_incident(report)
+        except DatabaseError:
+            logger.exception("Could not attach report %s to an incident", report.pk)
@@ -0,0 +1,171 @@
+from typing import Any, Dict, List, Optional
+import hashlib
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework.response import Response
+from common.models import GeoVideo
+from common.coastline import tag_coast
+from common.regions import tag_regions
+from common.sensors import apply_sensors
+from .models import UserReport, IdempotencyKey
+from .plausibility import plausibility_score
+from .duplicates import find_original
+
+Payload = Dict[str, Any]
+
+
+def client_ip(request) -> Optional[str]:
+    return request.META.get("HTTP_X_FORWARDED_FOR", request.META.get("REMOTE_ADDR"))
+
+
+def video_sha256(video) -> str:
+    """Hash an uploaded file chunk by chunk and rewind it for storage."""
+    digest = hashlib.sha256()
+    for chunk in video.chunks():
+        digest.update(chunk)
+    video.seek(0)
+    return digest.hexdigest()
+
+
+def report_fingerprint(video, geovideo_data: Payload) -> str:
+    """
+    Content fingerprint of a validated submission: the same video recorded at
+    the same instant and place is the same report, whichever request sent it.
+    """
+    location = geovideo_data["location"]
+    content = "|".join(
+        [
+            video_sha256(video),
+            geovideo_data["timestamp_utc"].isoformat(),
+            f"{location.x:.7f} {location.y:.7f}",
+        ]
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def existing_report_ids(fingerprints: List[str]) -> Dict[str, int]:
+    return dict(
+        UserReport.objects.filter(fingerprint__in=fingerprints).values_list(
+            "fingerprint", "pk"
+        )
+    )
+
+
+def idempotency_scope(request) -> str:
+    if request.user.is_authenticated:
+        return f"user:{request.user.pk}"
+    return f"ip:{client_ip(request)}"
+
+
+def replay_idempotent(request) -> Optional[Response]:
+    """Return the stored response if this Idempotency-Key was already served."""
+    key = request.headers.get("Idempotency-Key")
+    if not key:
+        return None
+    stored = (
+        IdempotencyKey.objects.live()
+        .filter(scope=idempotency_scope(request), key=key[:255])
+        .values_list("status_code", "response")
+        .first()
+    )
+    if stored is None:
+        return None
+    status_code, data = stored
+    return Response(data, status=status_code, headers={"Idempotent-Replayed": "true"})
+
+
+def remember_idempotent(request, response: Response) -> Response:
+    """Store a successful response under the request's Idempotency-Key."""
+    key = request.headers.get("Idempotency-Key")
+    if key and response.status_code < 400:
+        scope, key = idempotency_scope(request), key[:255]
+        try:
+            with transaction.atomic():
+                IdempotencyKey.objects.create(
+                    scope=scope,
+                    key=key,
+                    status_code=response.status_code,
+                    response=response.data,
+                )
+        except IntegrityError:
+            # A concurrent retry stored it first, or an expired entry not yet
+            # deleted holds the key: take that one over
+            IdempotencyKey.objects.expired().filter(scope=scope, key=key).update(
+                status_code=response.status_code,
+                response=response.data,
+                created_at=timezone.now(),
+                updated_at=timezone.now(),
+            )
+    return response
+
+
+def build_geovideo(geovideo_data: Payload, video) -> GeoVideo:
+    """
+    Return an unsaved GeoVideo with metadata, sensor stats, region codes and
+    coast distance filled in from GeoVideoPayloadSerializer.validated_data.
+    """
+    geovideo = GeoVideo(
+        video_file=video,
+        device_model=geovideo_data.get("device_model", ""),
+        software_info=geovideo_data.get("software_info", ""),
+        location=geovideo_data.get("location"),
+        altitude=geovideo_data.get("altitude"),
+        gps_accuracy=geovideo_data.get("gps_accuracy"),
+        speed=geovideo_data.get("speed"),
+        direction=geovideo_data.get("direction"),
+        gps_fix_type=geovideo_data.get("gps_fix_type"),
+        num_satellites=geovideo_data.get("num_satellites"),
+        timestamp_utc=geovideo_data.get("timestamp_utc"),
+        orientation_roll=geovideo_data.get("orientation_roll"),
+        orientation_pitch=geovideo_data.get("orientation_pitch"),
+        orientation_yaw=geovideo_data.get("orientation_yaw"),
+        resolution=geovideo_data.get("resolution"),
+        frame_rate=geovideo_data.get("frame_rate"),
+        aperture=geovideo_data.get("aperture"),
+        iso=geovideo_data.get("iso"),
+        lens=geovideo_data.get("lens"),
+    )
+    apply_sensors(
+        geovideo,
+        raw_streams=geovideo_data,
+        duration_sec=geovideo_data.get("duration_sec"),
+    )
+    tag_regions([geovideo])
+    tag_coast([geovideo])
+    geovideo.regions_tagged_at = timezone.now()
+    return geovideo
+
+
+def build_report(
+    geovideo: GeoVideo,
+    data: Payload,
+    client_info: Optional[Payload],
+    request,
+    fingerprint: Optional[str] = None,
+) -> UserReport:
+    """Return an unsaved UserReport for an already saved GeoVideo."""
+    client_info = client_info or {}
+    return UserReport(
+        geovideo=geovideo,
+        fingerprint=fingerprint,
+        plausibility=plausibility_score(geovideo, hazard=data["user_submit_type"]),
+        duplicate_of_id=find_original(data["user_text"], geovideo.location),
+        user_submit_type=data["user_submit_type"],
+        user_text=data["user_text"],
+        user_ip=client_ip(request),
+        user_userAgent=client_info.get("userAgent", ""),
+        user_platform=client_info.get("platform", ""),
+        user_device_language=client_info.get("language", ""),
+        user=request.user if request.user.is_authenticated else None,
+    )
+
+
+def discard_videos(geovideos: List[GeoVideo]) -> None:
+    """
+    Delete the files ``geovideos`` wrote to storage in a transaction that
+    rolled back: FileField stores the upload before the INSERT, and the
+    rollback does not undo that.
+    """
+    for geovideo in geovideos:
+        if geovideo.video_file and geovideo.video_file._committed:
+            geovideo.video_file.delete(save=False)
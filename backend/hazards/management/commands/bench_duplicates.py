@@ -0,0 +1,88 @@
+import string
+import time
+from datetime import timedelta
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from common.models import GeoVideo
+from hazards.duplicates import find_original
+from hazards.models import UserReport
+from .check_query_plans import seed_reports
+
+
+def synthetic_vocabulary(size, rng):
+    """``size`` random lowercase words, so seeded texts are not all alike."""
+    letters = np.array(list(string.ascii_lowercase))
+    return ["".join(rng.choice(letters, rng.integers(4, 10))) for _ in range(size)]
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the near-duplicate lookup (hazards.duplicates.find_original) on "
+        "a synthetic table: --seed inserts reports inside a transaction that "
+        "is rolled back afterwards, then near copies (one word changed) of "
+        "recent reports are looked up. Prints latency percentiles and how "
+        "many lookups found their original, e.g. bench_duplicates --seed 2000000"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Number of synthetic reports to insert (and roll back).",
+        )
+        parser.add_argument("--lookups", type=int, default=200)
+        parser.add_argument(
+            "--vocabulary",
+            type=int,
+            default=5000,
+            help="Distinct words in the seeded texts.",
+        )
+
+    def handle(self, *args, seed, lookups, vocabulary, **options):
+        rng = np.random.default_rng(1)
+        with transaction.atomic():
+            if seed:
+                seed_reports(seed, synthetic_vocabulary(vocabulary, rng))
+                with connection.cursor() as cursor:
+                    for model in (UserReport, GeoVideo):
+                        cursor.execute(f"ANALYZE {model._meta.db_table}")
+            since = timezone.now() - timedelta(hours=settings.DUPLICATE_WINDOW_HOURS)
+            targets = list(
+                UserReport.objects.filter(created_at__gte=since, duplicate_of=None)
+                .select_related("geovideo")
+                .only("pk", "user_text", "geovideo__location")
+                .order_by("?")[:lookups]
+            )
+            if not targets:
+                raise CommandError(
+                    "No reports in the duplicate window; seed more with --seed"
+                )
+            find_original(
+                "warm up the connection and the plan", targets[0].geovideo.location
+            )
+            latency = []
+            found = 0
+            for target in targets:
+                words = target.user_text.split()
+                words[rng.integers(len(words))] = "edited"
+                started = time.perf_counter()
+                original = find_original(" ".join(words), target.geovideo.location)
+                latency.append((time.perf_counter() - started) * 1000)
+                found += original == target.pk
+            total = UserReport.objects.count()
+            transaction.set_rollback(True)
+
+        latency = np.array(latency)
+        self.stdout.write(
+            f"{len(targets)} lookups over {total} reports: latency ms "
+            f"p50 {np.percentile(latency, 50):.2f} "
+            f"p95 {np.percentile(latency, 95):.2f} "
+            f"max {latency.max():.2f}"
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Found the original in {found} of {len(targets)}")
+        )
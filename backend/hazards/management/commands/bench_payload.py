@@ -0,0 +1,83 @@
+import json
+import time
+import numpy as np
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from hazards.serializers import GeoVideoPayloadSerializer, ReportPayloadSerializer
+
+STREAMS = {
+    "accelerometer": 4,
+    "gyroscope": 4,
+    "magnetometer": 4,
+    "barometer": 2,
+    "orientation_series": 4,
+}
+
+
+def sample_payload(rate_hz=10, seconds=10):
+    """A geovideo payload with every sensor stream at ``rate_hz``."""
+    rng = np.random.default_rng(0)
+    rows = rate_hz * seconds
+    payload = {
+        "location": "POINT(80.27 13.08)",
+        "timestamp_utc": "2026-10-18T10:00:00Z",
+        "gps_accuracy": 4.5,
+        "num_satellites": 9,
+        "duration_sec": float(seconds),
+    }
+    for name, width in STREAMS.items():
+        payload[name] = np.round(rng.normal(size=(rows, width)), 4).tolist()
+    return payload
+
+
+class Command(BaseCommand):
+    help = (
+        "Time report payload validation for a payload with all five sensor "
+        "streams at --rate Hz for --seconds: the geovideo part alone, a whole "
+        "report sent as JSON (already parsed by DRF) and one sent as multipart "
+        "(geovideo as a JSON string, decoded by the serializer). Fails when "
+        "the JSON report takes longer than --target-ms per validation."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=3000)
+        parser.add_argument("--rate", type=int, default=10)
+        parser.add_argument("--seconds", type=int, default=10)
+        parser.add_argument("--target-ms", type=float, default=1.0)
+
+    def handle(self, *args, runs, rate, seconds, target_ms, **options):
+        geovideo = sample_payload(rate, seconds)
+        video = SimpleUploadedFile("clip.mp4", b"\0" * 1024, "video/mp4")
+        report = {
+            "user_submit_type": "1",
+            "user_text": "seawall breach near the harbour road",
+            "user_video": video,
+            "geovideo": geovideo,
+            "client_info": {"userAgent": "bench", "language": "en"},
+        }
+        multipart = {
+            **report,
+            "geovideo": json.dumps(geovideo),
+            "client_info": json.dumps(report["client_info"]),
+        }
+        cases = {
+            "geovideo payload": lambda: GeoVideoPayloadSerializer(data=geovideo),
+            "JSON report": lambda: ReportPayloadSerializer(data=report),
+            "multipart report": lambda: ReportPayloadSerializer(data=multipart),
+        }
+        timings = {}
+        for name, build in cases.items():
+            serializer = build()
+            if not serializer.is_valid():
+                raise CommandError(f"{name} does not validate: {serializer.errors}")
+            started = time.perf_counter()
+            for _ in range(runs):
+                build().is_valid()
+            timings[name] = (time.perf_counter() - started) * 1000 / runs
+            self.stdout.write(f"{name}: {timings[name]:.3f} ms per validation")
+        if timings["JSON report"] > target_ms:
+            raise CommandError(
+                f"Report validation is over {target_ms} ms "
+                f"({timings['JSON report']:.3f} ms)"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Within {target_ms} ms"))
@@ -0,0 +1,175 @@
+import json
+from datetime import timedelta
+import numpy as np
+from django.contrib.gis.geos import Point
+from django.contrib.gis.measure import D
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import F, OuterRef, Subquery
+from django.utils import timezone
+from common.models import GeoVideo, actionStatusSet, hazardSet, verificationStatusSet
+from hazards.models import UserReport
+
+SEED_BATCH = 5000
+WORDS = (
+    "water seawall breach flood road wave high tide surge storm boats damage "
+    "harbour beach village rising strong wind coast houses street tree fallen"
+).split()
+
+
+def key_queries():
+    """The operational queries the report indexes are designed for."""
+    now = timezone.now()
+    near = Point(80.27, 13.08, srid=4326)
+    return {
+        "triage queue": UserReport.objects.triage_queue()[:20],
+        "pending classification": UserReport.objects.pending_processing()[:100],
+        "awaiting verification": UserReport.objects.awaiting_verification()[:100],
+        "admin: by verification": UserReport.objects.filter(
+            verification=verificationStatusSet.VERIFIED
+        ).order_by("-created_at")[:100],
+        "admin: by action status": UserReport.objects.filter(
+            action_status=actionStatusSet.IN_PROGRESS
+        ).order_by("-created_at")[:100],
+        "admin: by type": UserReport.objects.filter(type=hazardSet.TSUNAMI).order_by(
+            "-created_at"
+        )[:100],
+        "worst of a type": UserReport.objects.filter(
+            type=hazardSet.FLOODING, severity__isnull=False
+        ).order_by("-severity")[:50],
+        "last 24h": UserReport.objects.filter(
+            created_at__gte=now - timedelta(days=1)
+        ).order_by("-created_at")[:500],
+        "map feed": UserReport.objects.for_map().filter(
+            duplicate_of__isnull=True,
+            created_at__gte=now - timedelta(days=settings.MAP_FEED_DAYS or 90),
+        ),
+        "recordings of a week": GeoVideo.objects.filter(
+            created_at__gte=now - timedelta(days=14),
+            created_at__lt=now - timedelta(days=7),
+        ).values("pk", "location"),
+        "full-text search": UserReport.objects.search("seawall breach")[:50],
+        "near-duplicate text": UserReport.objects.filter(
+            user_text__trigram_similar="seawall breach near the harbour road",
+            geovideo__location__dwithin=(near, D(m=25000)),
+        )[:1],
+    }
+
+
+def seed_reports(count, vocabulary=WORDS):
+    """
+    Insert ``count`` synthetic reports with recordings, spread over two years
+    in insertion order, with texts of eight words from ``vocabulary``.
+    Callers roll them back.
+    """
+    rng = np.random.default_rng(0)
+    now = timezone.now()
+    # Spread over ~two years, inserted oldest first like production so
+    # created_at follows the physical row order the BRIN index relies on
+    ages = np.sort(rng.uniform(0, 730 * 24 * 3600, count))[::-1]
+    for start in range(0, count, SEED_BATCH):
+        n = min(SEED_BATCH, count - start)
+        age = ages[start : start + n]
+        lon = rng.uniform(68, 97, n)
+        lat = rng.uniform(6, 23, n)
+        geovideos = GeoVideo.objects.bulk_create(
+            GeoVideo(
+                location=Point(float(lon[i]), float(lat[i]), srid=4326),
+                timestamp_utc=now - timedelta(seconds=float(age[i])),
+                video_file="report_videos/seed.mp4",
+            )
+            for i in range(n)
+        )
+        hazards = rng.choice(hazardSet.values, n)
+        verification = rng.choice(verificationStatusSet.values, n)
+        action = rng.choice(actionStatusSet.values, n, p=[0.02, 0.03, 0.05, 0.9])
+        severity = rng.integers(1, 101, n)
+        words = rng.choice(vocabulary, (n, 8))
+        UserReport.objects.bulk_create(
+            UserReport(
+                geovideo=geovideo,
+                user_submit_type=int(hazards[i]),
+                type=int(hazards[i]),
+                severity=int(severity[i]),
+                confidence=int(severity[i]),
+                verification=int(verification[i]),
+                action_status=int(action[i]),
+                proccessed_data=None if action[i] == 0 else [],
+                user_text=" ".join(words[i]),
+                user_ip="127.0.0.1",
+                user_userAgent="seed",
+                user_platform="seed",
+                user_device_language="en",
+                priority=float(rng.normal()),
+            )
+            for i, geovideo in enumerate(geovideos)
+        )
+    # created_at is auto_now_add; spread it over time like the recordings
+    GeoVideo.objects.filter(video_file="report_videos/seed.mp4").update(
+        created_at=F("timestamp_utc")
+    )
+    recorded = GeoVideo.objects.filter(pk=OuterRef("geovideo_id"))
+    UserReport.objects.filter(user_userAgent="seed").update(
+        created_at=Subquery(recorded.values("timestamp_utc")[:1])
+    )
+
+
+def seq_scans(plan, tables):
+    """Yield Seq Scan nodes on ``tables`` in an EXPLAIN (FORMAT JSON) plan."""
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in tables:
+        yield plan
+    for child in plan.get("Plans", ()):
+        yield from seq_scans(child, tables)
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN the key report queries (triage, classification backlog, "
+        "verification workflow, admin filters, search, time windows) and fail "
+        "if any of them sequentially scans the report or recording table. "
+        "--seed inserts a synthetic dataset first, inside a transaction that "
+        "is rolled back afterwards; --analyze also runs them and reports time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Number of synthetic reports to insert (and roll back).",
+        )
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="EXPLAIN ANALYZE: execute each query and print its runtime.",
+        )
+
+    def handle(self, *args, seed, analyze, **options):
+        tables = (UserReport._meta.db_table, GeoVideo._meta.db_table)
+        failures = []
+        with transaction.atomic():
+            if seed:
+                seed_reports(seed)
+                with connection.cursor() as cursor:
+                    for table in tables:
+                        cursor.execute(f"ANALYZE {table}")
+            for name, queryset in key_queries().items():
+                explained = json.loads(queryset.explain(format="json", analyze=analyze))
+                plan = explained[0]["Plan"]
+                scans = list(seq_scans(plan, tables))
+                verdict = "SEQ SCAN" if scans else "ok"
+                timing = f", {explained[0]['Execution Time']:.1f} ms" if analyze else ""
+                self.stdout.write(
+                    f"{verdict:>8}  {name}  (cost {plan['Total Cost']}{timing})"
+                )
+                if scans:
+                    failures.append(name)
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError(
+                "Sequential scan on %s in: %s"
+                % (" or ".join(tables), ", ".join(failures))
+            )
+        self.stdout.write(self.style.SUCCESS("All key queries use indexes"))
@@ -0,0 +1,46 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from hazards.incidents import attach_to_incident
+from hazards.models import UserReport
+
+
+class Command(BaseCommand):
+    help = (
+        "Attach reports that have no incident yet (e.g. created before "
+        "incidents existed), oldest recording first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Maximum number of reports to attach in this run.",
+        )
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=0,
+            help="Only reports submitted at least this many minutes ago, so "
+            "a periodic sweep leaves ones still being attached by their "
+            "upload alone.",
+        )
+
+    def handle(self, *args, limit, older_than, **options):
+        reports = (
+            UserReport.objects.filter(incident__isnull=True)
+            .with_geovideo("location", "timestamp_utc")
+            .order_by("geovideo__timestamp_utc")
+        )
+        if older_than:
+            reports = reports.filter(
+                created_at__lt=timezone.now() - timedelta(minutes=older_than)
+            )
+        if limit:
+            reports = reports[:limit]
+        attached = 0
+        for report in reports.iterator():
+            attach_to_incident(report)
+            attached += 1
+        self.stdout.write(self.style.SUCCESS(f"Attached {attached} report(s)"))
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from hazards.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete stored Idempotency-Key responses older than "
+        "IDEMPOTENCY_KEY_HOURS; they are no longer replayed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows deleted per statement, to keep each one short.",
+        )
+
+    def handle(self, *args, batch_size, **options):
+        deleted = 0
+        while True:
+            ids = list(
+                IdempotencyKey.objects.expired().values_list("pk", flat=True)[
+                    :batch_size
+                ]
+            )
+            if not ids:
+                break
+            deleted += IdempotencyKey.objects.filter(pk__in=ids).delete()[0]
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} key(s)"))
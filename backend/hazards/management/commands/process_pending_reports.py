@@ -0,0 +1,47 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from hazards.models import UserReport
+
+
+class Command(BaseCommand):
+    help = (
+        "Classify reports that have not been processed yet, most plausible "
+        "first. Picks up reports held back by REPORT_PLAUSIBILITY_THRESHOLD."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=100,
+            help="Maximum number of reports to classify in this run.",
+        )
+        parser.add_argument(
+            "--min-plausibility",
+            type=int,
+            default=0,
+            help="Skip reports scoring below this.",
+        )
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=0,
+            help="Only reports submitted at least this many minutes ago, so "
+            "a periodic sweep leaves reports still queued in a web process "
+            "alone.",
+        )
+
+    def handle(self, *args, limit, min_plausibility, older_than, **options):
+        reports = UserReport.objects.pending_processing()
+        if older_than:
+            reports = reports.filter(
+                created_at__lt=timezone.now() - timedelta(minutes=older_than)
+            )
+        if min_plausibility:
+            reports = reports.filter(plausibility__gte=min_plausibility)
+        processed = 0
+        for report in reports[:limit]:
+            report.process()
+            processed += 1
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} report(s)"))
@@ -0,0 +1,24 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from common.models import actionStatusSet
+from hazards.models import UserReport
+
+
+class Command(BaseCommand):
+    help = "Return reports claimed from the triage queue but never handled."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-minutes",
+            type=int,
+            default=60,
+            help="Release claims older than this.",
+        )
+
+    def handle(self, *args, older_than_minutes, **options):
+        released = UserReport.objects.filter(
+            action_status=actionStatusSet.IN_PROGRESS,
+            claimed_at__lt=timezone.now() - timedelta(minutes=older_than_minutes),
+        ).release()
+        self.stdout.write(self.style.SUCCESS(f"Released {released} report(s)"))
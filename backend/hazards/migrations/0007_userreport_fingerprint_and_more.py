@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hazards', '0006_userreport_language'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userreport',
+            name='fingerprint',
+            field=models.CharField(default=None, editable=False, max_length=64, null=True, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='userreport',
+            name='action_status',
+            field=models.IntegerField(choices=[(0, 'To Be Started'), (1, 'In Progress'), (2, 'Next Stage'), (3, 'Finish')], default=0, verbose_name='Action status'),
+        ),
+        migrations.AlterField(
+            model_name='userreport',
+            name='confidence',
+            field=models.PositiveSmallIntegerField(default=None, null=True),
+        ),
+        migrations.AlterField(
+            model_name='userreport',
+            name='severity',
+            field=models.PositiveSmallIntegerField(default=None, null=True),
+        ),
+        migrations.AlterField(
+            model_name='userreport',
+            name='type',
+            field=models.IntegerField(choices=[(0, 'Unknown'), (1, 'Tide'), (2, 'Coastal Damage'), (3, 'Flooding'), (4, 'Waves'), (5, 'Swell'), (6, 'Surge'), (7, 'Storm'), (8, 'Tsunami'), (9, 'Other')], default=None, null=True, verbose_name='Hazard according to system'),
+        ),
+        migrations.AlterField(
+            model_name='userreport',
+            name='user_submit_type',
+            field=models.IntegerField(choices=[(0, 'Unknown'), (1, 'Tide'), (2, 'Coastal Damage'), (3, 'Flooding'), (4, 'Waves'), (5, 'Swell'), (6, 'Surge'), (7, 'Storm'), (8, 'Tsunami'), (9, 'Other')], verbose_name='Hazard according to user'),
+        ),
+        migrations.CreateModel(
+            name='IdempotencyKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('scope', models.CharField(max_length=64)),
+                ('key', models.CharField(max_length=255)),
+                ('status_code', models.PositiveSmallIntegerField()),
+                ('response', models.JSONField()),
+            ],
+            options={
+                'abstract': False,
+                'constraints': [models.UniqueConstraint(fields=('scope', 'key'), name='idempotency_scope_key_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hazards', '0007_userreport_fingerprint_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userreport',
+            name='plausibility',
+            field=models.PositiveSmallIntegerField(db_index=True, default=None, null=True),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:24
+
+import django.contrib.gis.db.models.fields
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hazards', '0008_userreport_plausibility'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Incident',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('hazard_group', models.PositiveSmallIntegerField(choices=[(0, 'Other'), (1, 'Water Level'), (2, 'Waves'), (3, 'Damage')])),
+                ('centroid', django.contrib.gis.db.models.fields.PointField(geography=True, srid=4326)),
+                ('report_count', models.PositiveIntegerField(default=0)),
+                ('max_severity', models.PositiveSmallIntegerField(default=None, null=True)),
+                ('min_lon', models.FloatField()),
+                ('min_lat', models.FloatField()),
+                ('max_lon', models.FloatField()),
+                ('max_lat', models.FloatField()),
+                ('first_seen', models.DateTimeField()),
+                ('last_seen', models.DateTimeField()),
+            ],
+            options={
+                'abstract': False,
+                'indexes': [django.contrib.postgres.indexes.GistIndex(fields=['centroid'], name='incident_centroid_gix'), models.Index(fields=['hazard_group', 'last_seen'], name='incident_group_seen_idx')],
+            },
+        ),
+        migrations.AddField(
+            model_name='userreport',
+            name='incident',
+            field=models.ForeignKey(default=None, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reports', to='hazards.incident'),
+        ),
+    ]
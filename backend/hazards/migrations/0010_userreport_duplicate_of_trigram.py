@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:26
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0009_geovideo_wave_features'),
+        ('hazards', '0009_incident'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='userreport',
+            name='duplicate_of',
+            field=models.ForeignKey(default=None, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='duplicates', to='hazards.userreport'),
+        ),
+        migrations.AddIndex(
+            model_name='userreport',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass('user_text', name='gin_trgm_ops'), name='userreport_text_trgm_gin'),
+        ),
+    ]
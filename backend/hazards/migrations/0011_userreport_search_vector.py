@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:27
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0009_geovideo_wave_features'),
+        ('hazards', '0010_userreport_duplicate_of_trigram'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userreport',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('user_text', config=models.Case(models.When(language__startswith='ar', then=django.contrib.postgres.search.SearchConfig('arabic')), models.When(language__startswith='ca', then=django.contrib.postgres.search.SearchConfig('catalan')), models.When(language__startswith='da', then=django.contrib.postgres.search.SearchConfig('danish')), models.When(language__startswith='de', then=django.contrib.postgres.search.SearchConfig('german')), models.When(language__startswith='el', then=django.contrib.postgres.search.SearchConfig('greek')), models.When(language__startswith='en', then=django.contrib.postgres.search.SearchConfig('english')), models.When(language__startswith='es', then=django.contrib.postgres.search.SearchConfig('spanish')), models.When(language__startswith='eu', then=django.contrib.postgres.search.SearchConfig('basque')), models.When(language__startswith='fi', then=django.contrib.postgres.search.SearchConfig('finnish')), models.When(language__startswith='fr', then=django.contrib.postgres.search.SearchConfig('french')), models.When(language__startswith='ga', then=django.contrib.postgres.search.SearchConfig('irish')), models.When(language__startswith='hu', then=django.contrib.postgres.search.SearchConfig('hungarian')), models.When(language__startswith='hy', then=django.contrib.postgres.search.SearchConfig('armenian')), models.When(language__startswith='id', then=django.contrib.postgres.search.SearchConfig('indonesian')), models.When(language__startswith='it', then=django.contrib.postgres.search.SearchConfig('italian')), models.When(language__startswith='lt', then=django.contrib.postgres.search.SearchConfig('lithuanian')), models.When(language__startswith='ne', then=django.contrib.postgres.search.SearchConfig('nepali')), models.When(language__startswith='nl', then=django.contrib.postgres.search.SearchConfig('dutch')), models.When(language__startswith='no', then=django.contrib.postgres.search.SearchConfig('norwegian')), models.When(language__startswith='pt', then=django.contrib.postgres.search.SearchConfig('portuguese')), models.When(language__startswith='ro', then=django.contrib.postgres.search.SearchConfig('romanian')), models.When(language__startswith='ru', then=django.contrib.postgres.search.SearchConfig('russian')), models.When(language__startswith='sr', then=django.contrib.postgres.search.SearchConfig('serbian')), models.When(language__startswith='sv', then=django.contrib.postgres.search.SearchConfig('swedish')), models.When(language__startswith='ta', then=django.contrib.postgres.search.SearchConfig('tamil')), models.When(language__startswith='tr', then=django.contrib.postgres.search.SearchConfig('turkish')), models.When(language__startswith='yi', then=django.contrib.postgres.search.SearchConfig('yiddish')), default=django.contrib.postgres.search.SearchConfig('simple'), output_field=models.TextField()), weight='A'), '||', django.contrib.postgres.search.SearchVector('user_text', config='simple', weight='B'), django.contrib.postgres.search.SearchConfig(models.Case(models.When(language__startswith='ar', then=django.contrib.postgres.search.SearchConfig('arabic')), models.When(language__startswith='ca', then=django.contrib.postgres.search.SearchConfig('catalan')), models.When(language__startswith='da', then=django.contrib.postgres.search.SearchConfig('danish')), models.When(language__startswith='de', then=django.contrib.postgres.search.SearchConfig('german')), models.When(language__startswith='el', then=django.contrib.postgres.search.SearchConfig('greek')), models.When(language__startswith='en', then=django.contrib.postgres.search.SearchConfig('english')), models.When(language__startswith='es', then=django.contrib.postgres.search.SearchConfig('spanish')), models.When(language__startswith='eu', then=django.contrib.postgres.search.SearchConfig('basque')), models.When(language__startswith='fi', then=django.contrib.postgres.search.SearchConfig('finnish')), models.When(language__startswith='fr', then=django.contrib.postgres.search.SearchConfig('french')), models.When(language__startswith='ga', then=django.contrib.postgres.search.SearchConfig('irish')), models.When(language__startswith='hu', then=django.contrib.postgres.search.SearchConfig('hungarian')), models.When(language__startswith='hy', then=django.contrib.postgres.search.SearchConfig('armenian')), models.When(language__startswith='id', then=django.contrib.postgres.search.SearchConfig('indonesian')), models.When(language__startswith='it', then=django.contrib.postgres.search.SearchConfig('italian')), models.When(language__startswith='lt', then=django.contrib.postgres.search.SearchConfig('lithuanian')), models.When(language__startswith='ne', then=django.contrib.postgres.search.SearchConfig('nepali')), models.When(language__startswith='nl', then=django.contrib.postgres.search.SearchConfig('dutch')), models.When(language__startswith='no', then=django.contrib.postgres.search.SearchConfig('norwegian')), models.When(language__startswith='pt', then=django.contrib.postgres.search.SearchConfig('portuguese')), models.When(language__startswith='ro', then=django.contrib.postgres.search.SearchConfig('romanian')), models.When(language__startswith='ru', then=django.contrib.postgres.search.SearchConfig('russian')), models.When(language__startswith='sr', then=django.contrib.postgres.search.SearchConfig('serbian')), models.When(language__startswith='sv', then=django.contrib.postgres.search.SearchConfig('swedish')), models.When(language__startswith='ta', then=django.contrib.postgres.search.SearchConfig('tamil')), models.When(language__startswith='tr', then=django.contrib.postgres.search.SearchConfig('turkish')), models.When(language__startswith='yi', then=django.contrib.postgres.search.SearchConfig('yiddish')), default=django.contrib.postgres.search.SearchConfig('simple'), output_field=models.TextField()))), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddIndex(
+            model_name='userreport',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='userreport_search_gin'),
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:29
+
+import django.db.models.deletion
+from django.conf import settings
+import math
+
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+# hazards.triage.triage_priority as of this migration, frozen here so later
+# changes to the formula do not change what this migration computes
+HALF_LIFE_SEC = 6 * 3600.0
+VERIFICATION_WEIGHTS = {-2: 0.05, -1: 0.2, 0: 0.6, 1: 1.0, 2: 1.0, 3: 1.2, 4: 1.5}
+
+
+def _percent(value):
+    value = 50 if value is None else value
+    return min(max(value, 1), 100) / 100.0
+
+
+def triage_priority(report, incident_size=1):
+    return (
+        math.log(_percent(report.severity))
+        + 0.5 * math.log(_percent(report.confidence))
+        + math.log(VERIFICATION_WEIGHTS.get(report.verification, 1.0))
+        + 0.5 * math.log(max(incident_size, 1))
+        + math.log(2) * report.created_at.timestamp() / HALF_LIFE_SEC
+    )
+
+
+def fill_priority(apps, schema_editor):
+    UserReport = apps.get_model('hazards', 'UserReport')
+    batch = []
+    queryset = UserReport.objects.select_related('incident').only(
+        'pk', 'severity', 'confidence', 'verification', 'created_at', 'incident__report_count'
+    )
+    for report in queryset.iterator(chunk_size=BATCH_SIZE):
+        size = report.incident.report_count if report.incident_id else 1
+        report.priority = triage_priority(report, size)
+        batch.append(report)
+        if len(batch) >= BATCH_SIZE:
+            UserReport.objects.bulk_update(batch, ['priority'])
+            batch = []
+    if batch:
+        UserReport.objects.bulk_update(batch, ['priority'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0009_geovideo_wave_features'),
+        ('hazards', '0011_userreport_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userreport',
+            name='claimed_at',
+            field=models.DateTimeField(default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name='userreport',
+            name='claimed_by',
+            field=models.ForeignKey(default=None, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='claimed_reports', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='userreport',
+            name='priority',
+            field=models.FloatField(default=0.0),
+        ),
+        migrations.AddIndex(
+            model_name='userreport',
+            index=models.Index(models.OrderBy(models.F('priority'), descending=True), condition=models.Q(('action_status__in', [0, 2]), ('claimed_by__isnull', True), ('duplicate_of__isnull', True), models.Q(('verification', -2), _negated=True)), name='userreport_triage_idx'),
+        ),
+        migrations.RunPython(fill_priority, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:31
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Build the indexes without blocking report inserts on a large table
+    atomic = False
+
+    dependencies = [
+        ('common', '0009_geovideo_wave_features'),
+        ('hazards', '0012_userreport_triage'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userreport',
+            name='plausibility',
+            field=models.PositiveSmallIntegerField(default=None, null=True),
+        ),
+        AddIndexConcurrently(
+            model_name='userreport',
+            index=models.Index(condition=models.Q(('action_status', 0), ('proccessed_data__isnull', True)), fields=['-plausibility', 'created_at'], name='userreport_pending_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='userreport',
+            index=models.Index(condition=models.Q(('verification__in', [0, 1, 2, 3]), models.Q(('action_status', 3), _negated=True)), fields=['-created_at'], name='userreport_unverified_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='userreport',
+            index=models.Index(fields=['-created_at'], name='userreport_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='userreport',
+            index=models.Index(fields=['verification', '-created_at'], name='userreport_verif_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='userreport',
+            index=models.Index(fields=['action_status', '-created_at'], name='userreport_status_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='userreport',
+            index=models.Index(fields=['type', '-created_at'], name='userreport_type_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='userreport',
+            index=models.Index(condition=models.Q(('severity__isnull', False)), fields=['type', '-severity'], name='userreport_type_severity_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations
+
+AUTOVACUUM_SQL = """
+ALTER TABLE hazards_userreport SET (
+    autovacuum_vacuum_scale_factor = 0.02,
+    autovacuum_analyze_scale_factor = 0.01
+);
+"""
+RESET_SQL = """
+ALTER TABLE hazards_userreport RESET (
+    autovacuum_vacuum_scale_factor,
+    autovacuum_analyze_scale_factor
+);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hazards", "0013_userreport_workflow_indexes"),
+    ]
+
+    operations = [
+        migrations.RunSQL(AUTOVACUUM_SQL, RESET_SQL),
+    ]
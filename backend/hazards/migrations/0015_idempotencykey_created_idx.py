@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:10
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # One row per keyed upload; build without blocking them
+    atomic = False
+
+    dependencies = [
+        ('hazards', '0014_userreport_autovacuum'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='idempotencykey',
+            index=models.Index(fields=['created_at'], name='idempotency_created_idx'),
+        ),
+    ]
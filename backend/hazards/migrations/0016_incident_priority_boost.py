@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:24
+
+from django.db import migrations, models
+
+# hazards.triage.incident_term as of this migration; the term moves from the
+# member priorities (see 0012) to the incident
+SPLIT_SQL = """
+UPDATE hazards_incident SET priority_boost = 0.5 * ln(greatest(report_count, 1));
+UPDATE hazards_userreport AS report SET priority = report.priority - incident.priority_boost
+FROM hazards_incident AS incident
+WHERE report.incident_id = incident.id AND incident.priority_boost <> 0;
+"""
+
+MERGE_SQL = """
+UPDATE hazards_userreport AS report SET priority = report.priority + incident.priority_boost
+FROM hazards_incident AS incident
+WHERE report.incident_id = incident.id AND incident.priority_boost <> 0;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hazards', '0015_idempotencykey_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incident',
+            name='priority_boost',
+            field=models.FloatField(default=0.0),
+        ),
+        migrations.RunSQL(SPLIT_SQL, MERGE_SQL),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:36
+
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # Drop the indexes without blocking report inserts on a large table
+    atomic = False
+
+    dependencies = [
+        ('hazards', '0016_incident_priority_boost'),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name='userreport',
+            name='userreport_verif_created_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='userreport',
+            name='userreport_status_created_idx',
+        ),
+    ]
@@ -1,16 +1,190 @@
+from datetime import timedelta
+from django.conf import settings
 from django.db import models
+from django.db.models import Case, F, When
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+from django.contrib.gis.db import models as gis_models
+from django.contrib.postgres.indexes import GinIndex, GistIndex, OpClass
+from django.contrib.postgres.search import SearchRank, SearchVectorField
 from common.models import (
     TimeStampedModel,
     hazardSet,
+    hazardGroupSet,
     actionStatusSet,
     GeoVideo,
     verificationStatusSet,
+    SENSOR_STREAMS,
 )
 from django.contrib.auth import get_user_model
 from common.AI.core import client as AIclient
 from common.AI import NLP
+from .search import report_search_query, report_search_vector
+from .triage import triage_priority
 import json
 
+MAP_FIELDS = (
+    "pk",
+    "type",
+    "user_submit_type",
+    "severity",
+    "confidence",
+    "verification",
+    "action_status",
+    "user_text",
+    "created_at",
+    "incident",
+    "geovideo__location",
+)
+
+# Unclaimed, not finished, not discarded; near-duplicates follow their original
+TRIAGE_QUEUE_CONDITION = models.Q(
+    claimed_by__isnull=True,
+    duplicate_of__isnull=True,
+    action_status__in=[actionStatusSet.TO_BE_STARTED, actionStatusSet.NEXT_STAGE],
+) & ~models.Q(verification=verificationStatusSet.DISCARDED)
+
+# Never classified; see pending_processing and userreport_pending_idx
+PENDING_CONDITION = models.Q(
+    proccessed_data__isnull=True, action_status=actionStatusSet.TO_BE_STARTED
+)
+
+# Still open and not yet confirmed or dismissed by anyone
+AWAITING_VERIFICATION_CONDITION = models.Q(
+    verification__in=[
+        verificationStatusSet.NOT_SYSTEM_PROCESSED,
+        verificationStatusSet.NOT_ACKNOWLEDGED,
+        verificationStatusSet.IN_PROGRESS,
+        verificationStatusSet.PERSONNEL_UNCONFIRMED,
+    ]
+) & ~models.Q(action_status=actionStatusSet.FINISH)
+
+# What process() produces, copied as is onto near-duplicate reports
+CLASSIFICATION_FIELDS = (
+    "proccessed_data",
+    "type",
+    "severity",
+    "confidence",
+    "language",
+)
+
+
+class IncidentQuerySet(models.QuerySet):
+    def raise_severity(self, severity: int) -> int:
+        """Atomic max_severity = max(max_severity, severity)."""
+        return self.update(
+            max_severity=Greatest(Coalesce(F("max_severity"), 0), severity)
+        )
+
+
+class Incident(TimeStampedModel):
+    """
+    Reports of a compatible hazard close together in space and time, grown one
+    report at a time by hazards.incidents.attach_to_incident.
+    """
+
+    hazard_group = models.PositiveSmallIntegerField(choices=hazardGroupSet)
+    # Running mean of member report locations
+    centroid = gis_models.PointField(geography=True)
+    report_count = models.PositiveIntegerField(default=0)
+    max_severity = models.PositiveSmallIntegerField(null=True, default=None)
+    # hazards.triage.incident_term(report_count), added to the priority of
+    # queued members when the triage queue is ordered
+    priority_boost = models.FloatField(default=0.0)
+    # Bounding box of member report locations in degrees
+    min_lon = models.FloatField()
+    min_lat = models.FloatField()
+    max_lon = models.FloatField()
+    max_lat = models.FloatField()
+    # Earliest and latest recording time (GeoVideo.timestamp_utc) of members
+    first_seen = models.DateTimeField()
+    last_seen = models.DateTimeField()
+
+    objects = IncidentQuerySet.as_manager()
+
+    class Meta(TimeStampedModel.Meta):
+        indexes = [
+            GistIndex(fields=["centroid"], name="incident_centroid_gix"),
+            models.Index(
+                fields=["hazard_group", "last_seen"], name="incident_group_seen_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_hazard_group_display()} x{self.report_count}"
+
+    @property
+    def extent(self):
+        """GeoJSON style bbox: [min_lon, min_lat, max_lon, max_lat]."""
+        return [self.min_lon, self.min_lat, self.max_lon, self.max_lat]
+
+
+class UserReportQuerySet(models.QuerySet):
+    def with_geovideo(self, *fields):
+        """
+        Join GeoVideo in the same query. Only ``fields`` are fetched from it
+        when given, otherwise everything except the sensor streams.
+        """
+        queryset = self.select_related("geovideo")
+        if not fields:
+            deferred = SENSOR_STREAMS
+        else:
+            deferred = [
+                field.name
+                for field in GeoVideo._meta.concrete_fields
+                if not field.primary_key and field.name not in fields
+            ]
+        return queryset.defer(*[f"geovideo__{name}" for name in deferred])
+
+    def pending_processing(self):
+        """Reports never classified, most credible first."""
+        return self.filter(PENDING_CONDITION).order_by("-plausibility", "created_at")
+
+    def awaiting_verification(self):
+        """Open, unconfirmed reports, newest first (userreport_unverified_idx)."""
+        return self.filter(AWAITING_VERIFICATION_CONDITION).order_by("-created_at")
+
+    def search(self, text, language=None):
+        """
+        Full-text match on user_text through the GIN indexed search_vector,
+        best ranked first.
+        """
+        query = report_search_query(text, language)
+        return (
+            self.filter(search_vector=query)
+            .annotate(rank=SearchRank(F("search_vector"), query))
+            .order_by("-rank", "-created_at")
+        )
+
+    def by_urgency(self):
+        """Own priority plus the incident's boost, most urgent first."""
+        return self.alias(
+            urgency=F("priority") + Coalesce(F("incident__priority_boost"), 0.0)
+        ).order_by("-urgency")
+
+    def triage_queue(self):
+        """
+        Reports waiting for a dispatcher, most urgent first. The filter
+        matches the partial userreport_triage_idx condition exactly; the
+        queue is sorted after joining the incident boosts.
+        """
+        return self.filter(TRIAGE_QUEUE_CONDITION).by_urgency()
+
+    def release(self):
+        """Return claimed reports to the triage queue."""
+        return self.update(
+            claimed_by=None,
+            claimed_at=None,
+            action_status=Case(
+                When(proccessed_data__isnull=True, then=actionStatusSet.TO_BE_STARTED),
+                default=actionStatusSet.NEXT_STAGE,
+            ),
+        )
+
+    def for_map(self):
+        """Just the columns the map feed renders."""
+        return self.select_related("geovideo").only(*MAP_FIELDS)
+
 
 class UserReport(TimeStampedModel):
     user_submit_type = models.IntegerField(
@@ -68,11 +242,106 @@ class UserReport(TimeStampedModel):
         default=None,
     )
     language = models.CharField(max_length=5, null=True, default=None, blank=False)
+    # sha256 of video hash + timestamp_utc + location, see ingest.report_fingerprint
+    fingerprint = models.CharField(
+        max_length=64, unique=True, null=True, default=None, editable=False
+    )
+
+    plausibility = models.PositiveSmallIntegerField(
+        # "Sensor/GPS based credibility between 0-100, see hazards.plausibility",
+        null=True,
+        default=None,
+    )
+    incident = models.ForeignKey(
+        Incident,
+        on_delete=models.SET_NULL,
+        null=True,
+        default=None,
+        related_name="reports",
+    )
+    # Original of a near-identical text sent nearby, see hazards.duplicates
+    duplicate_of = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        default=None,
+        related_name="duplicates",
+    )
+    # Dispatch urgency, see hazards.triage; only comparable, not meaningful
+    priority = models.FloatField(default=0.0)
+    claimed_by = models.ForeignKey(
+        get_user_model(),
+        on_delete=models.SET_NULL,
+        null=True,
+        default=None,
+        related_name="claimed_reports",
+    )
+    claimed_at = models.DateTimeField(null=True, default=None)
+    # Kept in sync by PostgreSQL itself, see hazards.search
+    search_vector = models.GeneratedField(
+        expression=report_search_vector(),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = UserReportQuerySet.as_manager()
+
+    class Meta(TimeStampedModel.Meta):
+        indexes = [
+            GinIndex(
+                OpClass("user_text", name="gin_trgm_ops"),
+                name="userreport_text_trgm_gin",
+            ),
+            GinIndex(fields=["search_vector"], name="userreport_search_gin"),
+            models.Index(
+                models.F("priority").desc(),
+                condition=TRIAGE_QUEUE_CONDITION,
+                name="userreport_triage_idx",
+            ),
+            models.Index(
+                fields=["-plausibility", "created_at"],
+                condition=PENDING_CONDITION,
+                name="userreport_pending_idx",
+            ),
+            models.Index(
+                fields=["-created_at"],
+                condition=AWAITING_VERIFICATION_CONDITION,
+                name="userreport_unverified_idx",
+            ),
+            # Admin list filters and time-bounded feeds, newest first. The
+            # open verification and action states have the partial indexes
+            # above; the common ones are found walking this one backwards
+            models.Index(fields=["-created_at"], name="userreport_created_idx"),
+            models.Index(
+                fields=["type", "-created_at"], name="userreport_type_created_idx"
+            ),
+            models.Index(
+                fields=["type", "-severity"],
+                condition=models.Q(severity__isnull=False),
+                name="userreport_type_severity_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.user_ip
 
+    def save(self, *args, **kwargs):
+        # created_at is only known once inserted; attach_to_incident sets the
+        # first priority right after
+        if self.created_at is not None:
+            self.priority = triage_priority(self)
+        super().save(*args, **kwargs)
+
     def process(self):
+        if self.duplicate_of_id is not None:
+            # Reuse the original's classification instead of asking the LLMs
+            original = self.duplicate_of
+            if original.proccessed_data is None:
+                original.process()
+            for field in CLASSIFICATION_FIELDS:
+                setattr(self, field, getattr(original, field))
+            self._classified()
+            return
         processed_data = []
         for model in NLP.MODELS:
             try:
@@ -148,5 +417,84 @@ class UserReport(TimeStampedModel):
         self.severity = final_severity
         self.confidence = final_confidence
         self.language = final_language
-        self.action_status = actionStatusSet.NEXT_STAGE
-        self.save()
+        self._classified()
+        self._classify_duplicates()
+
+    def _classify_duplicates(self):
+        # Duplicates that arrived meanwhile get the same result without LLM
+        # calls; each keeps its own priority (age, verification)
+        duplicates = list(
+            self.duplicates.filter(proccessed_data__isnull=True).only(
+                "pk", "created_at", "verification", "incident"
+            )
+        )
+        if not duplicates:
+            return
+        for duplicate in duplicates:
+            for field in CLASSIFICATION_FIELDS:
+                setattr(duplicate, field, getattr(self, field))
+            duplicate.priority = triage_priority(duplicate)
+        UserReport.objects.bulk_update(
+            duplicates, [*CLASSIFICATION_FIELDS, "priority"], batch_size=500
+        )
+        # Same rule as _classified: claimed or finished reports keep their status
+        pks = [duplicate.pk for duplicate in duplicates]
+        UserReport.objects.filter(
+            pk__in=pks, action_status=actionStatusSet.TO_BE_STARTED
+        ).update(action_status=actionStatusSet.NEXT_STAGE)
+        incidents = {duplicate.incident_id for duplicate in duplicates} - {None}
+        if incidents and self.severity is not None:
+            Incident.objects.filter(pk__in=incidents).raise_severity(self.severity)
+        # bulk_update sends no post_save
+        from .signals import invalidate_map_cache
+
+        invalidate_map_cache()
+
+    def _classified(self):
+        # Runs in the background: write only the classification, so a claim
+        # or status change made meanwhile survives, and compute the priority
+        # from the current verification
+        self.refresh_from_db(fields=["verification"])
+        self.save(update_fields=[*CLASSIFICATION_FIELDS, "priority"])
+        # Claimed or finished reports keep their status
+        if UserReport.objects.filter(
+            pk=self.pk, action_status=actionStatusSet.TO_BE_STARTED
+        ).update(action_status=actionStatusSet.NEXT_STAGE):
+            self.action_status = actionStatusSet.NEXT_STAGE
+        if self.incident_id is not None and self.severity is not None:
+            Incident.objects.filter(pk=self.incident_id).raise_severity(self.severity)
+
+
+class IdempotencyKeyQuerySet(models.QuerySet):
+    def expired(self):
+        """Keys older than IDEMPOTENCY_KEY_HOURS, no longer replayed."""
+        cutoff = timezone.now() - timedelta(hours=settings.IDEMPOTENCY_KEY_HOURS)
+        return self.filter(created_at__lt=cutoff)
+
+    def live(self):
+        cutoff = timezone.now() - timedelta(hours=settings.IDEMPOTENCY_KEY_HOURS)
+        return self.filter(created_at__gte=cutoff)
+
+
+class IdempotencyKey(TimeStampedModel):
+    """Stored response for a client supplied ``Idempotency-Key`` header."""
+
+    scope = models.CharField(max_length=64)  # "user:<pk>" or "ip:<address>"
+    key = models.CharField(max_length=255)
+    status_code = models.PositiveSmallIntegerField()
+    response = models.JSONField()
+
+    objects = IdempotencyKeyQuerySet.as_manager()
+
+    class Meta(TimeStampedModel.Meta):
+        constraints = [
+            models.UniqueConstraint(
+                fields=["scope", "key"], name="idempotency_scope_key_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["created_at"], name="idempotency_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.scope} {self.key}"
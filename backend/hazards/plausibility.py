@@ -0,0 +1,99 @@
+import math
+from datetime import datetime
+from typing import Optional
+from django.utils import timezone
+from common.models import GeoVideo, hazardSet
+
+# Handheld phones never sit this still; a phone on a desk rarely moves more
+ACCEL_STD_STILL = 0.03  # m/s²
+ACCEL_STD_HANDHELD = 0.3
+GYRO_MAX_STILL = 0.5  # deg/s
+GYRO_MAX_HANDHELD = 10.0
+GPS_ACCURACY_GOOD = 20.0  # m
+GPS_ACCURACY_USELESS = 2000.0
+MAX_PLAUSIBLE_SPEED = 70.0  # m/s, faster than any road or boat a reporter is on
+FUTURE_SKEW_TOLERANCE = 300.0  # s of client clock drift
+SKEW_HALF_LIFE = 2 * 24 * 3600.0  # offline batches may upload days later
+
+COAST_NEAR = 2_000.0  # m, anything this close to the sea is plausible
+COAST_FAR = 50_000.0  # m, a tsunami or surge report this far inland is not
+# Hazards that only happen at the sea
+COASTAL_HAZARDS = {
+    hazardSet.TIDE,
+    hazardSet.COASTAL_DAMAGE,
+    hazardSet.FLOODING,
+    hazardSet.WAVES,
+    hazardSet.SWELL,
+    hazardSet.SURGE,
+    hazardSet.TSUNAMI,
+}
+
+WEIGHTS = {"motion": 0.4, "gps": 0.25, "freshness": 0.35}
+COAST_WEIGHT = 0.25  # share taken from the others when coast distance applies
+
+
+def _ramp(value: float, low: float, high: float) -> float:
+    """0 at ``low``, 1 at ``high``, linear on a log scale in between."""
+    if value <= low:
+        return 0.0
+    if value >= high:
+        return 1.0
+    return math.log(value / low) / math.log(high / low)
+
+
+def motion_score(geovideo: GeoVideo) -> float:
+    scores = []
+    if geovideo.accel_std is not None:
+        scores.append(_ramp(geovideo.accel_std, ACCEL_STD_STILL, ACCEL_STD_HANDHELD))
+    if geovideo.gyro_max is not None:
+        scores.append(_ramp(geovideo.gyro_max, GYRO_MAX_STILL, GYRO_MAX_HANDHELD))
+    return max(scores) if scores else 0.5
+
+
+def gps_score(geovideo: GeoVideo) -> float:
+    if geovideo.gps_accuracy is None:
+        return 0.5
+    return 1.0 - _ramp(
+        max(geovideo.gps_accuracy, 1e-3), GPS_ACCURACY_GOOD, GPS_ACCURACY_USELESS
+    )
+
+
+def freshness_score(geovideo: GeoVideo, received_at: datetime) -> float:
+    skew = (received_at - geovideo.timestamp_utc).total_seconds()
+    if skew < -FUTURE_SKEW_TOLERANCE:
+        return 0.0  # recorded in the future
+    return 0.5 ** (max(skew, 0.0) / SKEW_HALF_LIFE)
+
+
+def coast_score(geovideo: GeoVideo) -> Optional[float]:
+    """None when no coastline is loaded; 0 beyond MAX_SEARCH_DEG."""
+    if geovideo.coast_class is None:
+        return None
+    if geovideo.coast_distance_m is None:
+        return 0.0
+    return 1.0 - _ramp(max(geovideo.coast_distance_m, 1.0), COAST_NEAR, COAST_FAR)
+
+
+def plausibility_score(
+    geovideo: GeoVideo,
+    received_at: Optional[datetime] = None,
+    hazard: Optional[int] = None,
+) -> int:
+    """
+    Cheap 0-100 credibility estimate from sensor stats, GPS quality, speed
+    and recording time against arrival time, plus distance to the sea for
+    sea hazards. Used to order and gate LLM classification, never to reject a
+    report.
+    """
+    if geovideo.speed is not None and geovideo.speed > MAX_PLAUSIBLE_SPEED:
+        return 0
+    received_at = received_at or timezone.now()
+    score = (
+        WEIGHTS["motion"] * motion_score(geovideo)
+        + WEIGHTS["gps"] * gps_score(geovideo)
+        + WEIGHTS["freshness"] * freshness_score(geovideo, received_at)
+    )
+    coast = coast_score(geovideo) if hazard in COASTAL_HAZARDS else None
+    if coast is not None:
+        score = (1 - COAST_WEIGHT) * score + COAST_WEIGHT * coast
+    return int(round(100 * score))
@@ -0,0 +1,70 @@
+from typing import Optional
+from django.contrib.postgres.search import SearchConfig, SearchQuery, SearchVector
+from django.db.models import Case, TextField, When
+
+# ISO 639-1 (as detected by the NLP ensemble) -> built-in PostgreSQL text
+# search configuration. Languages without a stemmer fall back to "simple".
+SEARCH_CONFIGS = {
+    "ar": "arabic",
+    "ca": "catalan",
+    "da": "danish",
+    "de": "german",
+    "el": "greek",
+    "en": "english",
+    "es": "spanish",
+    "eu": "basque",
+    "fi": "finnish",
+    "fr": "french",
+    "ga": "irish",
+    "hu": "hungarian",
+    "hy": "armenian",
+    "id": "indonesian",
+    "it": "italian",
+    "lt": "lithuanian",
+    "ne": "nepali",
+    "nl": "dutch",
+    "no": "norwegian",
+    "pt": "portuguese",
+    "ro": "romanian",
+    "ru": "russian",
+    "sr": "serbian",
+    "sv": "swedish",
+    "ta": "tamil",
+    "tr": "turkish",
+    "yi": "yiddish",
+}
+DEFAULT_CONFIG = "simple"
+
+
+def search_config(language: Optional[str]) -> str:
+    return SEARCH_CONFIGS.get((language or "").strip().lower()[:2], DEFAULT_CONFIG)
+
+
+def report_search_vector() -> SearchVector:
+    """
+    user_text stemmed with the report's own language (weight A) plus the
+    unstemmed "simple" lexemes (weight B), so names, places and text in
+    languages without a stemmer still match. Only immutable expressions, so
+    it can back a stored generated column: every branch is a regconfig
+    literal, as a text -> regconfig cast at runtime is not immutable.
+    """
+    language_config = Case(
+        *[
+            When(language__startswith=code, then=SearchConfig(config))
+            for code, config in SEARCH_CONFIGS.items()
+        ],
+        default=SearchConfig(DEFAULT_CONFIG),
+        output_field=TextField(),
+    )
+    return SearchVector("user_text", config=language_config, weight="A") + SearchVector(
+        "user_text", config=DEFAULT_CONFIG, weight="B"
+    )
+
+
+def report_search_query(text: str, language: Optional[str] = None) -> SearchQuery:
+    """websearch syntax ("seawall breach" -flood) in both configurations."""
+    query = SearchQuery(text, config=DEFAULT_CONFIG, search_type="websearch")
+    config = search_config(language)
+    if config != DEFAULT_CONFIG:
+        query |= SearchQuery(text, config=config, search_type="websearch")
+    return query
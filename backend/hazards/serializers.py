@@ -0,0 +1,185 @@
+import json
+import threading
+import numpy as np
+from rest_framework import serializers
+from django.contrib.gis.geos import GEOSGeometry, GEOSException
+from common.models import hazardSet
+
+
+class JSONStringMixin:
+    """Accept nested objects sent as JSON strings in multipart form fields."""
+
+    def to_internal_value(self, data):
+        if isinstance(data, str):
+            try:
+                data = json.loads(data)
+            except ValueError:
+                raise serializers.ValidationError("Invalid JSON.")
+        return super().to_internal_value(data)
+
+
+class ThreadFieldsMixin:
+    """
+    DRF deep-copies every declared field for each serializer instance, which
+    dominates validation time for a payload this wide. These validate-only
+    serializers (no context, no partial updates) keep one bound copy per
+    class and thread instead, bound to a throwaway instance of that thread.
+    A thread validates one payload at a time, so concurrent requests never
+    share a field.
+    """
+
+    _thread = threading.local()
+
+    @property
+    def fields(self):
+        copies = self._thread.__dict__.setdefault("fields", {})
+        cls = type(self)
+        if cls not in copies:
+            copies[cls] = super(ThreadFieldsMixin, cls()).fields
+        return copies[cls]
+
+
+class PointField(serializers.Field):
+    """WKT point, e.g. 'POINT(-73.985 40.748)', as a GEOS geometry."""
+
+    default_error_messages = {
+        "invalid": "A WKT point is required.",
+        "out_of_range": "Coordinates must be valid WGS84 longitude/latitude.",
+    }
+
+    def to_internal_value(self, data):
+        try:
+            point = GEOSGeometry(data) if isinstance(data, str) else None
+        except (ValueError, GEOSException):
+            point = None
+        if point is None or point.geom_type != "Point" or point.empty:
+            self.fail("invalid")
+        if not (-180 <= point.x <= 180 and -90 <= point.y <= 90):
+            self.fail("out_of_range")
+        return point
+
+    def to_representation(self, value):
+        return value.wkt
+
+
+class SensorStreamField(serializers.Field):
+    """
+    Array of fixed-width readings, e.g. [[x, y, z, t], ...]. Parsed once into a
+    float64 array so shape and finiteness are checked by NumPy, not per element.
+    """
+
+    default_error_messages = {
+        "invalid": "Expected an array of numeric readings.",
+        "shape": "Each reading must have exactly {width} values.",
+        "not_finite": "Readings must be finite numbers.",
+    }
+
+    def __init__(self, width, **kwargs):
+        self.width = width
+        kwargs.setdefault("required", False)
+        super().__init__(**kwargs)
+
+    def get_default(self):
+        return np.empty((0, self.width))
+
+    def run_validation(self, data=serializers.empty):
+        if data is None:  # sensor not available on the device
+            return self.get_default()
+        return super().run_validation(data)
+
+    def to_internal_value(self, data):
+        try:
+            array = np.asarray(data, dtype=np.float64)
+        except (TypeError, ValueError):
+            self.fail("invalid")
+        if array.size == 0:
+            return np.empty((0, self.width))
+        if array.ndim != 2 or array.shape[1] != self.width:
+            self.fail("shape", width=self.width)
+        if not np.isfinite(array).all():
+            self.fail("not_finite")
+        return array
+
+    def to_representation(self, value):
+        return np.asarray(value).tolist()
+
+
+class GeoVideoPayloadSerializer(
+    ThreadFieldsMixin, JSONStringMixin, serializers.Serializer
+):
+    device_model = serializers.CharField(
+        max_length=255, allow_blank=True, required=False, default=""
+    )
+    software_info = serializers.CharField(
+        max_length=255, allow_blank=True, required=False, default=""
+    )
+    location = PointField()
+    altitude = serializers.FloatField(allow_null=True, required=False, default=None)
+    gps_accuracy = serializers.FloatField(
+        min_value=0, allow_null=True, required=False, default=None
+    )
+    speed = serializers.FloatField(allow_null=True, required=False, default=None)
+    direction = serializers.FloatField(allow_null=True, required=False, default=None)
+    gps_fix_type = serializers.CharField(
+        max_length=50, allow_null=True, allow_blank=True, required=False, default=None
+    )
+    num_satellites = serializers.IntegerField(
+        min_value=0, allow_null=True, required=False, default=None
+    )
+    timestamp_utc = serializers.DateTimeField()
+
+    orientation_roll = serializers.FloatField(
+        allow_null=True, required=False, default=None
+    )
+    orientation_pitch = serializers.FloatField(
+        allow_null=True, required=False, default=None
+    )
+    orientation_yaw = serializers.FloatField(
+        allow_null=True, required=False, default=None
+    )
+
+    resolution = serializers.CharField(
+        max_length=50, allow_null=True, allow_blank=True, required=False, default=None
+    )
+    frame_rate = serializers.FloatField(allow_null=True, required=False, default=None)
+    aperture = serializers.FloatField(allow_null=True, required=False, default=None)
+    iso = serializers.IntegerField(allow_null=True, required=False, default=None)
+    lens = serializers.CharField(
+        max_length=100, allow_null=True, allow_blank=True, required=False, default=None
+    )
+
+    accelerometer = SensorStreamField(width=4)
+    gyroscope = SensorStreamField(width=4)
+    magnetometer = SensorStreamField(width=4)
+    barometer = SensorStreamField(width=2)
+    orientation_series = SensorStreamField(width=4)
+
+    duration_sec = serializers.FloatField(
+        min_value=0, allow_null=True, required=False, default=None
+    )
+
+
+class ClientInfoSerializer(ThreadFieldsMixin, JSONStringMixin, serializers.Serializer):
+    userAgent = serializers.CharField(allow_blank=True, required=False, default="")
+    platform = serializers.CharField(allow_blank=True, required=False, default="")
+    language = serializers.CharField(allow_blank=True, required=False, default="")
+
+
+class ReportPayloadSerializer(ThreadFieldsMixin, serializers.Serializer):
+    user_submit_type = serializers.ChoiceField(choices=hazardSet.choices)
+    user_text = serializers.CharField()
+    user_video = serializers.FileField()
+    geovideo = GeoVideoPayloadSerializer()
+    client_info = ClientInfoSerializer(required=False, default=dict)
+
+
+class ReportSearchSerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=200)
+    lang = serializers.CharField(max_length=5, required=False, default="en")
+    type = serializers.ChoiceField(choices=hazardSet.choices, required=False)
+    near = PointField(required=False)
+    radius_m = serializers.FloatField(min_value=1, max_value=500_000, default=5000)
+    since = serializers.DateTimeField(required=False)
+    until = serializers.DateTimeField(required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=200, default=50)
+    offset = serializers.IntegerField(min_value=0, default=0)
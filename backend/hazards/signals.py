@@ -1,7 +1,34 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.db import transaction
-from .models import UserReport
+from django.conf import settings
+from common.background import run_in_background
+from common.cache import invalidate_namespace
+from common.models import GeoVideo
+from .models import Incident, UserReport
+
+
+def invalidate_map_cache():
+    """
+    Drop the cached map feeds (maps.views.map_cache) once committed, at most
+    once per MAP_INVALIDATE_SECONDS: a surge saves each report several times
+    and would otherwise empty the cache on every save. Changes in between
+    show up when the entries expire (MAP_CACHE_SECONDS).
+    """
+    transaction.on_commit(
+        lambda: invalidate_namespace("map", debounce=settings.MAP_INVALIDATE_SECONDS),
+        robust=True,
+    )
+
+
+@receiver(post_save, sender=UserReport)
+@receiver(post_delete, sender=UserReport)
+@receiver(post_save, sender=GeoVideo)
+@receiver(post_delete, sender=GeoVideo)
+@receiver(post_save, sender=Incident)
+@receiver(post_delete, sender=Incident)
+def on_map_data_changed(sender, **kwargs):
+    invalidate_map_cache()
 
 
 @receiver(post_save, sender=UserReport)
@@ -9,8 +36,41 @@ def on_userreport_created(sender, instance: UserReport, created: bool, **kwargs)
     if not created:
         return
 
-    transaction.on_commit(lambda: run_proccessing(instance))
+    # The LLM calls take seconds; answer the upload first
+    transaction.on_commit(lambda: run_in_background(run_proccessing, instance))
+
+
+def enqueue_processing(reports: list[UserReport]):
+    """
+    Schedule classification for reports inserted with bulk_create, which does
+    not send post_save. The whole batch is handed off in a single callback.
+    """
+    invalidate_map_cache()
+    transaction.on_commit(lambda: run_in_background(run_batch_processing, reports))
+
+
+def should_process_now(userreport: UserReport) -> bool:
+    """
+    Implausible reports (phone lying still, no GPS, stale recording) are left
+    for `manage.py process_pending_reports` so LLM capacity goes to credible
+    ones first. Near-duplicates wait for their original, whose classification
+    is copied onto them when it finishes.
+    """
+    if userreport.duplicate_of_id is not None:
+        return userreport.duplicate_of.proccessed_data is not None
+    return (
+        userreport.plausibility is None
+        or userreport.plausibility >= settings.REPORT_PLAUSIBILITY_THRESHOLD
+    )
 
 
 def run_proccessing(userreport: UserReport):
-    userreport.process()
+    if should_process_now(userreport):
+        userreport.process()
+
+
+def run_batch_processing(userreports: list[UserReport]):
+    for userreport in sorted(
+        userreports, key=lambda report: report.plausibility or 0, reverse=True
+    ):
+        run_proccessing(userreport)
@@ -0,0 +1,144 @@
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from common.models import SENSOR_STREAMS, GeoVideo, actionStatusSet, hazardSet
+from common.sensors import apply_sensors
+from .models import UserReport
+
+
+def create_report(text="seawall breach near the harbour road"):
+    readings = np.arange(40, dtype=np.float32).reshape(10, 4)
+    geovideo = GeoVideo.objects.create(
+        location=Point(80.27, 13.08, srid=4326),
+        timestamp_utc=timezone.now(),
+        video_file="report_videos/test.mp4",
+        accelerometer=readings,
+        gyroscope=readings,
+        magnetometer=readings,
+        barometer=readings[:, :2],
+        orientation_series=readings,
+    )
+    return UserReport.objects.create(
+        geovideo=geovideo,
+        user_submit_type=hazardSet.FLOODING,
+        user_text=text,
+        user_ip="127.0.0.1",
+        user_userAgent="test",
+        user_platform="test",
+        user_device_language="en",
+    )
+
+
+class SensorColumnsTests(TestCase):
+    """List and feed endpoints must never load the packed sensor streams."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.report = create_report()
+        cls.admin = get_user_model().objects.create_user(
+            "admin", "admin@example.com", "0000000000", is_staff=True
+        )
+
+    def setUp(self):
+        cache.clear()  # the map feed would otherwise be served without a query
+        self.client.force_login(self.admin)
+
+    def assertNoSensorColumns(self, queries):
+        table = GeoVideo._meta.db_table
+        for query in queries:
+            for stream in SENSOR_STREAMS:
+                self.assertNotIn(f'"{table}"."{stream}"', query["sql"])
+            self.assertNotIn("geovideoarchive", query["sql"])
+
+    def get(self, url, **params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(context.captured_queries)
+        self.assertNoSensorColumns(context.captured_queries)
+        return response
+
+    def test_map_feed(self):
+        response = self.get(reverse("geovideos_geojson"))
+        ids = [feature["properties"]["id"] for feature in response.json()["features"]]
+        self.assertEqual(ids, [self.report.pk])
+
+    def test_triage_queue(self):
+        response = self.get(reverse("triage-queue"))
+        self.assertEqual(
+            [item["id"] for item in response.json()["results"]], [self.report.pk]
+        )
+
+    def test_search(self):
+        response = self.get(reverse("user-report-search"), q="seawall")
+        self.assertEqual(
+            [item["id"] for item in response.json()["results"]], [self.report.pk]
+        )
+
+    def test_with_geovideo(self):
+        with CaptureQueriesContext(connection) as context:
+            reports = list(UserReport.objects.with_geovideo())
+            reports[0].geovideo.location
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertNoSensorColumns(context.captured_queries)
+
+
+class ApplySensorsTests(SimpleTestCase):
+    """Readings of the wrong width are dropped, not rejected."""
+
+    def test_malformed_readings_are_dropped(self):
+        geovideo = GeoVideo()
+        apply_sensors(
+            geovideo,
+            {
+                "accelerometer": [[3, 4, 0, 0], [1, 2, 3], [0, 0, 5, 1]],
+                "barometer": [[1000, 0], [1001]],
+            },
+            duration_sec=1,
+        )
+        self.assertEqual(geovideo.accelerometer.shape, (2, 4))
+        self.assertEqual(geovideo.accel_max, 5)
+        self.assertEqual(geovideo.accel_mean, 5)
+        self.assertEqual(geovideo.barometer.shape, (1, 2))
+        self.assertEqual(geovideo.baro_mean, 1000)
+        self.assertEqual(geovideo.gyroscope.shape, (0, 4))
+        self.assertIsNone(geovideo.gyro_mean)
+
+
+class DuplicateClassificationTests(TestCase):
+    """Duplicates copy their original's classification, keep their own claim."""
+
+    def test_classify_duplicates(self):
+        original = create_report()
+        waiting = create_report()
+        claimed = create_report()
+        UserReport.objects.filter(pk__in=[waiting.pk, claimed.pk]).update(
+            duplicate_of=original
+        )
+        UserReport.objects.filter(pk=claimed.pk).update(
+            action_status=actionStatusSet.IN_PROGRESS
+        )
+        original.proccessed_data = []
+        original.type = hazardSet.FLOODING
+        original.severity = 90
+        original.confidence = 80
+        original.language = "en"
+        original.save()
+        before = UserReport.objects.get(pk=waiting.pk).priority
+        with self.captureOnCommitCallbacks() as callbacks:
+            original._classify_duplicates()
+        self.assertTrue(callbacks)  # the map cache is invalidated
+        waiting.refresh_from_db()
+        claimed.refresh_from_db()
+        for report in (waiting, claimed):
+            self.assertEqual(report.severity, 90)
+            self.assertEqual(report.proccessed_data, [])
+        self.assertGreater(waiting.priority, before)
+        self.assertEqual(waiting.action_status, actionStatusSet.NEXT_STAGE)
+        self.assertEqual(claimed.action_status, actionStatusSet.IN_PROGRESS)
@@ -0,0 +1,49 @@
+import math
+from typing import Optional
+from common.models import verificationStatusSet
+
+# Priority is kept in log space so that the recency term can be a plain
+# function of created_at: ordering by
+#   log(urgency) + ln2 * created_at / HALF_LIFE
+# is the same as ordering by urgency * 0.5 ** (age / HALF_LIFE) at any moment,
+# so the stored, indexed score never needs to be recomputed as reports age.
+HALF_LIFE_SEC = 6 * 3600.0
+DEFAULT_SCORE = 50  # severity/confidence of a report not classified yet
+CONFIDENCE_WEIGHT = 0.5
+INCIDENT_WEIGHT = 0.5  # x2 incident size ~ x1.41 urgency
+
+VERIFICATION_WEIGHTS = {
+    verificationStatusSet.DISCARDED: 0.05,
+    verificationStatusSet.NOT_SEVERE: 0.2,
+    verificationStatusSet.NOT_SYSTEM_PROCESSED: 0.6,
+    verificationStatusSet.NOT_ACKNOWLEDGED: 1.0,
+    verificationStatusSet.IN_PROGRESS: 1.0,
+    verificationStatusSet.PERSONNEL_UNCONFIRMED: 1.2,
+    verificationStatusSet.VERIFIED: 1.5,
+}
+
+
+def _percent(value: Optional[int]) -> float:
+    value = DEFAULT_SCORE if value is None else value
+    return min(max(value, 1), 100) / 100.0
+
+
+def incident_term(size: int) -> float:
+    return INCIDENT_WEIGHT * math.log(max(size, 1))
+
+
+def triage_priority(report) -> float:
+    """
+    Dispatch priority of ``report`` on its own: severity, confidence and
+    verification status, decaying with age. Higher is more urgent. The size
+    of its incident is kept on the incident (Incident.priority_boost, see
+    incident_term) and added when the queue is ordered, so a growing
+    incident updates one row instead of every member. Needs created_at, so
+    compute it after the first save.
+    """
+    return (
+        math.log(_percent(report.severity))
+        + CONFIDENCE_WEIGHT * math.log(_percent(report.confidence))
+        + math.log(VERIFICATION_WEIGHTS.get(report.verification, 1.0))
+        + math.log(2) * report.created_at.timestamp() / HALF_LIFE_SEC
+    )
@@ -2,12 +2,29 @@ from rest_framework import views, status
 from rest_framework.response import Response
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from common.models import GeoVideo
+from common.models import GeoVideo, actionStatusSet
+from common.routers import read_replica
 from .models import UserReport
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 import json
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.contrib.gis.measure import D
 from django.shortcuts import render
-from common.sensors import process_and_store_sensors
+from django.utils import timezone
+from .ingest import (
+    build_geovideo,
+    build_report,
+    discard_videos,
+    existing_report_ids,
+    remember_idempotent,
+    replay_idempotent,
+    report_fingerprint,
+)
+from .serializers import ReportPayloadSerializer, ReportSearchSerializer
+from .signals import enqueue_processing
+from .incidents import attach_all
 
 geovideo_schema = openapi.Schema(
     type=openapi.TYPE_OBJECT,
@@ -177,6 +194,16 @@ client_info_schema = openapi.Schema(
 )
 
 
+idempotency_key_parameter = openapi.Parameter(
+    "Idempotency-Key",
+    openapi.IN_HEADER,
+    type=openapi.TYPE_STRING,
+    required=False,
+    description="Client generated key; retries with the same key replay the "
+    "stored response instead of creating another report.",
+)
+
+
 def render_report(request):
     return render(request, "reporting.html")
 
@@ -209,73 +236,383 @@ class UserReportCreateView(views.APIView):
             },
             required=["user_submit_type", "user_text", "user_video", "geovideo"],
         ),
-        responses={201: openapi.Response("Created")},
+        manual_parameters=[idempotency_key_parameter],
+        responses={
+            201: openapi.Response("Created"),
+            200: openapi.Response("Duplicate of an existing report"),
+        },
     )
     def post(self, request, *args, **kwargs):
-        # validate only the simple fields, not nested geovideo
-        basic_fields = {
-            "user_submit_type": request.data.get("user_submit_type"),
-            "user_text": request.data.get("user_text"),
-            "user_video": request.data.get("user_video"),
-        }
-        if not all(basic_fields.values()):
+        replayed = replay_idempotent(request)
+        if replayed is not None:
+            return replayed
+
+        # Multipart bodies arrive as a QueryDict; nested objects are JSON strings
+        payload = request.data
+        if hasattr(payload, "dict"):
+            payload = payload.dict()
+        serializer = ReportPayloadSerializer(data=payload)
+        if not serializer.is_valid():
             return Response(
-                {"error": "Missing required fields"}, status=status.HTTP_400_BAD_REQUEST
+                {"error": "Invalid report", "errors": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST,
             )
+        data = serializer.validated_data
+        geovideo_data = data["geovideo"]
+        user_video = data["user_video"]
 
-        geovideo_data = request.data.get("geovideo")
-        client_info = request.data.get("client_info")
-
-        if isinstance(geovideo_data, str):
-            geovideo_data = json.loads(geovideo_data)
-        if isinstance(client_info, str):
-            client_info = json.loads(client_info)
-
-        user_video = request.data.get("user_video")
-
-        geovideo = GeoVideo.objects.create(
-            video_file=user_video,
-            device_model=geovideo_data.get("device_model", ""),
-            software_info=geovideo_data.get("software_info", ""),
-            location=geovideo_data.get("location"),
-            altitude=geovideo_data.get("altitude"),
-            gps_accuracy=geovideo_data.get("gps_accuracy"),
-            speed=geovideo_data.get("speed"),
-            direction=geovideo_data.get("direction"),
-            gps_fix_type=geovideo_data.get("gps_fix_type"),
-            num_satellites=geovideo_data.get("num_satellites"),
-            timestamp_utc=geovideo_data.get("timestamp_utc"),
-            orientation_roll=geovideo_data.get("orientation_roll"),
-            orientation_pitch=geovideo_data.get("orientation_pitch"),
-            orientation_yaw=geovideo_data.get("orientation_yaw"),
-            resolution=geovideo_data.get("resolution"),
-            frame_rate=geovideo_data.get("frame_rate"),
-            aperture=geovideo_data.get("aperture"),
-            iso=geovideo_data.get("iso"),
-            lens=geovideo_data.get("lens"),
-            duration_sec=geovideo_data.get("duration_sec"),
+        # Exact resubmissions cost one indexed lookup instead of a full ingest
+        fingerprint = report_fingerprint(user_video, geovideo_data)
+        duplicate_id = existing_report_ids([fingerprint]).get(fingerprint)
+        if duplicate_id is None:
+            geovideo = build_geovideo(geovideo_data, user_video)
+            try:
+                with transaction.atomic():
+                    geovideo.save()
+                    report = build_report(
+                        geovideo, data, data["client_info"], request, fingerprint
+                    )
+                    report.save()
+            except IntegrityError:
+                discard_videos([geovideo])
+                duplicate_id = existing_report_ids([fingerprint]).get(fingerprint)
+                if duplicate_id is None:
+                    raise
+            else:
+                # Own short transaction, after the video is stored
+                attach_all([report])
+        if duplicate_id is not None:
+            return remember_idempotent(
+                request,
+                Response(
+                    {"id": duplicate_id, "status": "duplicate"},
+                    status=status.HTTP_200_OK,
+                ),
+            )
+
+        return remember_idempotent(
+            request,
+            Response(
+                {"id": report.pk, "status": "created"}, status=status.HTTP_201_CREATED
+            ),
         )
 
-        # Process and save sensors
-        process_and_store_sensors(
-            geovideo,
-            raw_streams=geovideo_data,
-            duration_sec=geovideo_data.get("duration_sec"),
+
+class UserReportBatchCreateView(views.APIView):
+    """
+    Offline sync: many queued reports in one multipart request. ``reports`` is
+    a JSON array; each item names the multipart file part holding its video.
+    """
+
+    parser_classes = [MultiPartParser, FormParser]
+    max_batch_size = 50
+
+    @swagger_auto_schema(
+        operation_description="Submit several queued hazard reports at once. "
+        "Each item's `video` names the multipart file part carrying its video.",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "reports": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(
+                        type=openapi.TYPE_OBJECT,
+                        properties={
+                            "user_submit_type": openapi.Schema(
+                                type=openapi.TYPE_INTEGER, description="Hazard type"
+                            ),
+                            "user_text": openapi.Schema(
+                                type=openapi.TYPE_STRING, description="User text"
+                            ),
+                            "video": openapi.Schema(
+                                type=openapi.TYPE_STRING,
+                                description="Name of the multipart file part",
+                            ),
+                            "geovideo": geovideo_schema,
+                            "client_info": client_info_schema,
+                        },
+                        required=["user_submit_type", "user_text", "video", "geovideo"],
+                    ),
+                ),
+            },
+            required=["reports"],
+        ),
+        responses={
+            201: openapi.Response("All reports created"),
+            207: openapi.Response("Some reports rejected, see per-item results"),
+            400: openapi.Response("No report could be created"),
+        },
+        manual_parameters=[idempotency_key_parameter],
+    )
+    def post(self, request, *args, **kwargs):
+        replayed = replay_idempotent(request)
+        if replayed is not None:
+            return replayed
+
+        try:
+            items = json.loads(request.data.get("reports") or "null")
+        except ValueError:
+            items = None
+        if not isinstance(items, list) or not items:
+            return Response(
+                {"error": "`reports` must be a non-empty JSON array"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(items) > self.max_batch_size:
+            return Response(
+                {"error": f"At most {self.max_batch_size} reports per batch"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        results = []
+        accepted = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                results.append(
+                    {"index": index, "status": "invalid", "errors": ["Not an object"]}
+                )
+                continue
+            serializer = ReportPayloadSerializer(
+                data={**item, "user_video": request.FILES.get(item.get("video") or "")}
+            )
+            if not serializer.is_valid():
+                results.append(
+                    {"index": index, "status": "invalid", "errors": serializer.errors}
+                )
+                continue
+            item = serializer.validated_data
+            results.append({"index": index, "status": "created"})
+            fingerprint = report_fingerprint(item["user_video"], item["geovideo"])
+            accepted.append((results[-1], item, item["user_video"], fingerprint))
+
+        # Drop items already stored by an earlier sync or repeated in this batch
+        existing = existing_report_ids([fp for *_, fp in accepted])
+        first_seen = {}
+        pending = []
+        for result, item, video, fingerprint in accepted:
+            if fingerprint in existing:
+                result.update(status="duplicate", id=existing[fingerprint])
+            elif fingerprint in first_seen:
+                result["status"] = "duplicate"
+                first_seen[fingerprint].setdefault("duplicates", []).append(result)
+            else:
+                first_seen[fingerprint] = result
+                pending.append((result, item, video, fingerprint))
+
+        while pending:
+            try:
+                reports = self.store(request, pending)
+            except IntegrityError:
+                # A concurrent sync stored some of the same reports first
+                existing = existing_report_ids([fp for *_, fp in pending])
+                if not existing:
+                    raise
+                for result, *_, fingerprint in pending:
+                    if fingerprint in existing:
+                        result.update(status="duplicate", id=existing[fingerprint])
+                        for duplicate in result.pop("duplicates", []):
+                            duplicate["id"] = existing[fingerprint]
+                pending = [entry for entry in pending if entry[3] not in existing]
+                continue
+            attach_all(reports)
+            for report, (result, *_) in zip(reports, pending):
+                result["id"] = report.pk
+                for duplicate in result.pop("duplicates", []):
+                    duplicate["id"] = report.pk
+            break
+
+        if len(accepted) == len(items):
+            response_status = status.HTTP_201_CREATED
+        elif accepted:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+        return remember_idempotent(
+            request, Response({"results": results}, status=response_status)
         )
 
-        report = UserReport.objects.create(
-            geovideo=geovideo,
-            user_submit_type=basic_fields["user_submit_type"],
-            user_text=basic_fields["user_text"],
-            user_ip=request.META.get(
-                "HTTP_X_FORWARDED_FOR", request.META.get("REMOTE_ADDR")
+    def store(self, request, pending) -> list[UserReport]:
+        geovideos = [
+            build_geovideo(item["geovideo"], video) for _, item, video, _ in pending
+        ]
+        try:
+            with transaction.atomic():
+                GeoVideo.objects.bulk_create(geovideos)
+                reports = UserReport.objects.bulk_create(
+                    [
+                        build_report(
+                            geovideo, item, item["client_info"], request, fingerprint
+                        )
+                        for geovideo, (_, item, _, fingerprint) in zip(
+                            geovideos, pending
+                        )
+                    ]
+                )
+                enqueue_processing(reports)
+        except IntegrityError:
+            # Nothing was inserted; the retry stores the remaining videos anew
+            discard_videos(geovideos)
+            raise
+        return reports
+
+
+def report_summary(report: UserReport) -> dict:
+    """Fields analysts and dispatchers see, from a for_map() row."""
+    location = report.geovideo.location
+    return {
+        "id": report.pk,
+        "type": report.type or report.user_submit_type,
+        "severity": report.severity,
+        "confidence": report.confidence,
+        "verification": report.verification,
+        "action_status": report.action_status,
+        "desc": report.user_text,
+        "created_at": report.created_at.isoformat(),
+        "incident": report.incident_id,
+        "location": [location.x, location.y],
+    }
+
+
+class UserReportSearchView(views.APIView):
+    """Ranked full-text search over report descriptions for analysts."""
+
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Full-text search over report descriptions, "
+        "best match first. q uses web search syntax: quoted phrases, OR, -word. "
+        "Combine with type, near + radius_m and since/until filters.",
+        query_serializer=ReportSearchSerializer,
+        responses={
+            200: openapi.Response("Matching reports"),
+            400: openapi.Response("Invalid filters"),
+        },
+    )
+    @read_replica()
+    def get(self, request, *args, **kwargs):
+        serializer = ReportSearchSerializer(data=request.query_params.dict())
+        if not serializer.is_valid():
+            return Response(
+                {"error": "Invalid search", "errors": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        params = serializer.validated_data
+
+        reports = UserReport.objects.search(params["q"], params["lang"])
+        if "type" in params:
+            reports = reports.filter(
+                Q(type=params["type"])
+                | Q(type__isnull=True, user_submit_type=params["type"])
+            )
+        if "near" in params:
+            reports = reports.filter(
+                geovideo__location__dwithin=(params["near"], D(m=params["radius_m"]))
+            )
+        if "since" in params:
+            reports = reports.filter(created_at__gte=params["since"])
+        if "until" in params:
+            reports = reports.filter(created_at__lt=params["until"])
+
+        offset, limit = params["offset"], params["limit"]
+        results = [
+            {**report_summary(report), "rank": report.rank}
+            for report in reports.for_map()[offset : offset + limit]
+        ]
+        return Response({"results": results})
+
+
+class TriageQueueView(views.APIView):
+    """Peek at the most urgent unclaimed reports without claiming them."""
+
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_description="Most urgent unclaimed reports, by triage priority",
+        manual_parameters=[
+            openapi.Parameter(
+                "limit", openapi.IN_QUERY, type=openapi.TYPE_INTEGER, default=50
             ),
-            user_userAgent=client_info.get("userAgent", ""),
-            user_platform=client_info.get("platform", ""),
-            user_device_language=client_info.get("language", ""),
-            user=request.user if request.user.is_authenticated else None,
-        )
+        ],
+        responses={200: openapi.Response("Queued reports")},
+    )
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = min(max(int(request.query_params.get("limit", 50)), 1), 200)
+        except ValueError:
+            return Response(
+                {"error": "limit must be an integer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        reports = UserReport.objects.triage_queue().for_map()[:limit]
+        return Response({"results": [report_summary(report) for report in reports]})
 
-        return Response(
-            {"id": report.pk, "status": "created"}, status=status.HTTP_201_CREATED
-        )
+
+class TriageClaimView(views.APIView):
+    """
+    Hand the next ``count`` most urgent reports to the calling dispatcher.
+    Rows another dispatcher is claiming right now are skipped (FOR UPDATE
+    SKIP LOCKED), so concurrent claims never block or overlap.
+    """
+
+    permission_classes = [IsAdminUser]
+    max_claim = 50
+
+    @swagger_auto_schema(
+        operation_description="Claim the next N most urgent reports",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "count": openapi.Schema(type=openapi.TYPE_INTEGER, default=1),
+            },
+        ),
+        responses={200: openapi.Response("Claimed reports")},
+    )
+    def post(self, request, *args, **kwargs):
+        try:
+            count = int(request.data.get("count", 1))
+        except (TypeError, ValueError):
+            count = 0
+        if not 1 <= count <= self.max_claim:
+            return Response(
+                {"error": f"count must be between 1 and {self.max_claim}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        with transaction.atomic():
+            ids = list(
+                UserReport.objects.triage_queue()
+                # Only the reports: the incident join must not lock incidents
+                .select_for_update(skip_locked=True, of=("self",)).values_list(
+                    "pk", flat=True
+                )[:count]
+            )
+            UserReport.objects.filter(pk__in=ids).update(
+                claimed_by=request.user,
+                claimed_at=timezone.now(),
+                action_status=actionStatusSet.IN_PROGRESS,
+            )
+        reports = UserReport.objects.filter(pk__in=ids).by_urgency().for_map()
+        return Response({"results": [report_summary(report) for report in reports]})
+
+
+class TriageReleaseView(views.APIView):
+    """Put a claimed report back in the queue."""
+
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_description="Release a report claimed by the caller",
+        responses={
+            200: openapi.Response("Released"),
+            404: openapi.Response("Not claimed by the caller"),
+        },
+    )
+    def post(self, request, pk, *args, **kwargs):
+        released = UserReport.objects.filter(
+            pk=pk, claimed_by=request.user, action_status=actionStatusSet.IN_PROGRESS
+        ).release()
+        if not released:
+            return Response(
+                {"error": "Report is not claimed by you"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response({"id": pk, "status": "released"})
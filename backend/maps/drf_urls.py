@@ -1,7 +1,13 @@
 # common/urls.py
+from django.conf import settings
 from django.urls import path
-from .views import geovideos_geojson
+from .views import geovideos_geojson, geovideos_geojson_stream, incidents_geojson
 
 urlpatterns = [
-    path("geovideos/", geovideos_geojson, name="geovideos_geojson"),
+    path(
+        "geovideos/",
+        geovideos_geojson_stream if settings.ASGI else geovideos_geojson,
+        name="geovideos_geojson",
+    ),
+    path("incidents/", incidents_geojson, name="incidents_geojson"),
 ]
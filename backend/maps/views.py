@@ -2,16 +2,102 @@ from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from hazards.models import UserReport
+from hazards.models import UserReport, Incident
 import json
-from common.models import hazardSet, actionStatusSet, verificationStatusSet
+from asgiref.sync import sync_to_async
+from datetime import timedelta
+from django.conf import settings
+from django.db import router
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.views.decorators.http import require_GET
+from common.cache import TieredCache
+from common.routers import pinned_to_primary, read_replica
+from common.models import (
+    hazardSet,
+    hazardGroupSet,
+    actionStatusSet,
+    verificationStatusSet,
+)
 from django.shortcuts import render
 from django.views.decorators.clickjacking import xframe_options_exempt
 
+# Shared by every worker; dropped when a report, recording or incident
+# changes, at most once per MAP_INVALIDATE_SECONDS (see hazards.signals)
+map_cache = TieredCache("map", timeout=settings.MAP_CACHE_SECONDS)
+
+
+def cached_feed(key, compute):
+    """
+    ``map_cache.get_or_set``, except for clients pinned to the primary after
+    a write: they get a fresh result from the primary that holds their own
+    report, which a cached one (possibly read from a replica) may not.
+    """
+    if pinned_to_primary():
+        return compute()
+    return map_cache.get_or_set(key, compute)
+
+
+def map_feed_params(params):
+    """(days, include_duplicates) of a map feed request; ValueError on bad days."""
+    days = int(params.get("days", settings.MAP_FEED_DAYS))
+    return days, params.get("include_duplicates") in ("1", "true")
+
+
+def map_reports(days, include_duplicates):
+    reports = UserReport.objects.for_map()
+    # Bounded on the report's created_at so the scan walks the newest end of
+    # userreport_created_idx instead of the whole table
+    if days > 0:
+        reports = reports.filter(created_at__gte=timezone.now() - timedelta(days=days))
+    # Forwarded copies of one message would stack pins on the same spot
+    if not include_duplicates:
+        reports = reports.filter(duplicate_of__isnull=True)
+    return reports
+
+
+def map_read_alias():
+    with read_replica():
+        return router.db_for_read(UserReport)
+
+
+def report_feature(report):
+    return {
+        "type": "Feature",
+        "geometry": json.loads(report.geovideo.location.geojson),
+        "properties": {
+            "id": report.pk,
+            "type": report.type or report.user_submit_type,  # hazardSet int
+            "severity": report.severity or 60,
+            "confidence": report.confidence or 60,
+            "verification": report.verification,  # verificationStatusSet int
+            "action_status": report.action_status,  # actionStatusSet int
+            "desc": report.user_text,
+            "created_at": report.created_at.isoformat(),
+            "incident": report.incident_id,
+        },
+    }
+
 
 @swagger_auto_schema(
     method="get",
     operation_description="Get GeoVideos + UserReports as GeoJSON FeatureCollection",
+    manual_parameters=[
+        openapi.Parameter(
+            "include_duplicates",
+            openapi.IN_QUERY,
+            description="Also return near-duplicates of other reports",
+            type=openapi.TYPE_BOOLEAN,
+            default=False,
+        ),
+        openapi.Parameter(
+            "days",
+            openapi.IN_QUERY,
+            description="Only reports made in the last N days, 0 for all "
+            "(default MAP_FEED_DAYS)",
+            type=openapi.TYPE_INTEGER,
+        ),
+    ],
     responses={
         200: openapi.Schema(
             type=openapi.TYPE_OBJECT,
@@ -67,6 +153,11 @@ from django.views.decorators.clickjacking import xframe_options_exempt
                                         format="date-time",
                                         example="2025-09-23T12:34:56Z",
                                     ),
+                                    "incident": openapi.Schema(
+                                        type=openapi.TYPE_INTEGER,
+                                        description="Incident the report belongs to",
+                                        x_nullable=True,
+                                    ),
                                 },
                             ),
                         },
@@ -77,30 +168,154 @@ from django.views.decorators.clickjacking import xframe_options_exempt
     },
 )
 @api_view(["GET"])
+@read_replica()
 def geovideos_geojson(request):
-    features = []
-    for report in UserReport.objects.select_related("geovideo").iterator():
-        geojson = json.loads(report.geovideo.location.geojson)
-        features.append(
-            {
-                "type": "Feature",
-                "geometry": geojson,
-                "properties": {
-                    "id": report.pk,
-                    "type": report.type or report.user_submit_type,  # hazardSet int
-                    "severity": report.severity or 60,
-                    "confidence": report.confidence or 60,
-                    "verification": report.verification,  # verificationStatusSet int
-                    "action_status": report.action_status,  # actionStatusSet int
-                    "desc": report.user_text,
-                    "created_at": report.created_at.isoformat(),
-                },
-            }
-        )
+    try:
+        days, include_duplicates = map_feed_params(request.query_params)
+    except ValueError:
+        return Response({"error": "days must be an integer"}, status=400)
+    features = cached_feed(
+        f"reports:{days}:{include_duplicates:d}",
+        lambda: [
+            report_feature(report)
+            for report in map_reports(days, include_duplicates).iterator()
+        ],
+    )
+    return Response({"type": "FeatureCollection", "features": features})
+
+
+@require_GET
+async def geovideos_geojson_stream(request):
+    """
+    ASGI variant of ``geovideos_geojson``: the same FeatureCollection, written
+    out feature by feature from an async iterator instead of built in memory,
+    so a large feed holds neither a worker thread nor the whole payload.
+    """
+    try:
+        reports = map_reports(*map_feed_params(request.GET))
+    except ValueError:
+        return JsonResponse({"error": "days must be an integer"}, status=400)
+    # Decide the database now, while the stickiness pin of this request
+    # holds; the replica lag check queries, so it runs on the sync thread
+    reports = reports.using(await sync_to_async(map_read_alias)())
 
+    async def features():
+        yield '{"type": "FeatureCollection", "features": ['
+        separator = ""
+        async for report in reports.aiterator(chunk_size=2000):
+            yield separator + json.dumps(report_feature(report))
+            separator = ","
+        yield "]}"
+
+    return StreamingHttpResponse(features(), content_type="application/json")
+
+
+@swagger_auto_schema(
+    method="get",
+    operation_description="Get incidents (clusters of related reports) as a "
+    "GeoJSON FeatureCollection of centroids with their bounding box",
+    manual_parameters=[
+        openapi.Parameter(
+            "hours",
+            openapi.IN_QUERY,
+            description="Only incidents with a report recorded in the last N hours",
+            type=openapi.TYPE_INTEGER,
+            default=48,
+        ),
+    ],
+    responses={
+        200: openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "type": openapi.Schema(
+                    type=openapi.TYPE_STRING, example="FeatureCollection"
+                ),
+                "features": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(
+                        type=openapi.TYPE_OBJECT,
+                        properties={
+                            "type": openapi.Schema(
+                                type=openapi.TYPE_STRING, example="Feature"
+                            ),
+                            "geometry": openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                example={
+                                    "type": "Point",
+                                    "coordinates": [12.49, 41.89],
+                                },
+                            ),
+                            "bbox": openapi.Schema(
+                                type=openapi.TYPE_ARRAY,
+                                items=openapi.Schema(type=openapi.TYPE_NUMBER),
+                                example=[12.48, 41.88, 12.5, 41.9],
+                            ),
+                            "properties": openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    "id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                                    "hazard_group": openapi.Schema(
+                                        type=openapi.TYPE_INTEGER,
+                                        description="Hazard group enum",
+                                        enum=[c.value for c in hazardGroupSet],
+                                        example=hazardGroupSet.WATER_LEVEL,
+                                    ),
+                                    "report_count": openapi.Schema(
+                                        type=openapi.TYPE_INTEGER, example=120
+                                    ),
+                                    "max_severity": openapi.Schema(
+                                        type=openapi.TYPE_INTEGER,
+                                        example=80,
+                                        x_nullable=True,
+                                    ),
+                                    "first_seen": openapi.Schema(
+                                        type=openapi.TYPE_STRING, format="date-time"
+                                    ),
+                                    "last_seen": openapi.Schema(
+                                        type=openapi.TYPE_STRING, format="date-time"
+                                    ),
+                                },
+                            ),
+                        },
+                    ),
+                ),
+            },
+        )
+    },
+)
+@api_view(["GET"])
+@read_replica()
+def incidents_geojson(request):
+    try:
+        hours = int(request.query_params.get("hours", 48))
+    except ValueError:
+        return Response({"error": "hours must be an integer"}, status=400)
+    features = cached_feed(f"incidents:{hours}", lambda: incident_features(hours))
     return Response({"type": "FeatureCollection", "features": features})
 
 
+def incident_features(hours):
+    incidents = Incident.objects.filter(
+        last_seen__gte=timezone.now() - timedelta(hours=hours)
+    ).order_by("-last_seen")
+    return [
+        {
+            "type": "Feature",
+            "geometry": json.loads(incident.centroid.geojson),
+            "bbox": incident.extent,
+            "properties": {
+                "id": incident.pk,
+                "hazard_group": incident.hazard_group,  # hazardGroupSet int
+                "report_count": incident.report_count,
+                "max_severity": incident.max_severity,
+                "first_seen": incident.first_seen.isoformat(),
+                "last_seen": incident.last_seen.isoformat(),
+            },
+        }
+        for incident in incidents.iterator()
+    ]
+
+
 @xframe_options_exempt
 def render_map(request):
     return render(request, "map.html")
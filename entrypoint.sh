@@ -3,4 +3,35 @@
 cd backend
 poetry run python3 manage.py migrate --noinput
 poetry run python3 manage.py collectstatic
-poetry run gunicorn --bind 0.0.0.0:8000 backend.wsgi --workers 3
+# Every SWEEP_INTERVAL seconds (0 disables), pick up background work that
+# was dropped by a full queue or lost to a restart: classify pending reports
+# (recent ones may still be queued in a web process), resume alert
+# fan-outs and attach reports whose incident attachment failed. Expired
+# Idempotency-Key responses are deleted and rollup deltas merged along the
+# way. Every ARCHIVE_INTERVAL seconds (0, the default, disables) recordings
+# older than ARCHIVE_AFTER_DAYS are also moved to cold storage
+if [ "${SWEEP_INTERVAL:-300}" -gt 0 ]; then
+    archived_at=$(date +%s)
+    while sleep "${SWEEP_INTERVAL:-300}"; do
+        poetry run python3 manage.py process_pending_reports --older-than 15
+        poetry run python3 manage.py send_alerts
+        poetry run python3 manage.py cluster_incidents --older-than 5
+        poetry run python3 manage.py expire_idempotency_keys
+        poetry run python3 manage.py merge_rollups
+        if [ "${ARCHIVE_INTERVAL:-0}" -gt 0 ] &&
+            [ $(($(date +%s) - archived_at)) -ge "${ARCHIVE_INTERVAL:-0}" ]; then
+            poetry run python3 manage.py archive_recordings --vacuum
+            archived_at=$(date +%s)
+        fi
+    done &
+fi
+# SERVER_MODE=asgi serves backend.asgi with uvicorn workers (the asgi extra,
+# which the Dockerfile installs by default). Slow uploads are read before the
+# view runs and streamed map feeds no longer pin a process, but sync views of
+# a process still run one at a time on its single sync thread.
+if [ "${SERVER_MODE:-wsgi}" = "asgi" ]; then
+    poetry run gunicorn --bind 0.0.0.0:8000 backend.asgi:application \
+        --worker-class uvicorn.workers.UvicornWorker --workers "${WEB_WORKERS:-3}"
+else
+    poetry run gunicorn --bind 0.0.0.0:8000 backend.wsgi --workers "${WEB_WORKERS:-3}"
+fi